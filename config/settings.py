@@ -1,144 +1,343 @@
 import os
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
+from urllib.parse import quote_plus
 
-DB_HOST = os.getenv("DB_HOST", "localhost")
-DB_PORT = os.getenv("DB_PORT", "5432")
-DB_USER = os.getenv("DB_USER", "forex")
-DB_PASSWORD = os.getenv("DB_PASSWORD", "forex_dev_123")
-DB_NAME = os.getenv("DB_NAME", "forex_scalper")
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-
-DATA_FEED = os.getenv("DATA_FEED", "demo")
-
-SYMBOLS = ["EURUSD=X", "GBPUSD=X", "USDJPY=X"]
-TIMEFRAMES = ["1m", "5m", "15m", "1h", "4h", "1d"]
-DEFAULT_HISTORY_DAYS = 60
-
-# Indicator parameters
-RSI_PERIOD = 14
-MACD_FAST = 12
-MACD_SLOW = 26
-MACD_SIGNAL = 9
-BB_PERIOD = 20
-BB_STD = 2.0
-EMA_PERIODS = [9, 21, 50, 200]
-ATR_PERIOD = 14
-
-# --- Phase 2: Strategy & Backtest Settings ---
-
-# EMA Crossover strategy
-EMA_FAST_PERIOD = 9
-EMA_SLOW_PERIOD = 21
-EMA_RSI_OVERSOLD = 30
-EMA_RSI_OVERBOUGHT = 70
-EMA_ATR_SL_MULT = 1.5
-EMA_ATR_TP_MULT = 2.0
-
-# Bollinger Band Reversion strategy
-BB_RSI_OVERSOLD = 30
-BB_RSI_OVERBOUGHT = 70
-BB_ATR_SL_MULT = 1.5
-
-# Backtest settings
-INITIAL_CAPITAL = 10000
-SPREAD_PIPS = 1.5
-SLIPPAGE_PIPS = 0.5
-RISK_PER_TRADE = 0.02
-MAX_OPEN_POSITIONS = 3
-
-# Pip values per symbol
-PIP_VALUES = {
-    "EURUSD=X": 0.0001,
-    "GBPUSD=X": 0.0001,
-    "USDJPY=X": 0.01,
-}
-
-# --- Phase 3: Live/Paper Trading Settings ---
-CANDLE_HISTORY_SIZE = int(os.getenv("CANDLE_HISTORY_SIZE", "250"))
-TICK_LOG_INTERVAL = int(os.getenv("TICK_LOG_INTERVAL", "60"))
-
-# --- Phase 4: OANDA + API Settings ---
-
-# OANDA v20 API
-OANDA_ACCOUNT_ID = os.getenv("OANDA_ACCOUNT_ID", "")
-OANDA_API_TOKEN = os.getenv("OANDA_API_TOKEN", "")
-OANDA_ENVIRONMENT = os.getenv("OANDA_ENVIRONMENT", "practice")  # practice or live
-
-OANDA_BASE_URL = {
-    "practice": "https://api-fxpractice.oanda.com",
-    "live": "https://api-fxtrade.oanda.com",
-}
-
-OANDA_STREAM_URL = {
-    "practice": "https://stream-fxpractice.oanda.com",
-    "live": "https://stream-fxtrade.oanda.com",
-}
-
-# Map our symbols to OANDA instrument names
-OANDA_SYMBOL_MAP = {
-    "EURUSD=X": "EUR_USD",
-    "GBPUSD=X": "GBP_USD",
-    "USDJPY=X": "USD_JPY",
-}
-
-# OANDA granularity mapping
-OANDA_GRANULARITY_MAP = {
-    "1m": "M1",
-    "5m": "M5",
-    "15m": "M15",
-    "1h": "H1",
-    "4h": "H4",
-    "1d": "D",
-}
-
-# FastAPI / WebSocket
-API_HOST = os.getenv("API_HOST", "0.0.0.0")
-API_PORT = int(os.getenv("API_PORT", "8000"))
-WS_BROADCAST_INTERVAL = float(os.getenv("WS_BROADCAST_INTERVAL", "2.0"))
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:5173").split(",")
-
-# --- Phase 5A: Risk Management ---
-MAX_DAILY_LOSS_PCT = float(os.getenv("MAX_DAILY_LOSS_PCT", "5.0"))
-MAX_PORTFOLIO_RISK_PCT = float(os.getenv("MAX_PORTFOLIO_RISK_PCT", "10.0"))
-MAX_CORRELATED_EXPOSURE = int(os.getenv("MAX_CORRELATED_EXPOSURE", "2"))
-POSITION_SIZE_METHOD = os.getenv("POSITION_SIZE_METHOD", "fixed_risk")  # fixed_risk | kelly
-KELLY_FRACTION = float(os.getenv("KELLY_FRACTION", "0.5"))
-CORRELATION_GROUPS = {
-    "USD_LONG": ["EURUSD=X_SELL", "GBPUSD=X_SELL", "USDJPY=X_BUY"],
-    "USD_SHORT": ["EURUSD=X_BUY", "GBPUSD=X_BUY", "USDJPY=X_SELL"],
-}
-
-# --- Phase 5B: Notifications ---
-NOTIFY_BACKENDS = [b for b in os.getenv("NOTIFY_BACKENDS", "").split(",") if b]
-TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
-TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
-DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL", "")
-SMTP_HOST = os.getenv("SMTP_HOST", "")
-SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
-SMTP_USER = os.getenv("SMTP_USER", "")
-SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
-SMTP_FROM = os.getenv("SMTP_FROM", "")
-SMTP_TO = os.getenv("SMTP_TO", "")
-NOTIFY_EVENTS = os.getenv("NOTIFY_EVENTS", "order_filled,position_closed,circuit_breaker,engine_started,engine_stopped,stream_disconnected,stream_dead").split(",")
-
-# --- Live Trading Readiness ---
-API_KEY = os.getenv("API_KEY", "")
-FEED_MAX_RECONNECT_ATTEMPTS = int(os.getenv("FEED_MAX_RECONNECT_ATTEMPTS", "20"))
-FEED_BASE_BACKOFF = float(os.getenv("FEED_BASE_BACKOFF", "2.0"))
-FEED_MAX_BACKOFF = float(os.getenv("FEED_MAX_BACKOFF", "60.0"))
-
-# --- Phase 5E: Optimization ---
-OPTIMIZATION_MAX_WORKERS = int(os.getenv("OPTIMIZATION_MAX_WORKERS", "4"))
-WALK_FORWARD_SPLITS = int(os.getenv("WALK_FORWARD_SPLITS", "5"))
-WALK_FORWARD_TRAIN_PCT = float(os.getenv("WALK_FORWARD_TRAIN_PCT", "0.7"))
-MONTE_CARLO_SIMULATIONS = int(os.getenv("MONTE_CARLO_SIMULATIONS", "1000"))
-
-# --- LLM Trade Confidence Assessment ---
-LLM_ENABLED = os.getenv("LLM_ENABLED", "false").lower() in ("true", "1", "yes")
-LLM_CONFIDENCE_THRESHOLD = float(os.getenv("LLM_CONFIDENCE_THRESHOLD", "70.0"))
-LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "10.0"))
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-XAI_API_KEY = os.getenv("XAI_API_KEY", "")
-LLM_ANTHROPIC_MODEL = os.getenv("LLM_ANTHROPIC_MODEL", "claude-sonnet-4-20250514")
-LLM_OPENAI_MODEL = os.getenv("LLM_OPENAI_MODEL", "gpt-4o")
-LLM_GROK_MODEL = os.getenv("LLM_GROK_MODEL", "grok-3")
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable snapshot of all configuration, parsed once from the environment."""
+
+    DB_HOST: str
+    DB_PORT: str
+    DB_USER: str
+    DB_PASSWORD: str
+    DB_NAME: str
+    DATABASE_URL: str
+    DB_POOL_SIZE: int
+    DB_MAX_OVERFLOW: int
+    DB_POOL_RECYCLE: int  # seconds
+    DB_POOL_PRE_PING: bool
+    DB_STATEMENT_CACHE_SIZE: int  # 0 = no server-side prepared statements (PgBouncer transaction mode)
+
+    DATA_FEED: str
+
+    SYMBOLS: tuple[str, ...]  # interned
+    TIMEFRAMES: tuple[str, ...]  # interned
+    DEFAULT_HISTORY_DAYS: int
+
+    # Indicator parameters
+    RSI_PERIOD: int
+    MACD_FAST: int
+    MACD_SLOW: int
+    MACD_SIGNAL: int
+    BB_PERIOD: int
+    BB_STD: float
+    EMA_PERIODS: list[int]
+    ATR_PERIOD: int
+    INDICATOR_CACHE_DIR: str  # "" disables the on-disk indicator cache
+
+    # --- Phase 2: Strategy & Backtest Settings ---
+
+    # EMA Crossover strategy
+    EMA_FAST_PERIOD: int
+    EMA_SLOW_PERIOD: int
+    EMA_RSI_OVERSOLD: int
+    EMA_RSI_OVERBOUGHT: int
+    EMA_ATR_SL_MULT: float
+    EMA_ATR_TP_MULT: float
+
+    # Bollinger Band Reversion strategy
+    BB_RSI_OVERSOLD: int
+    BB_RSI_OVERBOUGHT: int
+    BB_ATR_SL_MULT: float
+
+    # Backtest settings
+    INITIAL_CAPITAL: int
+    SPREAD_PIPS: float
+    SLIPPAGE_PIPS: float
+    RISK_PER_TRADE: float
+    MAX_OPEN_POSITIONS: int
+
+    # Pip values per symbol
+    PIP_VALUES: Mapping[str, float]  # read-only
+    # SPREAD_PIPS / SLIPPAGE_PIPS pre-scaled to price units per symbol
+    SPREAD_BY_SYMBOL: Mapping[str, float]
+    SLIPPAGE_BY_SYMBOL: Mapping[str, float]
+
+    # --- Phase 3: Live/Paper Trading Settings ---
+    CANDLE_HISTORY_SIZE: int
+    TICK_LOG_INTERVAL: int
+
+    # --- Phase 4: OANDA + API Settings ---
+
+    # OANDA v20 API
+    OANDA_ACCOUNT_ID: str
+    OANDA_API_TOKEN: str
+    OANDA_ENVIRONMENT: str  # practice or live
+    OANDA_BASE_URL: Mapping[str, str]
+    OANDA_STREAM_URL: Mapping[str, str]
+    OANDA_SYMBOL_MAP: Mapping[str, str]
+    OANDA_GRANULARITY_MAP: Mapping[str, str]
+    # URLs for OANDA_ENVIRONMENT, resolved once ("" if the environment is unknown)
+    OANDA_BASE: str
+    OANDA_STREAM: str
+
+    # FastAPI / WebSocket
+    API_HOST: str
+    API_PORT: int
+    API_WORKERS: int
+    # Seconds an idle keep-alive connection stays open; pollers reuse it between requests
+    API_KEEPALIVE_TIMEOUT: int
+    # Max concurrent connections per worker before 503s (0 = unlimited)
+    API_LIMIT_CONCURRENCY: int
+    WS_BROADCAST_INTERVAL: float
+    CORS_ORIGINS: tuple[str, ...]
+
+    # --- Phase 5A: Risk Management ---
+    MAX_DAILY_LOSS_PCT: float
+    MAX_PORTFOLIO_RISK_PCT: float
+    MAX_CORRELATED_EXPOSURE: int
+    POSITION_SIZE_METHOD: str  # fixed_risk | kelly
+    KELLY_FRACTION: float
+    CORRELATION_GROUPS: Mapping[str, frozenset[str]]
+    SYMBOL_SIDE_TO_GROUP: Mapping[str, str]  # "EURUSD=X_SELL" -> "USD_LONG"
+
+    # --- Phase 5B: Notifications ---
+    NOTIFY_BACKENDS: frozenset[str]
+    TELEGRAM_BOT_TOKEN: str
+    TELEGRAM_CHAT_ID: str
+    DISCORD_WEBHOOK_URL: str
+    SMTP_HOST: str
+    SMTP_PORT: int
+    SMTP_USER: str
+    SMTP_PASSWORD: str
+    SMTP_FROM: str
+    SMTP_TO: str
+    NOTIFY_EVENTS: frozenset[str]
+
+    # --- Live Trading Readiness ---
+    API_KEY: str
+    FEED_MAX_RECONNECT_ATTEMPTS: int
+    FEED_BASE_BACKOFF: float
+    FEED_MAX_BACKOFF: float
+
+    # --- Phase 5E: Optimization ---
+    OPTIMIZATION_MAX_WORKERS: int
+    WALK_FORWARD_SPLITS: int
+    WALK_FORWARD_TRAIN_PCT: float
+    MONTE_CARLO_SIMULATIONS: int
+
+    # --- LLM Trade Confidence Assessment ---
+    LLM_ENABLED: bool
+    LLM_CONFIDENCE_THRESHOLD: float
+    LLM_TIMEOUT: float
+    ANTHROPIC_API_KEY: str
+    OPENAI_API_KEY: str
+    XAI_API_KEY: str
+    LLM_ANTHROPIC_MODEL: str
+    LLM_OPENAI_MODEL: str
+    LLM_GROK_MODEL: str
+
+    @property
+    def DATABASE_URL_OBJ(self):
+        """Pre-parsed SQLAlchemy URL (imported lazily to keep settings import cheap)."""
+        from sqlalchemy.engine import URL
+
+        return URL.create(
+            "postgresql",
+            username=self.DB_USER,
+            password=self.DB_PASSWORD,
+            host=self.DB_HOST,
+            port=int(self.DB_PORT),
+            database=self.DB_NAME,
+        )
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in ("true", "1", "yes")
+
+
+def _frozen_map(mapping: dict) -> MappingProxyType:
+    """Read-only view with interned string keys (and string values)."""
+    return MappingProxyType({
+        sys.intern(k): sys.intern(v) if isinstance(v, str) else v
+        for k, v in mapping.items()
+    })
+
+
+def _split_csv(value: str) -> tuple[str, ...]:
+    return tuple(item for item in value.split(",") if item)
+
+
+def _csv_set(value: str) -> frozenset[str]:
+    return frozenset(_split_csv(value))
+
+
+# (name, parser, default) for every setting read from the environment.
+_SPEC: tuple[tuple[str, Callable[[str], Any], str], ...] = (
+    ("DB_HOST", str, "localhost"),
+    ("DB_PORT", str, "5432"),
+    ("DB_USER", str, "forex"),
+    ("DB_PASSWORD", str, "forex_dev_123"),
+    ("DB_NAME", str, "forex_scalper"),
+    ("DB_POOL_SIZE", int, "5"),
+    ("DB_MAX_OVERFLOW", int, "10"),
+    ("DB_POOL_RECYCLE", int, "1800"),
+    ("DB_POOL_PRE_PING", _parse_bool, "true"),
+    ("DB_STATEMENT_CACHE_SIZE", int, "0"),
+    ("DATA_FEED", str, "demo"),
+    ("INDICATOR_CACHE_DIR", os.path.expanduser, "~/.cache/forex-scalper/indicators"),
+    ("CANDLE_HISTORY_SIZE", int, "250"),
+    ("TICK_LOG_INTERVAL", int, "60"),
+    ("OANDA_ACCOUNT_ID", str, ""),
+    ("OANDA_API_TOKEN", str, ""),
+    ("OANDA_ENVIRONMENT", str.lower, "practice"),
+    ("API_HOST", str, "0.0.0.0"),
+    ("API_PORT", int, "8000"),
+    ("API_WORKERS", int, "1"),
+    ("API_KEEPALIVE_TIMEOUT", int, "30"),
+    ("API_LIMIT_CONCURRENCY", int, "0"),
+    ("WS_BROADCAST_INTERVAL", float, "2.0"),
+    ("CORS_ORIGINS", _split_csv, "http://localhost:3000,http://localhost:5173"),
+    ("MAX_DAILY_LOSS_PCT", float, "5.0"),
+    ("MAX_PORTFOLIO_RISK_PCT", float, "10.0"),
+    ("MAX_CORRELATED_EXPOSURE", int, "2"),
+    ("POSITION_SIZE_METHOD", str, "fixed_risk"),
+    ("KELLY_FRACTION", float, "0.5"),
+    ("NOTIFY_BACKENDS", _csv_set, ""),
+    ("TELEGRAM_BOT_TOKEN", str, ""),
+    ("TELEGRAM_CHAT_ID", str, ""),
+    ("DISCORD_WEBHOOK_URL", str, ""),
+    ("SMTP_HOST", str, ""),
+    ("SMTP_PORT", int, "587"),
+    ("SMTP_USER", str, ""),
+    ("SMTP_PASSWORD", str, ""),
+    ("SMTP_FROM", str, ""),
+    ("SMTP_TO", str, ""),
+    (
+        "NOTIFY_EVENTS",
+        _csv_set,
+        "order_filled,position_closed,circuit_breaker,engine_started,"
+        "engine_stopped,stream_disconnected,stream_dead",
+    ),
+    ("API_KEY", str, ""),
+    ("FEED_MAX_RECONNECT_ATTEMPTS", int, "20"),
+    ("FEED_BASE_BACKOFF", float, "2.0"),
+    ("FEED_MAX_BACKOFF", float, "60.0"),
+    ("OPTIMIZATION_MAX_WORKERS", int, "4"),
+    ("WALK_FORWARD_SPLITS", int, "5"),
+    ("WALK_FORWARD_TRAIN_PCT", float, "0.7"),
+    ("MONTE_CARLO_SIMULATIONS", int, "1000"),
+    ("LLM_ENABLED", _parse_bool, "false"),
+    ("LLM_CONFIDENCE_THRESHOLD", float, "70.0"),
+    ("LLM_TIMEOUT", float, "10.0"),
+    ("ANTHROPIC_API_KEY", str, ""),
+    ("OPENAI_API_KEY", str, ""),
+    ("XAI_API_KEY", str, ""),
+    ("LLM_ANTHROPIC_MODEL", str, "claude-sonnet-4-20250514"),
+    ("LLM_OPENAI_MODEL", str, "gpt-4o"),
+    ("LLM_GROK_MODEL", str, "grok-3"),
+)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Read and coerce every environment variable exactly once per process."""
+    environ = os.environ
+    env = {name: parse(environ.get(name, default)) for name, parse, default in _SPEC}
+
+    pip_values = _frozen_map({
+        "EURUSD=X": 0.0001,
+        "GBPUSD=X": 0.0001,
+        "USDJPY=X": 0.01,
+    })
+    spread_pips = 1.5
+    slippage_pips = 0.5
+    oanda_base_url = _frozen_map({
+        "practice": "https://api-fxpractice.oanda.com",
+        "live": "https://api-fxtrade.oanda.com",
+    })
+    oanda_stream_url = _frozen_map({
+        "practice": "https://stream-fxpractice.oanda.com",
+        "live": "https://stream-fxtrade.oanda.com",
+    })
+    correlation_groups = {
+        "USD_LONG": frozenset(map(sys.intern, ("EURUSD=X_SELL", "GBPUSD=X_SELL", "USDJPY=X_BUY"))),
+        "USD_SHORT": frozenset(map(sys.intern, ("EURUSD=X_BUY", "GBPUSD=X_BUY", "USDJPY=X_SELL"))),
+    }
+
+    return Settings(
+        **env,
+        DATABASE_URL=(
+            f"postgresql://{quote_plus(env['DB_USER'])}:{quote_plus(env['DB_PASSWORD'])}"
+            f"@{env['DB_HOST']}:{env['DB_PORT']}/{env['DB_NAME']}"
+        ),
+        SYMBOLS=tuple(map(sys.intern, ("EURUSD=X", "GBPUSD=X", "USDJPY=X"))),
+        TIMEFRAMES=tuple(map(sys.intern, ("1m", "5m", "15m", "1h", "4h", "1d"))),
+        DEFAULT_HISTORY_DAYS=60,
+        RSI_PERIOD=14,
+        MACD_FAST=12,
+        MACD_SLOW=26,
+        MACD_SIGNAL=9,
+        BB_PERIOD=20,
+        BB_STD=2.0,
+        EMA_PERIODS=[9, 21, 50, 200],
+        ATR_PERIOD=14,
+        EMA_FAST_PERIOD=9,
+        EMA_SLOW_PERIOD=21,
+        EMA_RSI_OVERSOLD=30,
+        EMA_RSI_OVERBOUGHT=70,
+        EMA_ATR_SL_MULT=1.5,
+        EMA_ATR_TP_MULT=2.0,
+        BB_RSI_OVERSOLD=30,
+        BB_RSI_OVERBOUGHT=70,
+        BB_ATR_SL_MULT=1.5,
+        INITIAL_CAPITAL=10000,
+        SPREAD_PIPS=spread_pips,
+        SLIPPAGE_PIPS=slippage_pips,
+        RISK_PER_TRADE=0.02,
+        MAX_OPEN_POSITIONS=3,
+        PIP_VALUES=pip_values,
+        SPREAD_BY_SYMBOL=_frozen_map({sym: spread_pips * pv for sym, pv in pip_values.items()}),
+        SLIPPAGE_BY_SYMBOL=_frozen_map({sym: slippage_pips * pv for sym, pv in pip_values.items()}),
+        OANDA_BASE_URL=oanda_base_url,
+        OANDA_STREAM_URL=oanda_stream_url,
+        # Map our symbols to OANDA instrument names
+        OANDA_SYMBOL_MAP=_frozen_map({
+            "EURUSD=X": "EUR_USD",
+            "GBPUSD=X": "GBP_USD",
+            "USDJPY=X": "USD_JPY",
+        }),
+        # OANDA granularity mapping
+        OANDA_GRANULARITY_MAP=_frozen_map({
+            "1m": "M1",
+            "5m": "M5",
+            "15m": "M15",
+            "1h": "H1",
+            "4h": "H4",
+            "1d": "D",
+        }),
+        OANDA_BASE=oanda_base_url.get(env["OANDA_ENVIRONMENT"], ""),
+        OANDA_STREAM=oanda_stream_url.get(env["OANDA_ENVIRONMENT"], ""),
+        CORRELATION_GROUPS=MappingProxyType(correlation_groups),
+        SYMBOL_SIDE_TO_GROUP=MappingProxyType({
+            key: group for group, keys in correlation_groups.items() for key in keys
+        }),
+    )
+
+
+def __getattr__(name: str):
+    # PEP 562: keeps `from config.settings import X` and `settings.X` working
+    try:
+        return getattr(get_settings(), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *Settings.__dataclass_fields__, "DATABASE_URL_OBJ"])
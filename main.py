@@ -1,10 +1,6 @@
 #!/usr/bin/env python3
 """Entry point — fetches historical data, computes indicators, stores results."""
 
-import sys
-
-sys.path.insert(0, ".")
-
 from datetime import datetime, timedelta, timezone
 
 from config.settings import (
@@ -42,24 +38,19 @@ def main() -> None:
     feed = create_feed()
     repo = CandleRepository()
 
-    end = datetime.now(timezone.utc).replace(tzinfo=None)
+    end = datetime.now(timezone.utc)
     start = end - timedelta(days=DEFAULT_HISTORY_DAYS)
 
-    for symbol in SYMBOLS:
-        log.info("processing_symbol", symbol=symbol)
+    frames = feed.get_historical_batch(SYMBOLS, "1h", start, end)
 
-        df = feed.get_historical(
-            symbol=symbol,
-            timeframe="1h",
-            start=start.strftime("%Y-%m-%d"),
-            end=end.strftime("%Y-%m-%d"),
-        )
+    for symbol, df in frames.items():
+        log.info("processing_symbol", symbol=symbol)
 
         if df.empty:
             log.warning("no_data", symbol=symbol)
             continue
 
-        repo.upsert_candles(df, symbol, "1h")
+        repo.bulk_upsert_candles(df, symbol, "1h")
 
         df_indicators = add_all_indicators(
             df,
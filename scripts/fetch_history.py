@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
 """Backfill historical candle data into TimescaleDB."""
 
-import sys
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
-sys.path.insert(0, "/app" if sys.argv[0].startswith("/app") else ".")
-
-from config.settings import DEFAULT_HISTORY_DAYS, SYMBOLS, TIMEFRAMES
+from config.settings import DEFAULT_HISTORY_DAYS, OPTIMIZATION_MAX_WORKERS, SYMBOLS, TIMEFRAMES
 from src.data.demo_feed import DemoFeed
 from src.database.repository import CandleRepository
 from src.utils.logger import get_logger, setup_logging
@@ -15,36 +14,56 @@ setup_logging()
 log = get_logger(__name__)
 
 
+def _backfill_one(
+    feed: DemoFeed,
+    repo: CandleRepository,
+    symbol: str,
+    tf: str,
+    start: datetime,
+    end: datetime,
+) -> None:
+    """Fetch and upsert one symbol/timeframe pair. Each call checks out its own pooled connection."""
+    log.info(
+        "backfilling",
+        symbol=symbol,
+        timeframe=tf,
+        start=start.isoformat(),
+        end=end.isoformat(),
+    )
+    try:
+        df = feed.get_historical(
+            symbol=symbol,
+            timeframe=tf,
+            start=start,
+            end=end,
+        )
+        if not df.empty:
+            repo.bulk_upsert_candles(df, symbol, tf)
+        else:
+            log.warning("empty_result", symbol=symbol, timeframe=tf)
+    except Exception:
+        log.exception("backfill_error", symbol=symbol, timeframe=tf)
+
+
 def main() -> None:
     feed = DemoFeed()
     repo = CandleRepository()
 
-    end = datetime.now(timezone.utc).replace(tzinfo=None)
-
-    for symbol in SYMBOLS:
-        for tf in TIMEFRAMES:
-            start = end - timedelta(days=DEFAULT_HISTORY_DAYS)
-
-            log.info(
-                "backfilling",
-                symbol=symbol,
-                timeframe=tf,
-                start=start.isoformat(),
-                end=end.isoformat(),
-            )
-            try:
-                df = feed.get_historical(
-                    symbol=symbol,
-                    timeframe=tf,
-                    start=start.strftime("%Y-%m-%d"),
-                    end=end.strftime("%Y-%m-%d"),
-                )
-                if not df.empty:
-                    repo.upsert_candles(df, symbol, tf)
-                else:
-                    log.warning("empty_result", symbol=symbol, timeframe=tf)
-            except Exception:
-                log.exception("backfill_error", symbol=symbol, timeframe=tf)
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(days=DEFAULT_HISTORY_DAYS)
+
+    # Symbol/timeframe pairs are independent and I/O-bound, so overlap them.
+    # DemoFeed serializes the yfinance downloads themselves (yf.download keeps
+    # per-ticker module state, shared across timeframes); synthetic generation
+    # and the DB upserts still run concurrently
+    jobs = list(itertools.product(SYMBOLS, TIMEFRAMES))
+    with ThreadPoolExecutor(max_workers=OPTIMIZATION_MAX_WORKERS) as pool:
+        futures = [
+            pool.submit(_backfill_one, feed, repo, symbol, tf, start, end)
+            for symbol, tf in jobs
+        ]
+        for future in futures:
+            future.result()
 
     log.info("backfill_complete")
 
@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 """Run the FastAPI server."""
 
-import sys
-
-sys.path.insert(0, "/app" if sys.argv[0].startswith("/app") else ".")
-
 import uvicorn
 
-from config.settings import API_HOST, API_PORT
+from config.settings import (
+    API_HOST,
+    API_KEEPALIVE_TIMEOUT,
+    API_LIMIT_CONCURRENCY,
+    API_PORT,
+    API_WORKERS,
+)
 from src.utils.logger import setup_logging
 
 
@@ -18,6 +20,16 @@ def main() -> None:
         host=API_HOST,
         port=API_PORT,
         reload=False,
+        workers=API_WORKERS,
+        loop="uvloop",
+        http="httptools",
+        # Dashboard pollers hit the same endpoints every few seconds; keep their
+        # connections open across polls instead of uvicorn's 5s default
+        timeout_keep_alive=API_KEEPALIVE_TIMEOUT,
+        limit_concurrency=API_LIMIT_CONCURRENCY or None,
+        # Logging is configured by setup_logging(); skip uvicorn's dictConfig and per-request access lines
+        log_config=None,
+        access_log=False,
     )
 
 
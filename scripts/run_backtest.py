@@ -2,29 +2,27 @@
 """CLI runner: load data -> strategy -> backtest -> report."""
 
 import argparse
+import functools
+import importlib
 import sys
-
-sys.path.insert(0, "/app" if sys.argv[0].startswith("/app") else ".")
-
 from datetime import datetime, timedelta, timezone
 
 from config.settings import DEFAULT_HISTORY_DAYS, INITIAL_CAPITAL
-from src.backtest.engine import BacktestConfig, BacktestEngine
-from src.backtest.metrics import calculate_metrics, format_metrics
-from src.data.demo_feed import DemoFeed
-from src.data.indicators import add_all_indicators
-from src.database.repository import CandleRepository, TradeRepository
-from src.strategy.bb_reversion import BBReversionStrategy
-from src.strategy.ema_crossover import EMACrossoverStrategy
-from src.utils.logger import get_logger, setup_logging
 
+# Strategy name -> (module, class). Resolved lazily so `--help` never imports pandas.
 STRATEGIES = {
-    "ema_crossover": EMACrossoverStrategy,
-    "bb_reversion": BBReversionStrategy,
+    "ema_crossover": ("src.strategy.ema_crossover", "EMACrossoverStrategy"),
+    "bb_reversion": ("src.strategy.bb_reversion", "BBReversionStrategy"),
 }
 
 
-def parse_args() -> argparse.Namespace:
+def _get_strategy(name: str) -> type:
+    module_name, class_name = STRATEGIES[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run a backtest on forex data")
     parser.add_argument(
         "--strategy",
@@ -38,13 +36,23 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--capital", type=float, default=INITIAL_CAPITAL, help="Initial capital")
     parser.add_argument("--from-db", action="store_true", help="Load candles from database")
     parser.add_argument("--save-trades", action="store_true", help="Save trades to database")
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
 
 
 def main() -> None:
+    args = parse_args()
+
+    from src.backtest.engine import BacktestConfig, BacktestEngine
+    from src.backtest.metrics import calculate_metrics, format_metrics
+    from src.data.indicator_cache import cached_add_all_indicators
+    from src.utils.logger import get_logger, setup_logging
+
     setup_logging()
     log = get_logger("backtest_runner")
-    args = parse_args()
 
     log.info(
         "backtest_start",
@@ -55,23 +63,25 @@ def main() -> None:
     )
 
     # Load data
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(days=args.days)
     if args.from_db:
+        from src.database.repository import CandleRepository
+
         repo = CandleRepository()
-        end = datetime.now(timezone.utc).replace(tzinfo=None)
-        start = end - timedelta(days=args.days)
         df = repo.get_candles(args.symbol, args.timeframe, start=start, end=end, limit=100000)
         if df.empty:
             log.error("no_data_in_db", symbol=args.symbol, timeframe=args.timeframe)
             sys.exit(1)
     else:
+        from src.data.demo_feed import DemoFeed
+
         feed = DemoFeed()
-        end = datetime.now(timezone.utc).replace(tzinfo=None)
-        start = end - timedelta(days=args.days)
         df = feed.get_historical(
             symbol=args.symbol,
             timeframe=args.timeframe,
-            start=start.strftime("%Y-%m-%d"),
-            end=end.strftime("%Y-%m-%d"),
+            start=start,
+            end=end,
         )
         if df.empty:
             log.error("no_data_generated", symbol=args.symbol)
@@ -80,12 +90,12 @@ def main() -> None:
     log.info("data_loaded", rows=len(df))
 
     # Add indicators
-    df = add_all_indicators(df)
+    df = cached_add_all_indicators(df)
     df = df.dropna().reset_index(drop=True)
     log.info("indicators_added", rows=len(df))
 
     # Generate signals
-    strategy = STRATEGIES[args.strategy]()
+    strategy = _get_strategy(args.strategy)()
     df = strategy.generate_signals(df)
 
     signal_count = (df["signal"] != 0).sum()
@@ -108,6 +118,8 @@ def main() -> None:
 
     # Optionally save trades to DB
     if args.save_trades and not result.trades.empty:
+        from src.database.repository import TradeRepository
+
         trade_repo = TradeRepository()
         count = trade_repo.insert_trades(result.trades)
         log.info("trades_saved", count=count)
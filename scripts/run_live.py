@@ -2,24 +2,43 @@
 """CLI runner for live/paper trading."""
 
 import argparse
+import functools
+import importlib
 import signal
 import sys
 
-sys.path.insert(0, "/app" if sys.argv[0].startswith("/app") else ".")
-
 from config.settings import INITIAL_CAPITAL
-from src.engine.trading import TradingEngine
-from src.strategy.bb_reversion import BBReversionStrategy
-from src.strategy.ema_crossover import EMACrossoverStrategy
-from src.utils.logger import get_logger, setup_logging
 
+# Strategy name -> (module, class). Resolved lazily so `--help` never imports pandas.
 STRATEGIES = {
-    "ema_crossover": EMACrossoverStrategy,
-    "bb_reversion": BBReversionStrategy,
+    "ema_crossover": ("src.strategy.ema_crossover", "EMACrossoverStrategy"),
+    "bb_reversion": ("src.strategy.bb_reversion", "BBReversionStrategy"),
 }
 
-
-def parse_args() -> argparse.Namespace:
+_SUMMARY_TEMPLATE = (
+    "\n{rule}\n"
+    "SESSION SUMMARY\n"
+    "{rule}\n"
+    "  Broker:          {broker}\n"
+    "  Strategy:        {strategy}\n"
+    "  Symbol:          {symbol}\n"
+    "  Timeframe:       {timeframe}\n"
+    "  Initial Capital: ${initial:,.2f}\n"
+    "  Final Capital:   ${final:,.2f}\n"
+    "  Total PnL:       ${pnl:,.2f}\n"
+    "  Trades Closed:   {closed}\n"
+    "{saved}"
+    "{rule}\n"
+)
+
+
+def _get_strategy(name: str) -> type:
+    module_name, class_name = STRATEGIES[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run live/paper trading")
     parser.add_argument(
         "--strategy",
@@ -37,7 +56,11 @@ def parse_args() -> argparse.Namespace:
         default="paper",
         help="Broker to use (paper or oanda)",
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
 
 
 def _create_broker_and_feed(args):
@@ -52,9 +75,13 @@ def _create_broker_and_feed(args):
 
 
 def main() -> None:
+    args = parse_args()
+
+    from src.engine.trading import TradingEngine
+    from src.utils.logger import get_logger, setup_logging
+
     setup_logging()
     log = get_logger("live_runner")
-    args = parse_args()
 
     log.info(
         "trading_start",
@@ -65,7 +92,7 @@ def main() -> None:
         capital=args.capital,
     )
 
-    strategy = STRATEGIES[args.strategy]()
+    strategy = _get_strategy(args.strategy)()
     broker, feed = _create_broker_and_feed(args)
 
     # Build LLM assessor if enabled
@@ -122,20 +149,18 @@ def main() -> None:
         log.exception("session_summary_failed")
         return
 
-    print("\n" + "=" * 60)
-    print("SESSION SUMMARY")
-    print("=" * 60)
-    print(f"  Broker:          {args.broker}")
-    print(f"  Strategy:        {strategy.name}")
-    print(f"  Symbol:          {args.symbol}")
-    print(f"  Timeframe:       {args.timeframe}")
-    print(f"  Initial Capital: ${args.capital:,.2f}")
-    print(f"  Final Capital:   ${account['balance']:,.2f}")
-    print(f"  Total PnL:       ${account['total_pnl']:,.2f}")
-    print(f"  Trades Closed:   {len(closed)}")
-    if args.save_trades:
-        print(f"  Trades Saved:    Yes")
-    print("=" * 60)
+    sys.stdout.write(_SUMMARY_TEMPLATE.format(
+        broker=args.broker,
+        strategy=strategy.name,
+        symbol=args.symbol,
+        timeframe=args.timeframe,
+        initial=args.capital,
+        final=account["balance"],
+        pnl=account["total_pnl"],
+        closed=len(closed),
+        saved="  Trades Saved:    Yes\n" if args.save_trades else "",
+        rule="=" * 60,
+    ))
 
 
 if __name__ == "__main__":
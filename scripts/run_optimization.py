@@ -2,16 +2,20 @@
 """CLI runner for strategy optimization."""
 
 import argparse
+import functools
+import importlib
+import itertools
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-sys.path.insert(0, ".")
+import numpy as np
 
 from config.settings import OPTIMIZATION_MAX_WORKERS, WALK_FORWARD_SPLITS, WALK_FORWARD_TRAIN_PCT, MONTE_CARLO_SIMULATIONS
 from src.backtest.engine import BacktestConfig
 from src.data.demo_feed import DemoFeed
-from src.data.indicators import add_all_indicators
+from src.data.indicators import IndicatorState
 from src.strategy.ema_crossover import EMACrossoverStrategy
 from src.strategy.bb_reversion import BBReversionStrategy
 
@@ -37,6 +41,27 @@ DEFAULT_PARAM_GRIDS = {
 }
 
 
+# Modules each --method imports lazily; warmed up while the candles load
+METHOD_MODULES = {
+    "grid": ("src.optimization.grid_search",),
+    "walk_forward": ("src.optimization.walk_forward",),
+    "monte_carlo": ("src.optimization.monte_carlo", "src.backtest.engine"),
+}
+
+
+def _import_all(names: tuple[str, ...]) -> None:
+    for name in names:
+        importlib.import_module(name)
+
+
+@functools.cache
+def _expanded_grid(strategy: str) -> tuple[tuple[tuple[str, object], ...], ...]:
+    """Cartesian product of DEFAULT_PARAM_GRIDS[strategy], as hashable (key, value) tuples."""
+    grid = DEFAULT_PARAM_GRIDS.get(strategy, {})
+    keys = tuple(grid)
+    return tuple(tuple(zip(keys, values)) for values in itertools.product(*grid.values()))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Strategy optimization runner")
     parser.add_argument("--strategy", default="ema_crossover", choices=list(STRATEGIES.keys()))
@@ -53,7 +78,12 @@ def main():
     feed = DemoFeed()
     end = args.end_date or datetime.utcnow().strftime("%Y-%m-%d")
     start = args.start_date or (datetime.utcnow() - timedelta(days=365)).strftime("%Y-%m-%d")
-    df = feed.get_historical(args.symbol, args.timeframe, start, end)
+    # Loading candles and importing the optimizer (pandas/numpy-heavy modules)
+    # are independent, so overlap them; later imports are then cache hits
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        warmup = ex.submit(_import_all, METHOD_MODULES[args.method])
+        df = feed.get_historical(args.symbol, args.timeframe, start, end)
+        warmup.result()
 
     if df.empty:
         print("No data available!")
@@ -67,8 +97,10 @@ def main():
         from src.optimization.grid_search import GridSearch
 
         param_grid = DEFAULT_PARAM_GRIDS.get(args.strategy, {})
+        combos = [dict(c) for c in _expanded_grid(args.strategy)]
         gs = GridSearch(strategy_class, param_grid, symbol=args.symbol,
-                        timeframe=args.timeframe, max_workers=OPTIMIZATION_MAX_WORKERS)
+                        timeframe=args.timeframe, max_workers=OPTIMIZATION_MAX_WORKERS,
+                        combos=combos)
         results = gs.run(df)
 
         print(f"\n{'='*70}")
@@ -94,7 +126,8 @@ def main():
                          n_splits=WALK_FORWARD_SPLITS,
                          train_pct=WALK_FORWARD_TRAIN_PCT,
                          symbol=args.symbol, timeframe=args.timeframe,
-                         max_workers=1)
+                         max_workers=OPTIMIZATION_MAX_WORKERS,
+                         combos=[dict(c) for c in _expanded_grid(args.strategy)])
         result = wf.run(df)
 
         print(f"\n{'='*70}")
@@ -116,8 +149,10 @@ def main():
     elif args.method == "monte_carlo":
         from src.optimization.monte_carlo import MonteCarlo
 
-        # First run a backtest to get trade PnLs
-        df = add_all_indicators(df)
+        # First run a backtest to get trade PnLs. The state can keep
+        # extending the indicators with state.update(bar) for new candles.
+        state = IndicatorState()
+        df = state.backfill(df)
         df = df.dropna().reset_index(drop=True)
         strategy = strategy_class()
         df = strategy.generate_signals(df)
@@ -131,7 +166,7 @@ def main():
             print("No trades to simulate!")
             sys.exit(1)
 
-        pnls = result.trades["pnl"].tolist()
+        pnls = result.trades["pnl"].to_numpy(dtype=np.float64)
         mc = MonteCarlo(pnls, n_simulations=MONTE_CARLO_SIMULATIONS)
         mc_result = mc.run()
 
@@ -5,13 +5,24 @@ from contextlib import asynccontextmanager
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from config import settings
 from config.settings import CORS_ORIGINS
 from src.api.auth import require_api_key
-from src.api.deps import set_notification_service
-from src.api.routes import account, candles, llm, notifications, performance, positions, risk, strategy, trades
+from src.api.deps import set_notification_queue, set_notification_service
+from src.api.routes import (
+    account, candles, llm, notifications, performance, positions, risk, snapshot, strategy, trades,
+)
 from src.api.ws import periodic_account_broadcast, router as ws_router
+from src.notifications.email import EmailBackend
+from src.notifications.service import NotificationService
+
+try:
+    from src.notifications.discord import DiscordBackend
+    from src.notifications.telegram import TelegramBackend
+except ImportError:  # httpx missing: webhook/bot backends unavailable
+    DiscordBackend = TelegramBackend = None
 
 
 def _build_notification_service():
@@ -19,19 +30,15 @@ def _build_notification_service():
     if not settings.NOTIFY_BACKENDS:
         return None
 
-    from src.notifications.service import NotificationService
     backends = []
 
-    if "telegram" in settings.NOTIFY_BACKENDS and settings.TELEGRAM_BOT_TOKEN:
-        from src.notifications.telegram import TelegramBackend
+    if "telegram" in settings.NOTIFY_BACKENDS and settings.TELEGRAM_BOT_TOKEN and TelegramBackend is not None:
         backends.append(TelegramBackend(settings.TELEGRAM_BOT_TOKEN, settings.TELEGRAM_CHAT_ID))
 
-    if "discord" in settings.NOTIFY_BACKENDS and settings.DISCORD_WEBHOOK_URL:
-        from src.notifications.discord import DiscordBackend
+    if "discord" in settings.NOTIFY_BACKENDS and settings.DISCORD_WEBHOOK_URL and DiscordBackend is not None:
         backends.append(DiscordBackend(settings.DISCORD_WEBHOOK_URL))
 
     if "email" in settings.NOTIFY_BACKENDS and settings.SMTP_HOST:
-        from src.notifications.email import EmailBackend
         backends.append(EmailBackend(
             settings.SMTP_HOST, settings.SMTP_PORT,
             settings.SMTP_USER, settings.SMTP_PASSWORD,
@@ -49,19 +56,31 @@ def _build_notification_service():
 async def lifespan(app: FastAPI):
     # Build notification service
     svc = _build_notification_service()
+    tasks = [asyncio.create_task(periodic_account_broadcast())]
     if svc is not None:
         set_notification_service(svc)
+        # Manual sends are queued and delivered in the background
+        queue = asyncio.Queue()
+        set_notification_queue(queue)
+        tasks.append(asyncio.create_task(svc.drain(queue)))
 
-    task = asyncio.create_task(periodic_account_broadcast())
     yield
-    task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
-
-
-app = FastAPI(title="Forex Scalper API", version="0.5.0", lifespan=lifespan)
+    set_notification_queue(None)
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+app = FastAPI(
+    title="Forex Scalper API",
+    version="0.5.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # CORS
 app.add_middleware(
@@ -83,6 +102,7 @@ app.include_router(risk.router, dependencies=_auth)
 app.include_router(notifications.router, dependencies=_auth)
 app.include_router(performance.router, dependencies=_auth)
 app.include_router(llm.router, dependencies=_auth)
+app.include_router(snapshot.router, dependencies=_auth)
 app.include_router(ws_router)
 
 
@@ -1,9 +1,14 @@
 """API key authentication dependency."""
 
+import hmac
+
 from fastapi import Depends, HTTPException, Query, Request, status
 
 from config.settings import API_KEY
 
+# Encoded once; an empty key means auth is disabled
+_API_KEY_BYTES = API_KEY.encode()
+
 
 def require_api_key(
     request: Request,
@@ -13,10 +18,12 @@ def require_api_key(
 
     If API_KEY setting is empty, auth is disabled (dev mode).
     """
-    if not API_KEY:
+    if not _API_KEY_BYTES:
         return  # Auth disabled
 
-    key = request.headers.get("X-API-Key") or api_key
+    key = request.headers.get("x-api-key")
+    if key is None:
+        key = api_key
 
     if not key:
         raise HTTPException(
@@ -24,7 +31,7 @@ def require_api_key(
             detail="API key required",
         )
 
-    if key != API_KEY:
+    if not hmac.compare_digest(key.encode(), _API_KEY_BYTES):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -4,6 +4,7 @@ from src.api.state import EngineManager
 
 _engine_manager = EngineManager()
 _notification_service = None
+_notification_queue = None
 
 
 def get_engine_manager() -> EngineManager:
@@ -17,3 +18,12 @@ def get_notification_service():
 def set_notification_service(svc):
     global _notification_service
     _notification_service = svc
+
+
+def get_notification_queue():
+    return _notification_queue
+
+
+def set_notification_queue(queue):
+    global _notification_queue
+    _notification_queue = queue
@@ -1,6 +1,7 @@
 """Account endpoint."""
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from src.api.deps import get_engine_manager
 from src.api.schemas import AccountResponse
@@ -14,4 +15,16 @@ def get_account(mgr: EngineManager = Depends(get_engine_manager)):
     if mgr.broker is None:
         raise HTTPException(status_code=400, detail="No broker active")
     info = mgr.broker.get_account_info()
-    return AccountResponse(**info)
+    return ORJSONResponse(account_record(info))
+
+
+def account_record(info: dict) -> dict:
+    """Broker account info shaped like AccountResponse."""
+    return {
+        "balance": float(info["balance"]),
+        "equity": float(info["equity"]),
+        "open_positions": int(info["open_positions"]),
+        "total_pnl": float(info["total_pnl"]),
+        "margin_used": float(info.get("margin_used", 0.0)),
+        "margin_available": float(info.get("margin_available", 0.0)),
+    }
@@ -1,6 +1,7 @@
-"""Candle history endpoint."""
+"""Candle history endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from src.api.deps import get_engine_manager
 from src.api.schemas import CandleResponse
@@ -9,12 +10,7 @@ from src.api.state import EngineManager
 router = APIRouter(prefix="/api", tags=["candles"])
 
 
-@router.get("/candles", response_model=list[CandleResponse])
-def get_candles(
-    limit: int = Query(250, ge=1, le=5000),
-    engine_id: str | None = Query(None),
-    mgr: EngineManager = Depends(get_engine_manager),
-):
+def _resolve_engine(engine_id: str | None, mgr: EngineManager):
     if engine_id:
         inst = mgr.get_engine(engine_id)
         if inst is None:
@@ -25,19 +21,27 @@ def get_candles(
 
     if engine is None:
         raise HTTPException(status_code=400, detail="No engine active")
+    return engine
+
 
-    df = engine.candle_history
-    if df.empty:
-        return []
-    df = df.tail(limit)
-    result = []
-    for _, row in df.iterrows():
-        result.append(CandleResponse(
-            timestamp=str(row["timestamp"]),
-            open=row["open"],
-            high=row["high"],
-            low=row["low"],
-            close=row["close"],
-            volume=row.get("volume", 0),
-        ))
-    return result
+@router.get("/candles", response_model=list[CandleResponse])
+def get_candles(
+    limit: int = Query(250, ge=1, le=5000),
+    engine_id: str | None = Query(None),
+    mgr: EngineManager = Depends(get_engine_manager),
+):
+    engine = _resolve_engine(engine_id, mgr)
+    # Pre-serialized and cached per bar by the engine; returning a Response
+    # skips response_model validation (the model is kept for the OpenAPI schema)
+    return Response(content=engine.candles_json(limit), media_type="application/json")
+
+
+@router.get("/candles.ndjson")
+def stream_candles(
+    limit: int = Query(250, ge=1, le=5000),
+    engine_id: str | None = Query(None),
+    mgr: EngineManager = Depends(get_engine_manager),
+):
+    """Same rows as /candles, one JSON object per line, sent in chunks."""
+    engine = _resolve_engine(engine_id, mgr)
+    return StreamingResponse(engine.iter_candles_ndjson(limit), media_type="application/x-ndjson")
@@ -1,10 +1,8 @@
 """Notification endpoints."""
 
-import asyncio
-
 from fastapi import APIRouter
 
-from src.api.deps import get_notification_service
+from src.api.deps import get_notification_queue, get_notification_service
 
 router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 
@@ -26,5 +24,11 @@ async def send_test():
     svc = get_notification_service()
     if svc is None or not svc.backends:
         return {"status": "no_backends_configured"}
-    await svc._dispatch("Test Notification", "This is a test from Forex Scalper.")
-    return {"status": "sent", "backends": [b.name for b in svc.backends]}
+    message = ("Test Notification", "This is a test from Forex Scalper.")
+    queue = get_notification_queue()
+    if queue is None:
+        # No background dispatcher (app started without its lifespan)
+        await svc._dispatch(*message)
+        return {"status": "sent", "backends": [b.name for b in svc.backends]}
+    queue.put_nowait(message)
+    return {"status": "queued", "backends": [b.name for b in svc.backends]}
@@ -4,26 +4,26 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 
 from src.api.deps import get_engine_manager
 from src.api.state import EngineManager
+from src.database.repository import TradeRepository
 
 router = APIRouter(prefix="/api/performance", tags=["performance"])
 
+# Stateless wrapper over the shared pooled engine; one instance serves every request
+_repo = TradeRepository()
+
 
 @router.get("/summary")
 def performance_summary(mgr: EngineManager = Depends(get_engine_manager)):
     if mgr.engine is None or mgr.engine.run_id is None:
         raise HTTPException(status_code=400, detail="No active run")
-    from src.database.repository import TradeRepository
-    repo = TradeRepository()
-    return repo.get_performance_summary(mgr.engine.run_id)
+    return _repo.get_performance_summary(mgr.engine.run_id)
 
 
 @router.get("/daily")
 def daily_summary(mgr: EngineManager = Depends(get_engine_manager)):
     if mgr.engine is None or mgr.engine.run_id is None:
         raise HTTPException(status_code=400, detail="No active run")
-    from src.database.repository import TradeRepository
-    repo = TradeRepository()
-    return repo.get_daily_summaries(mgr.engine.run_id)
+    return _repo.get_daily_summaries(mgr.engine.run_id)
 
 
 @router.get("/history")
@@ -34,6 +34,4 @@ def trade_history(
 ):
     if mgr.engine is None or mgr.engine.run_id is None:
         raise HTTPException(status_code=400, detail="No active run")
-    from src.database.repository import TradeRepository
-    repo = TradeRepository()
-    return repo.get_trade_history(mgr.engine.run_id, limit, offset)
+    return _repo.get_trade_history(mgr.engine.run_id, limit, offset)
@@ -1,6 +1,7 @@
 """Positions endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from src.api.deps import get_engine_manager
 from src.api.schemas import PositionResponse
@@ -24,20 +25,25 @@ def get_positions(
     else:
         raise HTTPException(status_code=400, detail="No broker active")
 
-    result = []
-    for p in positions:
-        result.append(PositionResponse(
-            order_id=p["order_id"],
-            symbol=p.get("symbol", ""),
-            side=p["side"],
-            entry_price=p["entry_price"],
-            volume=p["volume"],
-            sl=p.get("sl", 0),
-            tp=p.get("tp", 0),
-            entry_time=str(p.get("entry_time", "")),
-            unrealized_pnl=p.get("unrealized_pnl", 0),
-        ))
-    return result
+    return ORJSONResponse(position_records(positions))
+
+
+def position_records(positions: list[dict]) -> list[dict]:
+    """Broker positions shaped like PositionResponse."""
+    return [
+        {
+            "order_id": p["order_id"],
+            "symbol": p.get("symbol", ""),
+            "side": p["side"],
+            "entry_price": float(p["entry_price"]),
+            "volume": float(p["volume"]),
+            "sl": float(p.get("sl", 0)),
+            "tp": float(p.get("tp", 0)),
+            "entry_time": str(p.get("entry_time", "")),
+            "unrealized_pnl": float(p.get("unrealized_pnl", 0)),
+        }
+        for p in positions
+    ]
 
 
 @router.post("/positions/{order_id}/close")
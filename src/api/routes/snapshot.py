@@ -0,0 +1,37 @@
+"""Combined account/positions/candles endpoint for dashboards that poll all three."""
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+
+from src.api.deps import get_engine_manager
+from src.api.routes.account import account_record
+from src.api.routes.positions import position_records
+from src.api.state import EngineManager
+
+router = APIRouter(prefix="/api", tags=["snapshot"])
+
+
+@router.get("/snapshot")
+def get_snapshot(
+    candle_limit: int = Query(250, ge=1, le=5000),
+    engine_id: str | None = Query(None),
+    mgr: EngineManager = Depends(get_engine_manager),
+):
+    """One engine lookup and one response instead of /account + /positions + /candles."""
+    inst = mgr.resolve(engine_id)
+    if inst is None:
+        if engine_id:
+            raise HTTPException(status_code=404, detail=f"Engine '{engine_id}' not found")
+        raise HTTPException(status_code=400, detail="No engine active")
+
+    account = account_record(inst.broker.get_account_info())
+    positions = position_records(inst.broker.get_positions())
+    # The candle tail is already serialized (and cached per bar) by the engine,
+    # so splice it in rather than decoding and re-encoding it
+    body = b"".join((
+        b'{"account":', orjson.dumps(account),
+        b',"positions":', orjson.dumps(positions),
+        b',"candles":', inst.engine.candles_json(candle_limit),
+        b"}",
+    ))
+    return Response(content=body, media_type="application/json")
@@ -1,11 +1,16 @@
 """Strategy control endpoints — multi-engine support (Phase 5D)."""
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
 from config.settings import INITIAL_CAPITAL
 from src.api.deps import get_engine_manager
 from src.api.schemas import StrategyParamsUpdate, StrategyStartRequest, StrategyStatusResponse
 from src.api.state import EngineManager
+from src.broker.oanda import OandaBroker
+from src.broker.paper import PaperBroker
+from src.data.demo_feed import DemoFeed
+from src.data.oanda_feed import OandaFeed
 from src.strategy.bb_reversion import BBReversionStrategy
 from src.strategy.ema_crossover import EMACrossoverStrategy
 
@@ -28,13 +33,9 @@ def start_strategy(
     strategy = STRATEGIES[req.strategy]()
 
     if req.broker == "oanda":
-        from src.broker.oanda import OandaBroker
-        from src.data.oanda_feed import OandaFeed
         broker = OandaBroker()
         feed = OandaFeed()
     else:
-        from src.broker.paper import PaperBroker
-        from src.data.demo_feed import DemoFeed
         broker = PaperBroker(symbol=req.symbol, capital=req.capital)
         feed = DemoFeed()
 
@@ -76,11 +77,21 @@ def stop_all_engines(mgr: EngineManager = Depends(get_engine_manager)):
 
 
 @router.get("/status", response_model=None)
-def strategy_status(mgr: EngineManager = Depends(get_engine_manager)):
-    engines = mgr.list_engines()
-    if not engines:
-        return StrategyStatusResponse(running=False)
-    return {"engines": engines, "running": mgr.is_running}
+def strategy_status(request: Request, mgr: EngineManager = Depends(get_engine_manager)):
+    # Dashboards poll this; answer 304 or reuse the last body until engines change
+    etag = mgr.status_etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    cached = mgr.status_cache
+    if cached is None or cached[0] != etag:
+        engines = mgr.list_engines()
+        if engines:
+            payload = {"engines": engines, "running": any(e["running"] for e in engines)}
+        else:
+            payload = StrategyStatusResponse(running=False).model_dump()
+        cached = mgr.status_cache = (etag, orjson.dumps(payload))
+    return Response(content=cached[1], media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/{engine_id}/status")
@@ -1,6 +1,7 @@
 """Trade history endpoint."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from src.api.deps import get_engine_manager
 from src.api.schemas import TradeResponse
@@ -19,27 +20,28 @@ def get_trades(
         inst = mgr.get_engine(engine_id)
         if inst is None:
             raise HTTPException(status_code=404, detail=f"Engine '{engine_id}' not found")
-        trades = inst.broker.get_closed_trades()
+        trades = inst.broker.get_closed_trades(limit)
     elif mgr.broker is not None:
-        trades = mgr.broker.get_closed_trades()
+        trades = mgr.broker.get_closed_trades(limit)
     else:
         raise HTTPException(status_code=400, detail="No broker active")
 
-    result = []
-    for t in trades[-limit:]:
-        result.append(TradeResponse(
-            strategy_name=t.get("strategy_name", ""),
-            symbol=t.get("symbol", ""),
-            timeframe=t.get("timeframe", ""),
-            side=t["side"],
-            entry_time=str(t.get("entry_time", "")),
-            exit_time=str(t.get("exit_time", "")),
-            entry_price=t["entry_price"],
-            exit_price=t["exit_price"],
-            volume=t["volume"],
-            pnl=t["pnl"],
-            sl=t.get("sl", 0),
-            tp=t.get("tp", 0),
-            exit_reason=t.get("exit_reason", ""),
-        ))
-    return result
+    # Plain dicts straight to orjson; response_model only documents the shape
+    return ORJSONResponse([
+        {
+            "strategy_name": t.get("strategy_name", ""),
+            "symbol": t.get("symbol", ""),
+            "timeframe": t.get("timeframe", ""),
+            "side": t["side"],
+            "entry_time": str(t.get("entry_time", "")),
+            "exit_time": str(t.get("exit_time", "")),
+            "entry_price": float(t["entry_price"]),
+            "exit_price": float(t["exit_price"]),
+            "volume": float(t["volume"]),
+            "pnl": float(t["pnl"]),
+            "sl": float(t.get("sl", 0)),
+            "tp": float(t.get("tp", 0)),
+            "exit_reason": t.get("exit_reason", ""),
+        }
+        for t in trades[-limit:]
+    ])
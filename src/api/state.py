@@ -1,6 +1,7 @@
 """EngineManager — manages multiple TradingEngine instances for the API."""
 
 import threading
+import uuid
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -15,7 +16,7 @@ from src.utils.logger import get_logger
 log = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineInstance:
     engine_id: str
     engine: TradingEngine
@@ -34,56 +35,61 @@ class EngineManager:
     """Thread-safe manager for multiple TradingEngine instances."""
 
     def __init__(self) -> None:
+        # Serializes writers (start/stop); the engines dict is replaced, never
+        # mutated, so readers use whatever dict is current without locking
         self._lock = threading.Lock()
         self._engines: dict[str, EngineInstance] = {}
+        # Ids reserved by start_engine calls that are still building/warming up
+        self._starting: set[str] = set()
+        # Last suffix handed out per "strategy_symbol_timeframe" prefix
+        self._id_counters: dict[str, int] = {}
         # Shared risk manager for portfolio-level risk
         self._shared_risk_manager: RiskManager | None = None
 
         # Legacy single-engine compatibility properties
         self._last_started: str | None = None
 
+        # Bumped whenever engines are started or stopped; see status_etag()
+        self.state_version = 0
+        # Distinguishes this manager's versions from another process's (restarts)
+        self._etag_nonce = uuid.uuid4().hex[:8]
+        # (etag, serialized /api/strategy/status body), filled by the route
+        self.status_cache: tuple[str, bytes] | None = None
+        # (engines dict it was built from, broker-deduplicated instances,
+        # (engine_id, event_bus) pairs); see _snapshot()
+        self._snapshot_cache: tuple[dict, tuple[EngineInstance, ...], tuple[tuple[str, EventBus], ...]] | None = None
+
     # --- Legacy properties for backward compatibility ---
+
+    def _last(self) -> EngineInstance | None:
+        """The last started instance, if it is still registered."""
+        last = self._last_started
+        return self._engines.get(last) if last else None
+
     @property
     def engine(self) -> TradingEngine | None:
-        with self._lock:
-            if self._last_started and self._last_started in self._engines:
-                return self._engines[self._last_started].engine
-            # Return first running engine
-            for inst in self._engines.values():
-                if inst.engine.is_running:
-                    return inst.engine
-            return None
+        inst = self.resolve()
+        return inst.engine if inst is not None else None
 
     @property
     def broker(self) -> Broker | None:
-        with self._lock:
-            if self._last_started and self._last_started in self._engines:
-                return self._engines[self._last_started].broker
-            for inst in self._engines.values():
-                if inst.engine.is_running:
-                    return inst.broker
-            return None
+        inst = self.resolve()
+        return inst.broker if inst is not None else None
 
     @property
     def feed(self) -> DataFeed | None:
-        with self._lock:
-            if self._last_started and self._last_started in self._engines:
-                return self._engines[self._last_started].feed
-            return None
+        inst = self._last()
+        return inst.feed if inst is not None else None
 
     @property
     def strategy(self) -> Strategy | None:
-        with self._lock:
-            if self._last_started and self._last_started in self._engines:
-                return self._engines[self._last_started].strategy
-            return None
+        inst = self._last()
+        return inst.strategy if inst is not None else None
 
     @property
     def event_bus(self) -> EventBus | None:
-        with self._lock:
-            if self._last_started and self._last_started in self._engines:
-                return self._engines[self._last_started].event_bus
-            return None
+        inst = self._last()
+        return inst.event_bus if inst is not None else None
 
     @property
     def risk_manager(self) -> RiskManager | None:
@@ -91,29 +97,22 @@ class EngineManager:
 
     @property
     def symbol(self) -> str:
-        with self._lock:
-            if self._last_started and self._last_started in self._engines:
-                return self._engines[self._last_started].symbol
-            return ""
+        inst = self._last()
+        return inst.symbol if inst is not None else ""
 
     @property
     def timeframe(self) -> str:
-        with self._lock:
-            if self._last_started and self._last_started in self._engines:
-                return self._engines[self._last_started].timeframe
-            return ""
+        inst = self._last()
+        return inst.timeframe if inst is not None else ""
 
     @property
     def broker_type(self) -> str:
-        with self._lock:
-            if self._last_started and self._last_started in self._engines:
-                return self._engines[self._last_started].broker_type
-            return ""
+        inst = self._last()
+        return inst.broker_type if inst is not None else ""
 
     @property
     def is_running(self) -> bool:
-        with self._lock:
-            return any(inst.engine.is_running for inst in self._engines.values())
+        return any(inst.engine.is_running for inst in self._engines.values())
 
     @property
     def risk_status(self) -> dict:
@@ -125,12 +124,13 @@ class EngineManager:
 
     def _generate_engine_id(self, strategy_name: str, symbol: str, timeframe: str) -> str:
         base = f"{strategy_name}_{symbol}_{timeframe}"
-        if base not in self._engines:
-            return base
-        i = 2
-        while f"{base}_{i}" in self._engines:
-            i += 1
-        return f"{base}_{i}"
+        while True:
+            n = self._id_counters.get(base, 0) + 1
+            self._id_counters[base] = n
+            candidate = base if n == 1 else f"{base}_{n}"
+            # Only loops when an explicit engine_id already claimed this name
+            if candidate not in self._engines and candidate not in self._starting:
+                return candidate
 
     def start_engine(
         self,
@@ -142,22 +142,34 @@ class EngineManager:
         broker_type: str = "paper",
         engine_id: str | None = None,
     ) -> str:
-        """Start a new engine instance. Returns engine_id."""
+        """Start a new engine instance. Returns engine_id.
+
+        The manager lock only covers reserving the id and publishing the
+        instance; building and warming up the engine happen outside it.
+        """
         with self._lock:
             if engine_id is None:
                 engine_id = self._generate_engine_id(strategy.name, symbol, timeframe)
 
-            if engine_id in self._engines:
-                inst = self._engines[engine_id]
-                if inst.engine.is_running:
-                    raise RuntimeError(f"Engine '{engine_id}' already running")
+            if engine_id in self._starting:
+                raise RuntimeError(f"Engine '{engine_id}' already starting")
+            existing = self._engines.get(engine_id)
+            if existing is not None and existing.engine.is_running:
+                raise RuntimeError(f"Engine '{engine_id}' already running")
+            self._starting.add(engine_id)
 
+        try:
             event_bus = EventBus()
 
-            # Create or reuse shared risk manager
-            if self._shared_risk_manager is None:
-                self._shared_risk_manager = RiskManager(broker)
-                self._shared_risk_manager.reset_daily()
+            # Create or reuse shared risk manager; reset_daily() may query the broker
+            risk_manager = self._shared_risk_manager
+            if risk_manager is None:
+                candidate = RiskManager(broker)
+                candidate.reset_daily()
+                with self._lock:
+                    if self._shared_risk_manager is None:
+                        self._shared_risk_manager = candidate
+                    risk_manager = self._shared_risk_manager
 
             # Build LLM assessor if enabled
             llm_assessor = None
@@ -184,7 +196,7 @@ class EngineManager:
                 symbol=symbol,
                 timeframe=timeframe,
                 event_bus=event_bus,
-                risk_manager=self._shared_risk_manager,
+                risk_manager=risk_manager,
                 llm_assessor=llm_assessor,
             )
 
@@ -195,17 +207,24 @@ class EngineManager:
                 feed=feed,
                 strategy=strategy,
                 event_bus=event_bus,
-                risk_manager=self._shared_risk_manager,
+                risk_manager=risk_manager,
                 symbol=symbol,
                 timeframe=timeframe,
                 broker_type=broker_type,
             )
-            self._engines[engine_id] = inst
-            self._last_started = engine_id
+            with self._lock:
+                self._engines = {**self._engines, engine_id: inst}
+                self._last_started = engine_id
+                self.state_version += 1
 
+            # Warm-up fetches history; the id stays reserved until it finishes
             eng.start()
-            log.info("engine_started", engine_id=engine_id, symbol=symbol, strategy=strategy.name)
-            return engine_id
+        finally:
+            with self._lock:
+                self._starting.discard(engine_id)
+
+        log.info("engine_started", engine_id=engine_id, symbol=symbol, strategy=strategy.name)
+        return engine_id
 
     def stop_engine(self, engine_id: str | None = None) -> None:
         """Stop a specific engine or the last started one."""
@@ -221,6 +240,7 @@ class EngineManager:
                 return
 
             inst.engine.stop()
+            self.state_version += 1
             log.info("engine_stopped", engine_id=engine_id)
 
     def stop_all(self) -> None:
@@ -230,119 +250,148 @@ class EngineManager:
                 if inst.engine.is_running:
                     inst.engine.stop()
                     log.info("engine_stopped", engine_id=engine_id)
+            self.state_version += 1
+
+    def resolve(self, engine_id: str | None = None) -> EngineInstance | None:
+        """Return ``engine_id``'s instance, or the one the legacy properties use.
+
+        Callers that need the engine and broker together should use this so
+        both come from the same instance.
+        """
+        engines = self._engines
+        if engine_id is not None:
+            return engines.get(engine_id)
+        last = self._last_started
+        if last and last in engines:
+            return engines[last]
+        for inst in engines.values():
+            if inst.engine.is_running:
+                return inst
+        return None
 
     def get_engine(self, engine_id: str) -> EngineInstance | None:
-        with self._lock:
-            return self._engines.get(engine_id)
+        return self._engines.get(engine_id)
+
+    def status_etag(self) -> str:
+        """Cheap validator for list_engines(): changes whenever its output would.
+
+        Engines can also stop on their own (stream death), so the running
+        flags are folded in alongside the start/stop counter. The counter
+        restarts at 0 with the process, so a per-manager nonce keeps tags from
+        a previous server run from validating against a different engine set.
+        """
+        version = self.state_version
+        running = "".join("1" if inst.engine.is_running else "0" for inst in self._engines.values())
+        return f'"{self._etag_nonce}-{version}-{running}"'
+
+    def _snapshot(self) -> tuple[tuple[EngineInstance, ...], tuple[tuple[str, EventBus], ...]]:
+        """Broker-deduplicated instances and all event buses.
+
+        Rebuilt only when start_engine publishes a new engines dict, instead
+        of on every aggregation and periodic broadcast.
+        """
+        engines = self._engines
+        cached = self._snapshot_cache
+        if cached is None or cached[0] is not engines:
+            unique = []
+            seen_brokers = set()
+            for inst in engines.values():
+                broker_id = id(inst.broker)
+                if broker_id in seen_brokers:
+                    continue
+                seen_brokers.add(broker_id)
+                unique.append(inst)
+            buses = tuple((inst.engine_id, inst.event_bus) for inst in engines.values())
+            cached = self._snapshot_cache = (engines, tuple(unique), buses)
+        return cached[1], cached[2]
+
+    def engine_event_buses(self) -> tuple[tuple[str, EventBus], ...]:
+        """(engine_id, event_bus) pairs; the same tuple until the engines change."""
+        return self._snapshot()[1]
 
     def list_engines(self) -> list[dict[str, Any]]:
         """Return status of all engines."""
-        with self._lock:
-            result = []
-            for eid, inst in self._engines.items():
-                result.append({
-                    "engine_id": eid,
-                    "running": inst.engine.is_running,
-                    "strategy": inst.strategy.name,
-                    "symbol": inst.symbol,
-                    "timeframe": inst.timeframe,
-                    "broker": inst.broker_type,
-                })
-            return result
+        result = []
+        for eid, inst in self._engines.items():
+            result.append({
+                "engine_id": eid,
+                "running": inst.engine.is_running,
+                "strategy": inst.strategy.name,
+                "symbol": inst.symbol,
+                "timeframe": inst.timeframe,
+                "broker": inst.broker_type,
+            })
+        return result
 
     def get_all_positions(self) -> list[dict]:
         """Aggregate positions from all running engines' brokers."""
-        # Copy broker list under lock, then query without holding lock
-        with self._lock:
-            brokers = []
-            seen_brokers = set()
-            for inst in self._engines.values():
-                broker_id = id(inst.broker)
-                if broker_id in seen_brokers:
-                    continue
-                seen_brokers.add(broker_id)
-                if inst.engine.is_running:
-                    brokers.append((inst.engine_id, inst.broker))
+        unique, _ = self._snapshot()
+        brokers = [(inst.engine_id, inst.broker) for inst in unique if inst.engine.is_running]
 
         all_positions = []
         for engine_id, broker in brokers:
             try:
-                for pos in broker.get_positions():
-                    pos["engine_id"] = engine_id
-                    all_positions.append(pos)
+                # Copies: brokers may hand out the dicts they keep internally
+                all_positions.extend({**pos, "engine_id": engine_id} for pos in broker.get_positions())
             except Exception:
                 log.exception("get_positions_failed", engine_id=engine_id)
         return all_positions
 
     def get_all_trades(self, limit: int = 100) -> list[dict]:
         """Aggregate closed trades from all engines' brokers."""
-        # Copy broker list under lock, then query without holding lock
-        with self._lock:
-            brokers = []
-            seen_brokers = set()
-            for inst in self._engines.values():
-                broker_id = id(inst.broker)
-                if broker_id in seen_brokers:
-                    continue
-                seen_brokers.add(broker_id)
-                brokers.append((inst.engine_id, inst.broker))
+        unique, _ = self._snapshot()
+        brokers = [(inst.engine_id, inst.broker) for inst in unique]
 
         all_trades = []
         for engine_id, broker in brokers:
             try:
-                for t in broker.get_closed_trades():
-                    t["engine_id"] = engine_id
-                    all_trades.append(t)
+                all_trades.extend({**t, "engine_id": engine_id} for t in broker.get_closed_trades(limit))
             except Exception:
                 log.exception("get_trades_failed", engine_id=engine_id)
         return all_trades[-limit:]
 
     def get_aggregated_account(self) -> dict:
         """Aggregate account info across all brokers."""
-        # Copy broker list under lock, then query without holding lock
-        with self._lock:
-            brokers = []
-            seen_brokers = set()
-            for inst in self._engines.values():
-                broker_id = id(inst.broker)
-                if broker_id in seen_brokers:
-                    continue
-                seen_brokers.add(broker_id)
-                brokers.append((inst.engine_id, inst.broker))
+        unique, _ = self._snapshot()
+        brokers = [(inst.engine_id, inst.broker) for inst in unique]
 
         total_balance = 0.0
         total_equity = 0.0
         total_positions = 0
         total_pnl = 0.0
+        total_margin_used = 0.0
+        total_margin_available = 0.0
 
         for engine_id, broker in brokers:
             try:
                 info = broker.get_account_info()
-                total_balance += info.get("balance", 0)
-                total_equity += info.get("equity", 0)
-                total_positions += info.get("open_positions", 0)
-                total_pnl += info.get("total_pnl", 0)
+                total_balance += float(info.get("balance", 0))
+                total_equity += float(info.get("equity", 0))
+                total_positions += int(info.get("open_positions", 0))
+                total_pnl += float(info.get("total_pnl", 0))
+                total_margin_used += float(info.get("margin_used", 0))
+                total_margin_available += float(info.get("margin_available", 0))
             except Exception:
                 log.exception("get_account_failed", engine_id=engine_id)
 
+        # Exactly the AccountResponse fields, already coerced, so callers can
+        # serialize it as-is without a validation pass
         return {
             "balance": total_balance,
             "equity": total_equity,
             "open_positions": total_positions,
             "total_pnl": total_pnl,
+            "margin_used": total_margin_used,
+            "margin_available": total_margin_available,
         }
 
     def get_health(self) -> dict[str, Any]:
         """Return health status for all engines."""
-        with self._lock:
-            engines = [(eid, inst.engine) for eid, inst in self._engines.items()]
-
         result = {}
-        for engine_id, engine in engines:
-            result[engine_id] = engine.health_status
+        for engine_id, inst in self._engines.items():
+            result[engine_id] = inst.engine.health_status
         return result
 
     def get_all_event_buses(self) -> list[EventBus]:
         """Return all event buses for WS subscription."""
-        with self._lock:
-            return [inst.event_bus for inst in self._engines.values()]
+        return [bus for _, bus in self.engine_event_buses()]
@@ -1,47 +1,67 @@
 """WebSocket endpoint for real-time streaming to the dashboard."""
 
 import asyncio
-import json
 import time
+import weakref
+from collections import deque
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from config.settings import API_KEY
+from config.settings import API_KEY, WS_BROADCAST_INTERVAL
 from src.api.deps import get_engine_manager
+from src.engine.event_bus import EventBus
 from src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
 router = APIRouter()
 
+# Numpy scalars serialize natively; datetimes go through default=str so the
+# dashboard keeps receiving the same "YYYY-MM-DD HH:MM:SS" strings
+_JSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def encode_message(message: dict) -> str:
+    """Serialize a WS message once for every client (NaN becomes null)."""
+    return orjson.dumps(message, default=str, option=_JSON_OPTIONS).decode()
+
+
+_PONG = encode_message({"type": "pong"})
+
 
 class ConnectionManager:
     """Manages active WebSocket connections."""
 
     def __init__(self) -> None:
-        self._connections: list[WebSocket] = []
+        self._connections: set[WebSocket] = set()
 
     async def connect(self, ws: WebSocket) -> None:
         await ws.accept()
-        self._connections.append(ws)
+        self._connections.add(ws)
         log.info("ws_connected", clients=len(self._connections))
 
     def disconnect(self, ws: WebSocket) -> None:
-        if ws in self._connections:
-            self._connections.remove(ws)
+        self._connections.discard(ws)
         log.info("ws_disconnected", clients=len(self._connections))
 
     async def broadcast(self, message: dict) -> None:
-        data = json.dumps(message, default=str)
-        dead = []
-        for ws in self._connections:
-            try:
-                await ws.send_text(data)
-            except Exception:
-                dead.append(ws)
-        for ws in dead:
-            self.disconnect(ws)
+        if not self._connections:
+            return  # nobody listening: skip the encode
+        data = encode_message(message)
+        # Snapshot: clients may (dis)connect while the sends are in flight.
+        # Text frames, since the dashboard JSON.parses event.data.
+        clients = list(self._connections)
+        results = await asyncio.gather(
+            *(ws.send_text(data) for ws in clients), return_exceptions=True
+        )
+        dead = {ws for ws, result in zip(clients, results) if isinstance(result, Exception)}
+        if dead:
+            # Set difference, not a rebuilt "alive" set: clients that connected
+            # while the sends were in flight must survive
+            self._connections -= dead
+            log.info("ws_disconnected", clients=len(self._connections), dropped=len(dead))
 
     @property
     def client_count(self) -> int:
@@ -50,69 +70,106 @@ class ConnectionManager:
 
 ws_manager = ConnectionManager()
 
-# Tick throttling: at most 1 tick broadcast per second
-_last_tick_broadcast = 0.0
-_TICK_THROTTLE_SECONDS = 1.0
+# Engine events forwarded to WS clients
+_WS_EVENTS = (
+    "tick", "candle_closed", "signal", "order_filled", "position_closed",
+    "engine_started", "engine_stopped", "circuit_breaker", "risk_blocked",
+    "llm_assessment", "llm_blocked",
+)
+
+# Tick throttling: at most 1 tick broadcast per second (monotonic clock, ns)
+_TICK_THROTTLE_NS = 1_000_000_000
+_next_tick_ns = 0
+
+# Server event loop, captured by periodic_account_broadcast. Engine events
+# fire on engine threads, where asyncio.get_running_loop() would fail.
+_loop: asyncio.AbstractEventLoop | None = None
+
+# Event buses we've subscribed to. Weak refs: a stopped engine's bus can be
+# collected, and a new bus reusing its id() must still get subscribed.
+_subscribed_buses: weakref.WeakSet[EventBus] = weakref.WeakSet()
+# Last mgr.engine_event_buses() tuple walked; unchanged means nothing new
+_bridged_buses: tuple = ()
 
-# Track which event buses we've subscribed to
-_subscribed_buses: set[int] = set()
+
+# Events from engine threads wait here and go out together on the next loop
+# iteration: a burst becomes one {"type": "batch", "events": [...]} frame
+_pending: deque[dict] = deque(maxlen=4096)
+_flush_scheduled = False
+
+
+def _flush_pending() -> None:
+    global _flush_scheduled
+    # Reset before draining: an event appended after this point schedules a new flush
+    _flush_scheduled = False
+    events = []
+    while _pending:
+        events.append(_pending.popleft())
+    if not events:
+        return
+    message = events[0] if len(events) == 1 else {"type": "batch", "events": events}
+    asyncio.ensure_future(ws_manager.broadcast(message))
 
 
 def _make_event_handler(engine_id: str = ""):
     """Create event handler that includes engine_id in messages."""
+    # Bound once here so the per-event path uses closure cells, not global
+    # and attribute lookups. _loop and ws_manager stay module lookups: they
+    # are assigned at startup (and patched in tests).
+    monotonic_ns = time.monotonic_ns
+    enqueue = _pending.append
+    throttle_ns = _TICK_THROTTLE_NS
+
     def _on_engine_event(event_type: str, data: Any) -> None:
-        global _last_tick_broadcast
+        global _next_tick_ns, _flush_scheduled
 
-        if ws_manager.client_count == 0:
+        loop = _loop
+        if loop is None or ws_manager.client_count == 0:
             return
 
         # Throttle tick events
         if event_type == "tick":
-            now = time.time()
-            if now - _last_tick_broadcast < _TICK_THROTTLE_SECONDS:
+            now = monotonic_ns()
+            if now < _next_tick_ns:
                 return
-            _last_tick_broadcast = now
+            _next_tick_ns = now + throttle_ns
 
         message = {"type": event_type, "data": data}
         if engine_id:
             message["engine_id"] = engine_id
 
-        try:
-            loop = asyncio.get_running_loop()
-            loop.call_soon_threadsafe(asyncio.ensure_future, ws_manager.broadcast(message))
-        except RuntimeError:
-            pass
+        enqueue(message)
+        if not _flush_scheduled:
+            _flush_scheduled = True
+            try:
+                loop.call_soon_threadsafe(_flush_pending)
+            except RuntimeError:
+                pass  # loop closed during shutdown
 
     return _on_engine_event
 
 
 def setup_event_bus_bridge(engine_id: str = "") -> None:
     """Subscribe to engine events if event_bus is available."""
+    global _bridged_buses
+
     mgr = get_engine_manager()
 
     # Multi-engine: subscribe to all event buses
-    for inst in (mgr._engines.values() if hasattr(mgr, '_engines') else []):
-        bus_id = id(inst.event_bus)
-        if bus_id not in _subscribed_buses:
-            handler = _make_event_handler(inst.engine_id)
-            for evt in ("tick", "candle_closed", "signal", "order_filled",
-                         "position_closed", "engine_started", "engine_stopped",
-                         "circuit_breaker", "risk_blocked",
-                         "llm_assessment", "llm_blocked"):
-                inst.event_bus.subscribe(evt, handler)
-            _subscribed_buses.add(bus_id)
+    buses = mgr.engine_event_buses()
+    if buses is _bridged_buses:
+        return
+    for eid, bus in buses:
+        if bus not in _subscribed_buses:
+            bus.subscribe_many(_WS_EVENTS, _make_event_handler(eid))
+            _subscribed_buses.add(bus)
+    _bridged_buses = buses
 
     # Legacy fallback
-    if mgr.event_bus is not None:
-        bus_id = id(mgr.event_bus)
-        if bus_id not in _subscribed_buses:
-            handler = _make_event_handler(engine_id)
-            for evt in ("tick", "candle_closed", "signal", "order_filled",
-                         "position_closed", "engine_started", "engine_stopped",
-                         "circuit_breaker", "risk_blocked",
-                         "llm_assessment", "llm_blocked"):
-                mgr.event_bus.subscribe(evt, handler)
-            _subscribed_buses.add(bus_id)
+    bus = mgr.event_bus
+    if bus is not None and bus not in _subscribed_buses:
+        bus.subscribe_many(_WS_EVENTS, _make_event_handler(engine_id))
+        _subscribed_buses.add(bus)
 
 
 @router.websocket("/ws/stream")
@@ -130,15 +187,16 @@ async def websocket_stream(ws: WebSocket):
             # Keep connection alive; handle client pings
             data = await ws.receive_text()
             if data == "ping":
-                await ws.send_text(json.dumps({"type": "pong"}))
+                await ws.send_text(_PONG)
     except WebSocketDisconnect:
         ws_manager.disconnect(ws)
 
 
 async def periodic_account_broadcast() -> None:
     """Background task: broadcasts account info + positions periodically."""
-    from config.settings import WS_BROADCAST_INTERVAL
+    global _loop
 
+    _loop = asyncio.get_running_loop()
     while True:
         await asyncio.sleep(WS_BROADCAST_INTERVAL)
         if ws_manager.client_count == 0:
@@ -0,0 +1,368 @@
+"""Bar loop for BacktestEngine, JIT-compiled when numba is installed.
+
+``run_bars`` walks the bars once with the open positions held as parallel
+arrays (side, entry price, volume, SL, TP, entry bar) and writes closed
+trades into preallocated column arrays. On each bar it checks SL/TP on
+open positions (SL first), opens a position on a signal, and records
+mark-to-market equity; whatever is still open after the last bar is
+closed at the final close with reason ``EXIT_END``. ``max_drawdown`` is
+the metrics drawdown scan, fused into one pass when compiled.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Codes in the exit_reason output array; EXIT_REASONS maps them back
+EXIT_SL = 0
+EXIT_TP = 1
+EXIT_END = 2
+EXIT_REASONS = ("SL", "TP", "END")
+
+
+def _run_bars(
+    close,
+    high,
+    low,
+    signal,
+    sl_arr,
+    tp_arr,
+    capital,
+    adjustment,
+    pip_value,
+    risk_per_trade,
+    max_positions,
+    use_risk_sizing,
+):
+    """Simulate the bars; ``signal`` is int64 with 0 for "no signal".
+
+    Returns ``(equity_curve, side, entry_bar, exit_bar, entry_price,
+    exit_price, volume, pnl, sl, tp, exit_reason)``, the trade arrays
+    holding one row per closed trade in closing order. ``side`` is +1/-1.
+    """
+    n = close.shape[0]
+
+    pos_side = np.empty(max_positions, np.int8)
+    pos_entry = np.empty(max_positions, np.float64)
+    pos_volume = np.empty(max_positions, np.float64)
+    pos_sl = np.empty(max_positions, np.float64)
+    pos_tp = np.empty(max_positions, np.float64)
+    pos_bar = np.empty(max_positions, np.int64)
+    n_open = 0
+    # Tightest exit levels across all open positions: a bar can only close
+    # something if bar_low <= low_trigger (BUY SL / SELL TP) or
+    # bar_high >= high_trigger (BUY TP / SELL SL)
+    low_trigger = -np.inf
+    high_trigger = np.inf
+
+    # Every trade has its own entry bar, so n bounds the trade count
+    out_side = np.empty(n, np.int8)
+    out_entry_bar = np.empty(n, np.int64)
+    out_exit_bar = np.empty(n, np.int64)
+    out_entry = np.empty(n, np.float64)
+    out_exit = np.empty(n, np.float64)
+    out_volume = np.empty(n, np.float64)
+    out_pnl = np.empty(n, np.float64)
+    out_sl = np.empty(n, np.float64)
+    out_tp = np.empty(n, np.float64)
+    out_reason = np.empty(n, np.int8)
+    n_closed = 0
+
+    equity_curve = np.empty(n, np.float64)
+    equity = capital
+
+    for i in range(n):
+        bar_high = high[i]
+        bar_low = low[i]
+        bar_close = close[i]
+
+        # Phase A: SL/TP on open positions, SL checked before TP
+        # (conservative). Survivors are compacted in place, keeping order.
+        # Most bars touch no level and skip the per-position checks.
+        if bar_low <= low_trigger or bar_high >= high_trigger:
+            kept = 0
+            for j in range(n_open):
+                side = pos_side[j]
+                reason = -1
+                exit_price = 0.0
+                if side == 1:
+                    if bar_low <= pos_sl[j]:
+                        reason = EXIT_SL
+                        exit_price = pos_sl[j]
+                    elif bar_high >= pos_tp[j]:
+                        reason = EXIT_TP
+                        exit_price = pos_tp[j]
+                else:
+                    if bar_high >= pos_sl[j]:
+                        reason = EXIT_SL
+                        exit_price = pos_sl[j]
+                    elif bar_low <= pos_tp[j]:
+                        reason = EXIT_TP
+                        exit_price = pos_tp[j]
+
+                if reason < 0:
+                    if kept != j:
+                        pos_side[kept] = side
+                        pos_entry[kept] = pos_entry[j]
+                        pos_volume[kept] = pos_volume[j]
+                        pos_sl[kept] = pos_sl[j]
+                        pos_tp[kept] = pos_tp[j]
+                        pos_bar[kept] = pos_bar[j]
+                    kept += 1
+                    continue
+
+                pnl = (exit_price - pos_entry[j]) * side * pos_volume[j] / pip_value
+                equity += pnl
+                out_side[n_closed] = side
+                out_entry_bar[n_closed] = pos_bar[j]
+                out_exit_bar[n_closed] = i
+                out_entry[n_closed] = pos_entry[j]
+                out_exit[n_closed] = exit_price
+                out_volume[n_closed] = pos_volume[j]
+                out_pnl[n_closed] = pnl
+                out_sl[n_closed] = pos_sl[j]
+                out_tp[n_closed] = pos_tp[j]
+                out_reason[n_closed] = reason
+                n_closed += 1
+            if kept != n_open:
+                n_open = kept
+                low_trigger = -np.inf
+                high_trigger = np.inf
+                for j in range(n_open):
+                    if pos_side[j] == 1:
+                        low_trigger = max(low_trigger, pos_sl[j])
+                        high_trigger = min(high_trigger, pos_tp[j])
+                    else:
+                        low_trigger = max(low_trigger, pos_tp[j])
+                        high_trigger = min(high_trigger, pos_sl[j])
+
+        # Phase B: new signal, with adverse spread + slippage on the fill
+        sig = signal[i]
+        if sig != 0 and n_open < max_positions:
+            sl_price = sl_arr[i]
+            tp_price = tp_arr[i]
+            if not np.isnan(sl_price) and not np.isnan(tp_price):
+                side = 1 if sig == 1 else -1
+                entry_price = bar_close + adjustment if side == 1 else bar_close - adjustment
+                if use_risk_sizing:
+                    # Volume such that PnL = (price_move / pip_value) * volume
+                    sl_distance = abs(entry_price - sl_price)
+                    if sl_distance == 0:
+                        volume = 0.0
+                    else:
+                        volume = max(equity * risk_per_trade * pip_value / sl_distance, 0.0)
+                else:
+                    volume = 1.0
+                if volume > 0:
+                    pos_side[n_open] = side
+                    pos_entry[n_open] = entry_price
+                    pos_volume[n_open] = volume
+                    pos_sl[n_open] = sl_price
+                    pos_tp[n_open] = tp_price
+                    pos_bar[n_open] = i
+                    n_open += 1
+                    if side == 1:
+                        low_trigger = max(low_trigger, sl_price)
+                        high_trigger = min(high_trigger, tp_price)
+                    else:
+                        low_trigger = max(low_trigger, tp_price)
+                        high_trigger = min(high_trigger, sl_price)
+
+        # Phase C: mark-to-market equity
+        mtm = equity
+        for j in range(n_open):
+            mtm += (bar_close - pos_entry[j]) * pos_side[j] * pos_volume[j] / pip_value
+        equity_curve[i] = mtm
+
+    # End: close remaining positions at the last close
+    for j in range(n_open):
+        exit_price = close[n - 1]
+        out_side[n_closed] = pos_side[j]
+        out_entry_bar[n_closed] = pos_bar[j]
+        out_exit_bar[n_closed] = n - 1
+        out_entry[n_closed] = pos_entry[j]
+        out_exit[n_closed] = exit_price
+        out_volume[n_closed] = pos_volume[j]
+        out_pnl[n_closed] = (exit_price - pos_entry[j]) * pos_side[j] * pos_volume[j] / pip_value
+        out_sl[n_closed] = pos_sl[j]
+        out_tp[n_closed] = pos_tp[j]
+        out_reason[n_closed] = EXIT_END
+        n_closed += 1
+
+    return (
+        equity_curve,
+        out_side[:n_closed],
+        out_entry_bar[:n_closed],
+        out_exit_bar[:n_closed],
+        out_entry[:n_closed],
+        out_exit[:n_closed],
+        out_volume[:n_closed],
+        out_pnl[:n_closed],
+        out_sl[:n_closed],
+        out_tp[:n_closed],
+        out_reason[:n_closed],
+    )
+
+
+
+def _first_exit(high, low, start, side, sl, tp):
+    """First bar at or after ``start`` that hits ``sl`` or ``tp``, as ``(bar, reason)``.
+
+    Scans in doubling windows so a short trade only touches a few bars.
+    Returns ``(-1, EXIT_END)`` if neither level is reached.
+    """
+    n = low.shape[0]
+    width = 64
+    while start < n:
+        stop = min(start + width, n)
+        if side == 1:
+            sl_hit = low[start:stop] <= sl
+            hit = sl_hit | (high[start:stop] >= tp)
+        else:
+            sl_hit = high[start:stop] >= sl
+            hit = sl_hit | (low[start:stop] <= tp)
+        if hit.any():
+            j = int(hit.argmax())
+            return start + j, EXIT_SL if sl_hit[j] else EXIT_TP
+        start = stop
+        width *= 2
+    return -1, EXIT_END
+
+
+def run_vectorized(
+    close,
+    high,
+    low,
+    signal,
+    sl_arr,
+    tp_arr,
+    capital,
+    adjustment,
+    pip_value,
+    risk_per_trade,
+    use_risk_sizing,
+):
+    """``run_bars`` for ``max_positions == 1`` with numpy ops per trade, not per bar.
+
+    With one position at a time the trades cannot overlap, so the loop
+    jumps from each entry straight to its exit bar and then to the next
+    usable signal at or after it (an exit and a new entry can share a bar,
+    as in ``run_bars``). Returns the same tuple, bit for bit.
+    """
+    n = close.shape[0]
+    candidates = np.flatnonzero((signal != 0) & ~np.isnan(sl_arr) & ~np.isnan(tp_arr))
+    m = candidates.shape[0]
+
+    out_side = np.empty(m, np.int8)
+    out_entry_bar = np.empty(m, np.int64)
+    out_exit_bar = np.empty(m, np.int64)
+    out_entry = np.empty(m, np.float64)
+    out_exit = np.empty(m, np.float64)
+    out_volume = np.empty(m, np.float64)
+    out_pnl = np.empty(m, np.float64)
+    out_sl = np.empty(m, np.float64)
+    out_tp = np.empty(m, np.float64)
+    out_reason = np.empty(m, np.int8)
+    n_closed = 0
+
+    equity_curve = np.empty(n, np.float64)
+    equity = capital
+    filled = 0  # equity_curve[:filled] is written
+    c = 0
+    while c < m:
+        i = candidates[c]
+        c += 1
+        side = 1 if signal[i] == 1 else -1
+        sl_price = sl_arr[i]
+        tp_price = tp_arr[i]
+        entry_price = close[i] + adjustment if side == 1 else close[i] - adjustment
+        if use_risk_sizing:
+            sl_distance = abs(entry_price - sl_price)
+            if sl_distance == 0:
+                continue
+            volume = max(equity * risk_per_trade * pip_value / sl_distance, 0.0)
+        else:
+            volume = 1.0
+        if not volume > 0:
+            continue
+
+        exit_bar, reason = _first_exit(high, low, i + 1, side, sl_price, tp_price)
+        stop = n if exit_bar < 0 else exit_bar
+        equity_curve[filled:i] = equity
+        equity_curve[i:stop] = equity + (close[i:stop] - entry_price) * side * volume / pip_value
+        if exit_bar < 0:
+            exit_bar = n - 1
+            exit_price = close[n - 1]
+        else:
+            exit_price = sl_price if reason == EXIT_SL else tp_price
+
+        pnl = (exit_price - entry_price) * side * volume / pip_value
+        out_side[n_closed] = side
+        out_entry_bar[n_closed] = i
+        out_exit_bar[n_closed] = exit_bar
+        out_entry[n_closed] = entry_price
+        out_exit[n_closed] = exit_price
+        out_volume[n_closed] = volume
+        out_pnl[n_closed] = pnl
+        out_sl[n_closed] = sl_price
+        out_tp[n_closed] = tp_price
+        out_reason[n_closed] = reason
+        n_closed += 1
+
+        if reason == EXIT_END:
+            filled = n
+            break
+        equity += pnl
+        filled = stop
+        c = np.searchsorted(candidates, stop, side="left")
+
+    equity_curve[filled:] = equity
+
+    return (
+        equity_curve,
+        out_side[:n_closed],
+        out_entry_bar[:n_closed],
+        out_exit_bar[:n_closed],
+        out_entry[:n_closed],
+        out_exit[:n_closed],
+        out_volume[:n_closed],
+        out_pnl[:n_closed],
+        out_sl[:n_closed],
+        out_tp[:n_closed],
+        out_reason[:n_closed],
+    )
+
+
+def _max_drawdown_numpy(equity):
+    """Vectorized fallback: running peak, then the deepest relative drop."""
+    running_max = np.maximum.accumulate(equity)
+    drawdown = np.divide(equity - running_max, running_max, out=np.zeros_like(equity), where=running_max != 0)
+    return abs(drawdown.min())
+
+
+def _max_drawdown_loop(equity):
+    # Fused single pass: no running-peak or drawdown arrays
+    peak = equity[0]
+    worst = 0.0
+    for v in equity:
+        if v > peak:
+            peak = v
+        if peak != 0:
+            dd = (v - peak) / peak
+            if dd < worst:
+                worst = dd
+    return abs(worst)
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: results must match the interpreted loop bit for bit
+    run_bars = njit(cache=True)(_run_bars)
+    max_drawdown = njit(cache=True)(_max_drawdown_loop)
+else:
+    run_bars = _run_bars
+    max_drawdown = _max_drawdown_numpy
@@ -1,6 +1,8 @@
 """Backtesting engine with SL/TP, position tracking, spread/slippage."""
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from typing import Any
 
 import numpy as np
 import pandas as pd
@@ -13,9 +15,16 @@ from config.settings import (
     SLIPPAGE_PIPS,
     SPREAD_PIPS,
 )
+from src.backtest._kernels import EXIT_REASONS, NUMBA_AVAILABLE, run_bars, run_vectorized
 
+TRADE_COLUMNS = [
+    "strategy_name", "symbol", "timeframe", "side",
+    "entry_time", "exit_time", "entry_price", "exit_price",
+    "volume", "pnl", "sl", "tp", "exit_reason",
+]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class BacktestConfig:
     capital: float = INITIAL_CAPITAL
     spread_pips: float = SPREAD_PIPS
@@ -25,18 +34,7 @@ class BacktestConfig:
     use_risk_sizing: bool = True
 
 
-@dataclass
-class Position:
-    side: str  # "BUY" or "SELL"
-    entry_time: object
-    entry_price: float
-    volume: float
-    sl: float
-    tp: float
-    bar_index: int
-
-
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     trades: pd.DataFrame
     equity_curve: pd.Series
@@ -71,88 +69,54 @@ class BacktestEngine:
 
         df = df.reset_index(drop=True)
 
-        # Pre-extract numpy arrays for speed
-        close = df["close"].values
-        high = df["high"].values
-        low = df["low"].values
-        signal = df["signal"].values
-        sl_arr = df["sl"].values
-        tp_arr = df["tp"].values
-        timestamps = df["timestamp"].values
-
-        equity = self.config.capital
-        open_positions: list[Position] = []
-        closed_trades: list[dict] = []
-        equity_curve: list[float] = []
-
-        n = len(df)
-        for i in range(n):
-            # Phase A: Check SL/TP on open positions
-            # SL checked before TP (conservative)
-            remaining = []
-            for pos in open_positions:
-                hit = self._check_exit(pos, high[i], low[i], close[i], timestamps[i])
-                if hit is not None:
-                    hit["strategy_name"] = self.strategy_name
-                    hit["symbol"] = self.symbol
-                    hit["timeframe"] = self.timeframe
-                    equity += hit["pnl"]
-                    closed_trades.append(hit)
-                else:
-                    remaining.append(pos)
-            open_positions = remaining
-
-            # Phase B: Process new signals
-            sig = int(signal[i]) if not np.isnan(signal[i]) else 0
-            if sig != 0 and len(open_positions) < self.config.max_positions:
-                sl_price = sl_arr[i]
-                tp_price = tp_arr[i]
-                if not np.isnan(sl_price) and not np.isnan(tp_price):
-                    side = "BUY" if sig == 1 else "SELL"
-                    entry_price = self._apply_spread_slippage(close[i], side)
-                    volume = self._calculate_volume(equity, entry_price, sl_price, side)
-                    if volume > 0:
-                        open_positions.append(Position(
-                            side=side,
-                            entry_time=timestamps[i],
-                            entry_price=entry_price,
-                            volume=volume,
-                            sl=sl_price,
-                            tp=tp_price,
-                            bar_index=i,
-                        ))
-
-            # Phase C: Record mark-to-market equity
-            mtm = equity
-            for pos in open_positions:
-                mtm += self._unrealized_pnl(pos, close[i])
-            equity_curve.append(mtm)
-
-        # End: close remaining positions at last close
-        for pos in open_positions:
-            exit_price = close[-1]
-            pnl = self._calc_pnl(pos, exit_price)
-            closed_trades.append({
+        # Contiguous float64 arrays for the bar loop
+        close = df["close"].to_numpy(dtype=np.float64)
+        high = df["high"].to_numpy(dtype=np.float64)
+        low = df["low"].to_numpy(dtype=np.float64)
+        sl_arr = df["sl"].to_numpy(dtype=np.float64)
+        tp_arr = df["tp"].to_numpy(dtype=np.float64)
+        # NaN -> 0, then truncate like int()
+        signal = np.nan_to_num(df["signal"].to_numpy(dtype=np.float64), nan=0.0).astype(np.int64)
+        timestamps = df["timestamp"].to_numpy(dtype="datetime64[ns]")
+
+        cfg = self.config
+        adjustment = (cfg.spread_pips + cfg.slippage_pips) * self.pip_value
+        if cfg.max_positions == 1 and not NUMBA_AVAILABLE:
+            # Non-overlapping trades: step from trade to trade, not bar to bar
+            out = run_vectorized(
+                close, high, low, signal, sl_arr, tp_arr,
+                float(cfg.capital), adjustment, self.pip_value,
+                float(cfg.risk_per_trade), bool(cfg.use_risk_sizing),
+            )
+        else:
+            out = run_bars(
+                close, high, low, signal, sl_arr, tp_arr,
+                float(cfg.capital), adjustment, self.pip_value,
+                float(cfg.risk_per_trade), int(cfg.max_positions), bool(cfg.use_risk_sizing),
+            )
+        (
+            equity_curve, side, entry_bar, exit_bar, entry_price, exit_price,
+            volume, pnl, sl, tp, reason,
+        ) = out
+
+        if len(pnl):
+            trades_df = pd.DataFrame({
                 "strategy_name": self.strategy_name,
                 "symbol": self.symbol,
                 "timeframe": self.timeframe,
-                "side": pos.side,
-                "entry_time": pos.entry_time,
-                "exit_time": timestamps[-1],
-                "entry_price": pos.entry_price,
+                "side": np.where(side == 1, "BUY", "SELL").astype(object),
+                "entry_time": timestamps[entry_bar],
+                "exit_time": timestamps[exit_bar],
+                "entry_price": entry_price,
                 "exit_price": exit_price,
-                "volume": pos.volume,
+                "volume": volume,
                 "pnl": pnl,
-                "sl": pos.sl,
-                "tp": pos.tp,
-                "exit_reason": "END",
+                "sl": sl,
+                "tp": tp,
+                "exit_reason": np.array(EXIT_REASONS, dtype=object)[reason],
             })
-
-        trades_df = pd.DataFrame(closed_trades) if closed_trades else pd.DataFrame(
-            columns=["strategy_name", "symbol", "timeframe", "side",
-                     "entry_time", "exit_time", "entry_price", "exit_price",
-                     "volume", "pnl", "sl", "tp", "exit_reason"]
-        )
+        else:
+            trades_df = pd.DataFrame(columns=TRADE_COLUMNS)
 
         return BacktestResult(
             trades=trades_df,
@@ -160,87 +124,57 @@ class BacktestEngine:
             initial_capital=self.config.capital,
         )
 
-    def _check_exit(
-        self,
-        pos: Position,
-        bar_high: float,
-        bar_low: float,
-        bar_close: float,
-        timestamp: object,
-    ) -> dict | None:
-        """Check if SL or TP is hit. SL checked first (conservative)."""
-        if pos.side == "BUY":
-            # SL hit if low touches SL
-            if bar_low <= pos.sl:
-                return self._build_trade(pos, pos.sl, timestamp, "SL")
-            # TP hit if high touches TP
-            if bar_high >= pos.tp:
-                return self._build_trade(pos, pos.tp, timestamp, "TP")
-        else:  # SELL
-            # SL hit if high touches SL
-            if bar_high >= pos.sl:
-                return self._build_trade(pos, pos.sl, timestamp, "SL")
-            # TP hit if low touches TP
-            if bar_low <= pos.tp:
-                return self._build_trade(pos, pos.tp, timestamp, "TP")
-        return None
-
-    def _build_trade(
-        self,
-        pos: Position,
-        exit_price: float,
-        timestamp: object,
-        reason: str,
-    ) -> dict:
-        pnl = self._calc_pnl(pos, exit_price)
-        return {
-            "side": pos.side,
-            "entry_time": pos.entry_time,
-            "exit_time": timestamp,
-            "entry_price": pos.entry_price,
-            "exit_price": exit_price,
-            "volume": pos.volume,
-            "pnl": pnl,
-            "sl": pos.sl,
-            "tp": pos.tp,
-            "exit_reason": reason,
-        }
-
-    def _calc_pnl(self, pos: Position, exit_price: float) -> float:
-        if pos.side == "BUY":
-            return (exit_price - pos.entry_price) * pos.volume / self.pip_value
-        else:
-            return (pos.entry_price - exit_price) * pos.volume / self.pip_value
-
-    def _unrealized_pnl(self, pos: Position, current_price: float) -> float:
-        return self._calc_pnl(pos, current_price)
 
-    def _apply_spread_slippage(self, price: float, side: str) -> float:
-        """Apply adverse spread and slippage to entry price."""
-        total_pips = self.config.spread_pips + self.config.slippage_pips
-        adjustment = total_pips * self.pip_value
-        if side == "BUY":
-            return price + adjustment  # buy at higher price
-        else:
-            return price - adjustment  # sell at lower price
-
-    def _calculate_volume(
-        self,
-        equity: float,
-        entry_price: float,
-        sl_price: float,
-        side: str,
-    ) -> float:
-        """Calculate position volume based on risk sizing."""
-        if not self.config.use_risk_sizing:
-            return 1.0
-
-        risk_amount = equity * self.config.risk_per_trade
-        sl_distance = abs(entry_price - sl_price)
-
-        if sl_distance == 0:
-            return 0.0
-
-        # Volume in units such that PnL = (price_move / pip_value) * volume
-        volume = risk_amount * self.pip_value / sl_distance
-        return max(volume, 0.0)
+# Per-process frames and run settings, installed once per pool worker by _init_worker
+_worker_ctx: dict[str, Any] = {}
+
+
+def _run_one(task: tuple[str, int], ctx: dict[str, Any]) -> BacktestResult:
+    symbol, config_index = task
+    engine = BacktestEngine(
+        config=ctx["configs"][config_index], symbol=symbol,
+        timeframe=ctx["timeframe"], strategy_name=ctx["strategy_name"],
+    )
+    return engine.run(ctx["df_by_symbol"][symbol])
+
+
+def _init_worker(ctx: dict[str, Any]) -> None:
+    """Pool initializer: receive the frames once per worker, not once per task."""
+    _worker_ctx.update(ctx)
+
+
+def _run_one_in_worker(task: tuple[str, int]) -> BacktestResult:
+    return _run_one(task, _worker_ctx)
+
+
+def run_grid(
+    df_by_symbol: dict[str, pd.DataFrame],
+    configs: list[BacktestConfig],
+    timeframe: str = "1h",
+    strategy_name: str = "unknown",
+    max_workers: int = 4,
+) -> dict[tuple[str, int], BacktestResult]:
+    """Backtest every symbol's signal frame under every config.
+
+    Each run is path dependent on its own, but the runs are independent of
+    each other, so they are spread over worker processes. Results are keyed
+    by ``(symbol, index into configs)``.
+    """
+    tasks = [(symbol, i) for symbol in df_by_symbol for i in range(len(configs))]
+    ctx = {
+        "df_by_symbol": df_by_symbol,
+        "configs": list(configs),
+        "timeframe": timeframe,
+        "strategy_name": strategy_name,
+    }
+
+    # Use sequential for small grids, parallel for large
+    if len(tasks) <= 4 or max_workers <= 1:
+        results = [_run_one(task, ctx) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(ctx,),
+        ) as executor:
+            chunksize = max(1, len(tasks) // (max_workers * 4))
+            results = list(executor.map(_run_one_in_worker, tasks, chunksize=chunksize))
+    return dict(zip(tasks, results))
@@ -5,8 +5,10 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from src.backtest._kernels import max_drawdown as peak_drawdown
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class BacktestMetrics:
     total_trades: int
     winning_trades: int
@@ -26,6 +28,13 @@ class BacktestMetrics:
     final_capital: float
 
 
+def _as_datetime64(col: pd.Series) -> np.ndarray:
+    """``col`` as datetime64[ns]; only parses when it isn't a datetime column already."""
+    if not pd.api.types.is_datetime64_any_dtype(col):
+        col = pd.to_datetime(col)
+    return col.to_numpy(dtype="datetime64[ns]")
+
+
 def calculate_metrics(
     trades_df: pd.DataFrame,
     equity_curve: pd.Series,
@@ -52,27 +61,32 @@ def calculate_metrics(
             final_capital=initial_capital,
         )
 
-    pnl = trades_df["pnl"]
-    total_trades = len(trades_df)
-    winning = pnl[pnl > 0]
-    losing = pnl[pnl < 0]
+    # One ndarray and two masks; Series boolean indexing allocates per op
+    pnl = trades_df["pnl"].to_numpy(dtype=np.float64)
+    total_trades = len(pnl)
+    win_mask = pnl > 0
+    loss_mask = pnl < 0
+    winning = pnl[win_mask]
+    losing = pnl[loss_mask]
     winning_trades = len(winning)
     losing_trades = len(losing)
 
-    win_rate = winning_trades / total_trades if total_trades > 0 else 0.0
+    win_rate = winning_trades / total_trades
     total_pnl = pnl.sum()
     final_capital = initial_capital + total_pnl
     return_pct = (total_pnl / initial_capital) * 100 if initial_capital > 0 else 0.0
 
-    gross_profit = winning.sum() if len(winning) > 0 else 0.0
-    gross_loss = abs(losing.sum()) if len(losing) > 0 else 0.0
+    gross_profit = winning.sum() if winning_trades > 0 else 0.0
+    gross_loss = abs(losing.sum()) if losing_trades > 0 else 0.0
     profit_factor = gross_profit / gross_loss if gross_loss > 0 else float("inf") if gross_profit > 0 else 0.0
 
+    avg_trade_pnl = total_pnl / total_trades
+
     # Sharpe ratio (annualized, assuming hourly bars -> ~252*24 periods/year)
-    if len(pnl) > 1:
-        pnl_std = pnl.std()
+    if total_trades > 1:
+        pnl_std = pnl.std(ddof=1)
         if pnl_std > 0:
-            sharpe_ratio = (pnl.mean() / pnl_std) * np.sqrt(252)
+            sharpe_ratio = (avg_trade_pnl / pnl_std) * np.sqrt(252)
         else:
             sharpe_ratio = 0.0
     else:
@@ -80,28 +94,26 @@ def calculate_metrics(
 
     # Max drawdown from equity curve
     if len(equity_curve) > 0:
-        running_max = equity_curve.cummax()
-        drawdown = (equity_curve - running_max) / running_max
-        max_drawdown = abs(drawdown.min()) if len(drawdown) > 0 else 0.0
+        max_drawdown = peak_drawdown(equity_curve.to_numpy(dtype=np.float64))
     else:
         max_drawdown = 0.0
 
-    avg_trade_pnl = pnl.mean() if total_trades > 0 else 0.0
-
     # Expectancy = (win_rate * avg_win) - (loss_rate * avg_loss)
-    avg_win = winning.mean() if len(winning) > 0 else 0.0
-    avg_loss = abs(losing.mean()) if len(losing) > 0 else 0.0
-    loss_rate = losing_trades / total_trades if total_trades > 0 else 0.0
+    avg_win = gross_profit / winning_trades if winning_trades > 0 else 0.0
+    avg_loss = gross_loss / losing_trades if losing_trades > 0 else 0.0
+    loss_rate = losing_trades / total_trades
     expectancy = (win_rate * avg_win) - (loss_rate * avg_loss)
 
     # Average trade duration
     avg_duration = None
     if "entry_time" in trades_df.columns and "exit_time" in trades_df.columns:
-        durations = pd.to_datetime(trades_df["exit_time"]) - pd.to_datetime(trades_df["entry_time"])
-        avg_duration = durations.mean()
+        durations = _as_datetime64(trades_df["exit_time"]) - _as_datetime64(trades_df["entry_time"])
+        durations = durations[~np.isnat(durations)]
+        if len(durations):
+            avg_duration = pd.Timedelta(durations.mean())
 
-    best_trade = pnl.max() if total_trades > 0 else 0.0
-    worst_trade = pnl.min() if total_trades > 0 else 0.0
+    best_trade = pnl.max()
+    worst_trade = pnl.min()
 
     return BacktestMetrics(
         total_trades=total_trades,
@@ -10,7 +10,7 @@ class OrderSide(Enum):
     SELL = "SELL"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderResult:
     order_id: str
     symbol: str
@@ -41,7 +41,8 @@ class Broker(ABC):
         ...
 
     @abstractmethod
-    def get_closed_trades(self) -> list[dict]:
+    def get_closed_trades(self, limit: int | None = None) -> list[dict]:
+        """Closed trades; ``limit`` caps the result to the most recent ones."""
         ...
 
     def update_price(self, symbol: str, bid: float, ask: float) -> None:
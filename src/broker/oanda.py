@@ -2,14 +2,16 @@
 
 import time
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from config.settings import (
     INITIAL_CAPITAL,
     OANDA_ACCOUNT_ID,
     OANDA_API_TOKEN,
+    OANDA_BASE,
     OANDA_BASE_URL,
-    OANDA_ENVIRONMENT,
     OANDA_SYMBOL_MAP,
     PIP_VALUES,
     RISK_PER_TRADE,
@@ -29,24 +31,36 @@ class OandaBroker(Broker):
         self,
         account_id: str = OANDA_ACCOUNT_ID,
         api_token: str = OANDA_API_TOKEN,
-        environment: str = OANDA_ENVIRONMENT,
+        environment: str | None = None,
         risk_per_trade: float = RISK_PER_TRADE,
     ) -> None:
         self._account_id = account_id
         self._api_token = api_token
-        self._base_url = OANDA_BASE_URL[environment]
+        # None -> the configured OANDA_ENVIRONMENT, whose URL is resolved once in settings
+        self._base_url = OANDA_BASE if environment is None else OANDA_BASE_URL[environment]
         self._risk_per_trade = risk_per_trade
+        self._symbols: dict[str, tuple[str, float]] = {}
         self._headers = {
             "Authorization": f"Bearer {api_token}",
             "Content-Type": "application/json",
         }
+        # One keep-alive pool so an order and the account refresh after it
+        # don't each pay a TCP + TLS handshake. Retries stay in _api.
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
     @property
     def server_managed_sl_tp(self) -> bool:
         return True
 
-    def _instrument(self, symbol: str) -> str:
-        return OANDA_SYMBOL_MAP.get(symbol, symbol)
+    def _symbol_info(self, symbol: str) -> tuple[str, float]:
+        """``(OANDA instrument, pip value)`` for ``symbol``, resolved once per symbol."""
+        info = self._symbols.get(symbol)
+        if info is None:
+            info = (OANDA_SYMBOL_MAP.get(symbol, symbol), PIP_VALUES.get(symbol, 0.0001))
+            self._symbols[symbol] = info
+        return info
 
     def _api(
         self, method: str, path: str, json_data: dict | None = None, max_retries: int = 3
@@ -56,11 +70,10 @@ class OandaBroker(Broker):
 
         for attempt in range(max_retries):
             try:
-                resp = requests.request(
-                    method, url, headers=self._headers, json=json_data, timeout=30,
-                )
+                body = None if json_data is None else orjson.dumps(json_data)
+                resp = self._session.request(method, url, data=body, timeout=30)
                 resp.raise_for_status()
-                return resp.json()
+                return orjson.loads(resp.content)
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
                 last_exc = e
                 log.warning("oanda_api_retry", attempt=attempt + 1, error=str(e))
@@ -82,8 +95,7 @@ class OandaBroker(Broker):
     def place_order(
         self, symbol: str, side: OrderSide, volume: float, sl: float, tp: float
     ) -> OrderResult:
-        instrument = self._instrument(symbol)
-        pip_value = PIP_VALUES.get(symbol, 0.0001)
+        instrument, pip_value = self._symbol_info(symbol)
 
         # Risk-based sizing when volume=0
         if volume == 0:
@@ -221,8 +233,10 @@ class OandaBroker(Broker):
             "margin_available": float(acct.get("marginAvailable", 0)),
         }
 
-    def get_closed_trades(self) -> list[dict]:
-        data = self._api("GET", "/trades?state=CLOSED&count=100")
+    def get_closed_trades(self, limit: int | None = None) -> list[dict]:
+        # OANDA caps count at 500
+        count = 100 if limit is None else max(1, min(limit, 500))
+        data = self._api("GET", f"/trades?state=CLOSED&count={count}")
         trades = data.get("trades", [])
         result = []
         for t in trades:
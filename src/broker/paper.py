@@ -11,6 +11,7 @@ from config.settings import (
     MAX_OPEN_POSITIONS,
     PIP_VALUES,
     RISK_PER_TRADE,
+    SLIPPAGE_BY_SYMBOL,
     SLIPPAGE_PIPS,
     SPREAD_PIPS,
 )
@@ -20,7 +21,7 @@ from src.utils.logger import get_logger
 log = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperPosition:
     order_id: str
     symbol: str
@@ -30,6 +31,10 @@ class PaperPosition:
     sl: float
     tp: float
     entry_time: object
+    side_sign: int = field(init=False)  # +1 long, -1 short
+
+    def __post_init__(self) -> None:
+        self.side_sign = 1 if self.side == OrderSide.BUY else -1
 
 
 class PaperBroker(Broker):
@@ -39,19 +44,25 @@ class PaperBroker(Broker):
         self,
         symbol: str = "EURUSD=X",
         capital: float = INITIAL_CAPITAL,
-        spread_pips: float = SPREAD_PIPS,
-        slippage_pips: float = SLIPPAGE_PIPS,
+        spread_pips: float | None = None,
+        slippage_pips: float | None = None,
         risk_per_trade: float = RISK_PER_TRADE,
         max_positions: int = MAX_OPEN_POSITIONS,
     ) -> None:
         self.symbol = symbol
         self._capital = capital
         self._initial_capital = capital
-        self._spread_pips = spread_pips
-        self._slippage_pips = slippage_pips
         self._risk_per_trade = risk_per_trade
         self._max_positions = max_positions
         self._pip_value = PIP_VALUES.get(symbol, 0.0001)
+        self._spread_pips = SPREAD_PIPS if spread_pips is None else spread_pips
+        self._slippage_pips = SLIPPAGE_PIPS if slippage_pips is None else slippage_pips
+        # Fill offset in price units; the settings default is pre-scaled per symbol
+        self._slippage = (
+            SLIPPAGE_BY_SYMBOL.get(symbol, SLIPPAGE_PIPS * self._pip_value)
+            if slippage_pips is None
+            else slippage_pips * self._pip_value
+        )
 
         self._lock = threading.Lock()
         self._order_counter = 0
@@ -61,8 +72,10 @@ class PaperBroker(Broker):
 
     def update_price(self, symbol: str, bid: float, ask: float) -> None:
         """Update current market price for a symbol."""
-        with self._lock:
-            self._current_prices[symbol] = {"bid": bid, "ask": ask}
+        # Lock-free: each quote is a fresh dict stored with one atomic setitem
+        # and never mutated, so readers see either the old or the new quote
+        # and the tick path doesn't wait on order or account calls
+        self._current_prices[symbol] = {"bid": bid, "ask": ask}
 
     def place_order(
         self, symbol: str, side: OrderSide, volume: float, sl: float, tp: float
@@ -94,7 +107,7 @@ class PaperBroker(Broker):
                 )
 
             # Fill price with slippage
-            slippage = self._slippage_pips * self._pip_value
+            slippage = self._slippage
             if side == OrderSide.BUY:
                 fill_price = prices["ask"] + slippage
             else:
@@ -255,9 +268,12 @@ class PaperBroker(Broker):
                 "total_pnl": self._capital - self._initial_capital,
             }
 
-    def get_closed_trades(self) -> list[dict]:
+    def get_closed_trades(self, limit: int | None = None) -> list[dict]:
         with self._lock:
-            return list(self._closed_trades)
+            # Slice under the lock so tail reads don't copy the whole history
+            if limit is None:
+                return list(self._closed_trades)
+            return self._closed_trades[-limit:] if limit > 0 else []
 
     @property
     def _equity(self) -> float:
@@ -272,10 +288,7 @@ class PaperBroker(Broker):
 
     def _calc_pnl(self, pos: PaperPosition, exit_price: float) -> float:
         """Calculate PnL — same formula as BacktestEngine."""
-        if pos.side == OrderSide.BUY:
-            return (exit_price - pos.entry_price) * pos.volume / self._pip_value
-        else:
-            return (pos.entry_price - exit_price) * pos.volume / self._pip_value
+        return (exit_price - pos.entry_price) * pos.side_sign * pos.volume / self._pip_value
 
     def _calculate_volume(self, entry_price: float, sl_price: float, side: OrderSide) -> float:
         """Risk-based position sizing — same formula as BacktestEngine."""
@@ -0,0 +1,120 @@
+"""Recursive indicator kernels, JIT-compiled when numba is installed.
+
+The exponential averages are ports of pandas' ``ewm(...).mean()`` recurrence
+(``ignore_na=False``), step for step, so compiled results match the pandas
+indicators bit for bit. ``rsi`` and ``atr`` fuse the diff / true range with
+their averages in a single pass instead of materializing the intermediates.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def span_alpha(span: float) -> float:
+    """``ewm(span=...)`` smoothing factor, derived the way pandas does it."""
+    return 1.0 / (1.0 + (span - 1) / 2)
+
+
+def com_alpha(alpha: float) -> float:
+    """``ewm(alpha=...)`` smoothing factor after pandas' round trip through com."""
+    return 1.0 / (1.0 + (1 - alpha) / alpha)
+
+
+def _ewm_step(weighted, old_wt, cur, alpha, adjust):
+    """Advance one ``ewm`` observation; returns ``(weighted, old_wt)``."""
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if cur == cur:
+            new_wt = 1.0 if adjust else alpha
+            if weighted != cur:
+                weighted = (old_wt * weighted + new_wt * cur) / (old_wt + new_wt)
+            if adjust:
+                old_wt += new_wt
+            else:
+                old_wt = 1.0
+    elif cur == cur:
+        weighted = cur
+    return weighted, old_wt
+
+
+def _ewm(x, alpha, adjust, min_periods):
+    """``Series.ewm(alpha=alpha, adjust=adjust, min_periods=min_periods).mean()``."""
+    n = x.shape[0]
+    out = np.empty(n, np.float64)
+    min_periods = max(min_periods, 1)
+    weighted = np.nan
+    old_wt = 1.0
+    nobs = 0
+    for i in range(n):
+        cur = x[i]
+        if cur == cur:
+            nobs += 1
+        weighted, old_wt = _ewm_step(weighted, old_wt, cur, alpha, adjust)
+        out[i] = weighted if nobs >= min_periods else np.nan
+    return out
+
+
+def _rsi(close, alpha, period):
+    """Wilder RSI: diff, gain/loss split and both averages in one pass."""
+    n = close.shape[0]
+    out = np.empty(n, np.float64)
+    gain_avg = loss_avg = np.nan
+    gain_wt = loss_wt = 1.0
+    nobs = 0
+    prev = np.nan
+    for i in range(n):
+        delta = close[i] - prev
+        prev = close[i]
+        if delta == delta:
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            nobs += 1
+        else:
+            gain = loss = np.nan
+        gain_avg, gain_wt = _ewm_step(gain_avg, gain_wt, gain, alpha, True)
+        loss_avg, loss_wt = _ewm_step(loss_avg, loss_wt, loss, alpha, True)
+        if nobs < period:
+            out[i] = np.nan
+        elif loss_avg == 0:
+            # gain/0 is inf (RSI 100) unless the gain is 0 too (NaN)
+            out[i] = np.nan if gain_avg == 0 else 100.0
+        else:
+            out[i] = 100 - 100 / (1 + gain_avg / loss_avg)
+    return out
+
+
+def _atr(high, low, close, alpha, period):
+    """Wilder ATR with the true range computed inline."""
+    n = close.shape[0]
+    out = np.empty(n, np.float64)
+    avg = np.nan
+    wt = 1.0
+    nobs = 0
+    prev_close = np.nan
+    for i in range(n):
+        # Row max of (h-l, |h-pc|, |l-pc|) skipping NaN, like DataFrame.max(axis=1)
+        tr = np.nan
+        for v in (high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close)):
+            if v == v and not (tr >= v):
+                tr = v
+        prev_close = close[i]
+        if tr == tr:
+            nobs += 1
+        avg, wt = _ewm_step(avg, wt, tr, alpha, True)
+        out[i] = avg if nobs >= period else np.nan
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: indicator values feed threshold comparisons in the
+    # strategies and must not drift from the pandas implementation
+    _ewm_step = njit(cache=True, inline="always")(_ewm_step)
+    ewm_mean = njit(cache=True)(_ewm)
+    rsi_kernel = njit(cache=True)(_rsi)
+    atr_kernel = njit(cache=True)(_atr)
@@ -1,10 +1,12 @@
+import threading
 import time
+from datetime import datetime
 from typing import Callable
 
 import numpy as np
 import pandas as pd
 
-from src.data.feed import DataFeed
+from src.data.feed import DataFeed, to_utc
 from src.utils.logger import get_logger
 
 log = get_logger(__name__)
@@ -35,16 +37,24 @@ BASE_PRICES = {
 }
 DEFAULT_BASE = 1.1000
 
+# yf.download resets and then reads module globals (yfinance.shared._DFS /
+# _ERRORS, keyed by ticker only) on every call, so concurrent downloads can
+# return another call's frame; only one download may run at a time
+_YF_LOCK = threading.Lock()
 
-def _try_yfinance(symbol: str, start: str, end: str, interval: str) -> pd.DataFrame:
+
+def _try_yfinance(
+    symbol: str, start: str | datetime, end: str | datetime, interval: str
+) -> pd.DataFrame:
     """Attempt to fetch from yfinance; return empty DataFrame on failure."""
     try:
         import yfinance as yf
 
-        df = yf.download(
-            symbol, start=start, end=end, interval=interval,
-            progress=False, auto_adjust=True,
-        )
+        with _YF_LOCK:
+            df = yf.download(
+                symbol, start=start, end=end, interval=interval,
+                progress=False, auto_adjust=True,
+            )
         if df.empty:
             return pd.DataFrame()
 
@@ -56,7 +66,7 @@ def _try_yfinance(symbol: str, start: str, end: str, interval: str) -> pd.DataFr
             "Low": "low", "Close": "close", "Volume": "volume",
         })
         df.index.name = "timestamp"
-        df = df[["open", "high", "low", "close", "volume"]].copy()
+        df = df[["open", "high", "low", "close", "volume"]]
         if df.index.tz is not None:
             df.index = df.index.tz_convert("UTC").tz_localize(None)
         return df
@@ -66,13 +76,16 @@ def _try_yfinance(symbol: str, start: str, end: str, interval: str) -> pd.DataFr
 
 
 def _generate_synthetic(
-    symbol: str, start: str, end: str, freq: str
+    symbol: str, start: str | datetime, end: str | datetime, freq: str
 ) -> pd.DataFrame:
     """Generate realistic synthetic OHLCV data using geometric Brownian motion."""
     base_price = BASE_PRICES.get(symbol, DEFAULT_BASE)
     rng = np.random.default_rng(seed=hash(symbol) & 0xFFFFFFFF)
 
-    idx = pd.date_range(start=start, end=end, freq=freq)
+    # Naive UTC, aligned to bar boundaries even when start is an arbitrary datetime
+    start_ts = to_utc(start).tz_localize(None).floor(freq)
+    end_ts = to_utc(end).tz_localize(None)
+    idx = pd.date_range(start=start_ts, end=end_ts, freq=freq)
     # Filter to weekdays for forex (Mon-Fri)
     idx = idx[idx.weekday < 5]
 
@@ -82,23 +95,35 @@ def _generate_synthetic(
     n = len(idx)
     # GBM parameters scaled by timeframe
     volatility = 0.0008 if base_price < 10 else 0.08
-    returns = rng.normal(0, volatility, n)
-    close = base_price * np.exp(np.cumsum(returns))
-
-    high_offset = np.abs(rng.normal(0, volatility * 0.5, n))
-    low_offset = np.abs(rng.normal(0, volatility * 0.5, n))
-    high = close * (1 + high_offset)
-    low = close * (1 - low_offset)
-    open_ = low + rng.random(n) * (high - low)
-    volume = rng.integers(100, 10000, size=n).astype(float)
-
-    df = pd.DataFrame({
-        "open": open_,
-        "high": high,
-        "low": low,
-        "close": close,
-        "volume": volume,
-    }, index=idx)
+    # One column-major block that becomes the frame's only block without a
+    # copy; every series is computed in place in its column
+    block = np.empty((n, 5), dtype=np.float64, order="F")
+    open_, high, low, close, volume = block.T
+    scratch = np.empty(n, dtype=np.float64)
+
+    rng.standard_normal(n, out=scratch)
+    scratch *= volatility
+    scratch.cumsum(out=close)
+    np.exp(close, out=close)
+    close *= base_price
+
+    rng.standard_normal(n, out=scratch)
+    scratch *= volatility * 0.5
+    np.abs(scratch, out=scratch)
+    scratch += 1
+    np.multiply(close, scratch, out=high)
+    rng.standard_normal(n, out=scratch)
+    scratch *= volatility * 0.5
+    np.abs(scratch, out=scratch)
+    np.subtract(1, scratch, out=scratch)
+    np.multiply(close, scratch, out=low)
+    rng.random(n, out=scratch)
+    np.subtract(high, low, out=open_)
+    open_ *= scratch
+    open_ += low
+    volume[:] = rng.integers(100, 10000, size=n)
+
+    df = pd.DataFrame(block, index=idx, columns=["open", "high", "low", "close", "volume"], copy=False)
     df.index.name = "timestamp"
     return df
 
@@ -110,8 +135,8 @@ class DemoFeed(DataFeed):
         self,
         symbol: str,
         timeframe: str,
-        start: str,
-        end: str,
+        start: str | datetime,
+        end: str | datetime,
     ) -> pd.DataFrame:
         yf_interval = TIMEFRAME_MAP.get(timeframe, timeframe)
         freq = TIMEFRAME_FREQ.get(timeframe, "h")
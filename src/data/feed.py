@@ -1,9 +1,18 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Callable
 
 import pandas as pd
 
 
+def to_utc(value: str | datetime) -> pd.Timestamp:
+    """Coerce a date string or datetime to a tz-aware UTC Timestamp (naive input is taken as UTC)."""
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
 class DataFeed(ABC):
     """Abstract base class for market data feeds."""
 
@@ -12,14 +21,37 @@ class DataFeed(ABC):
         self,
         symbol: str,
         timeframe: str,
-        start: str,
-        end: str,
+        start: str | datetime,
+        end: str | datetime,
     ) -> pd.DataFrame:
         """Fetch historical OHLCV candles.
 
+        ``start``/``end`` may be date strings or datetimes; naive values are UTC.
+
         Returns DataFrame with columns: timestamp, open, high, low, close, volume
         """
 
+    def get_historical_batch(
+        self,
+        symbols: Sequence[str],
+        timeframe: str,
+        start: str | datetime,
+        end: str | datetime,
+    ) -> dict[str, pd.DataFrame]:
+        """Fetch historical candles for several symbols concurrently.
+
+        Returns {symbol: DataFrame} in the order of ``symbols``. Feeds whose
+        backend is not thread-safe should override this with a serial loop.
+        """
+        if not symbols:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(symbols)) as pool:
+            frames = pool.map(
+                lambda symbol: self.get_historical(symbol, timeframe, start, end),
+                symbols,
+            )
+            return dict(zip(symbols, frames))
+
     @abstractmethod
     def stream_prices(self, symbol: str, callback: Callable[[dict], None]) -> None:
         """Stream real-time price updates. Calls callback with
@@ -0,0 +1,65 @@
+"""On-disk memoization of add_all_indicators for repeated backtests on the same candles."""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from config.settings import INDICATOR_CACHE_DIR
+from src.data.indicators import add_all_indicators
+from src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+_OHLCV = ["timestamp", "open", "high", "low", "close", "volume"]
+
+
+def _cache_key(df: pd.DataFrame, params: dict) -> str:
+    """Hash the candle contents plus indicator parameters.
+
+    Hashing the data itself (not just its first/last timestamps and length)
+    keeps yfinance and synthetic frames covering the same range apart.
+    """
+    cols = [c for c in _OHLCV if c in df.columns]
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pd.util.hash_pandas_object(df[cols], index=False).to_numpy().tobytes())
+    h.update(repr(sorted(params.items())).encode())
+    return h.hexdigest()
+
+
+def cached_add_all_indicators(
+    df: pd.DataFrame,
+    cache_dir: str | Path | None = None,
+    **params,
+) -> pd.DataFrame:
+    """``add_all_indicators`` backed by a pickle cache under INDICATOR_CACHE_DIR.
+
+    Any cache read/write failure falls back to computing the indicators.
+    """
+    cache_dir = INDICATOR_CACHE_DIR if cache_dir is None else cache_dir
+    if not cache_dir or df.empty:
+        return add_all_indicators(df, **params)
+
+    path = Path(cache_dir) / f"{_cache_key(df, params)}.pkl"
+    try:
+        result = pd.read_pickle(path)
+        log.debug("indicator_cache_hit", key=path.stem)
+        return result
+    except FileNotFoundError:
+        pass
+    except Exception:
+        log.warning("indicator_cache_unreadable", path=str(path))
+
+    result = add_all_indicators(df, **params)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so parallel workers never read a half-written file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            result.to_pickle(fh)
+        os.replace(tmp, path)
+    except OSError:
+        log.warning("indicator_cache_write_failed", path=str(path))
+    return result
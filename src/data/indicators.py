@@ -1,10 +1,29 @@
 """Vectorized technical indicators operating on pandas DataFrames."""
 
+import os
+from collections import deque
+
 import numpy as np
 import pandas as pd
 
+from src.data import _indicator_kernels as _kernels
+
+try:
+    import numexpr as ne
+
+    ne.set_num_threads(os.cpu_count() or 1)
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# numexpr's threading and cache blocking only beat plain NumPy on longer series
+_NUMEXPR_MIN_ROWS = 10_000
+
 
 def ema(series: pd.Series, period: int) -> pd.Series:
+    if _kernels.NUMBA_AVAILABLE:
+        values = _kernels.ewm_mean(series.to_numpy(dtype=np.float64), _kernels.span_alpha(period), False, 0)
+        return pd.Series(values, index=series.index, name=series.name)
     return series.ewm(span=period, adjust=False).mean()
 
 
@@ -13,11 +32,17 @@ def sma(series: pd.Series, period: int) -> pd.Series:
 
 
 def rsi(close: pd.Series, period: int = 14) -> pd.Series:
+    if _kernels.NUMBA_AVAILABLE:
+        values = _kernels.rsi_kernel(close.to_numpy(dtype=np.float64), _kernels.com_alpha(1 / period), period)
+        return pd.Series(values, index=close.index)
     delta = close.diff()
     gain = delta.clip(lower=0)
     loss = -delta.clip(upper=0)
     avg_gain = gain.ewm(alpha=1 / period, min_periods=period).mean()
     avg_loss = loss.ewm(alpha=1 / period, min_periods=period).mean()
+    if NUMEXPR_AVAILABLE and len(close) >= _NUMEXPR_MIN_ROWS:
+        g, lo = avg_gain.to_numpy(), avg_loss.to_numpy()
+        return pd.Series(ne.evaluate("100 - 100 / (1 + g / lo)"), index=close.index)
     rs = avg_gain / avg_loss
     return 100 - (100 / (1 + rs))
 
@@ -47,8 +72,13 @@ def bollinger_bands(
 ) -> pd.DataFrame:
     middle = sma(close, period)
     rolling_std = close.rolling(window=period).std()
-    upper = middle + std_dev * rolling_std
-    lower = middle - std_dev * rolling_std
+    if NUMEXPR_AVAILABLE and len(close) >= _NUMEXPR_MIN_ROWS:
+        m, sd = middle.to_numpy(), rolling_std.to_numpy()
+        upper = pd.Series(ne.evaluate("m + std_dev * sd"), index=close.index)
+        lower = pd.Series(ne.evaluate("m - std_dev * sd"), index=close.index)
+    else:
+        upper = middle + std_dev * rolling_std
+        lower = middle - std_dev * rolling_std
     return pd.DataFrame({
         "bb_upper": upper,
         "bb_middle": middle,
@@ -62,23 +92,41 @@ def atr(
     close: pd.Series,
     period: int = 14,
 ) -> pd.Series:
-    prev_close = close.shift(1)
-    tr = pd.concat([
-        high - low,
-        (high - prev_close).abs(),
-        (low - prev_close).abs(),
-    ], axis=1).max(axis=1)
+    if _kernels.NUMBA_AVAILABLE:
+        values = _kernels.atr_kernel(
+            high.to_numpy(dtype=np.float64), low.to_numpy(dtype=np.float64),
+            close.to_numpy(dtype=np.float64), _kernels.com_alpha(1 / period), period,
+        )
+        return pd.Series(values, index=close.index)
+    tr = pd.Series(_true_range(high, low, close), index=close.index)
     return tr.ewm(alpha=1 / period, min_periods=period).mean()
 
 
+def _true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> np.ndarray:
+    """max(h - l, |h - prev close|, |l - prev close|) per bar, skipping NaN terms."""
+    h = high.to_numpy(dtype=np.float64)
+    lo = low.to_numpy(dtype=np.float64)
+    c = close.to_numpy(dtype=np.float64)
+    prev_close = np.empty_like(c)
+    prev_close[:1] = np.nan
+    prev_close[1:] = c[:-1]
+    # fmax ignores NaN like DataFrame.max(axis=1), so bar 0 is just h - l
+    tr = np.fmax(h - lo, np.abs(h - prev_close))
+    return np.fmax(tr, np.abs(lo - prev_close), out=tr)
+
+
 def vwap(
     high: pd.Series,
     low: pd.Series,
     close: pd.Series,
     volume: pd.Series,
 ) -> pd.Series:
-    typical_price = (high + low + close) / 3
-    cum_tp_vol = (typical_price * volume).cumsum()
+    if NUMEXPR_AVAILABLE and len(close) >= _NUMEXPR_MIN_ROWS:
+        h, lo, c, v = high.to_numpy(), low.to_numpy(), close.to_numpy(), volume.to_numpy()
+        cum_tp_vol = pd.Series(ne.evaluate("(h + lo + c) / 3 * v"), index=close.index).cumsum()
+    else:
+        typical_price = (high + low + close) / 3
+        cum_tp_vol = (typical_price * volume).cumsum()
     cum_vol = volume.cumsum()
     return cum_tp_vol / cum_vol.replace(0, np.nan)
 
@@ -98,21 +146,214 @@ def add_all_indicators(
     if ema_periods is None:
         ema_periods = [9, 21, 50, 200]
 
-    df = df.copy()
-    df["rsi"] = rsi(df["close"], rsi_period)
+    close = df["close"]
+    # Collect the new columns and attach them in one concat, instead of a
+    # copy, two concats and an insert per column (each a full-frame copy)
+    emas: dict[int, pd.Series] = {}
+
+    def ema_of(p: int) -> pd.Series:
+        if p not in emas:
+            emas[p] = ema(close, p)
+        return emas[p]
+
+    cols: dict[str, pd.Series] = {"rsi": rsi(close, rsi_period)}
 
-    macd_df = macd(df["close"], macd_fast, macd_slow, macd_signal)
-    df = pd.concat([df, macd_df], axis=1)
+    macd_line = ema_of(macd_fast) - ema_of(macd_slow)
+    signal_line = ema(macd_line, macd_signal)
+    cols["macd"] = macd_line
+    cols["macd_signal"] = signal_line
+    cols["macd_hist"] = macd_line - signal_line
 
-    bb_df = bollinger_bands(df["close"], bb_period, bb_std)
-    df = pd.concat([df, bb_df], axis=1)
+    cols.update(bollinger_bands(close, bb_period, bb_std))
 
     for p in ema_periods:
-        df[f"ema_{p}"] = ema(df["close"], p)
+        cols[f"ema_{p}"] = ema_of(p)
 
-    df["atr"] = atr(df["high"], df["low"], df["close"], atr_period)
+    cols["atr"] = atr(df["high"], df["low"], close, atr_period)
 
     if "volume" in df.columns and df["volume"].sum() > 0:
-        df["vwap"] = vwap(df["high"], df["low"], df["close"], df["volume"])
+        cols["vwap"] = vwap(df["high"], df["low"], close, df["volume"])
+
+    return pd.concat([df, pd.DataFrame(cols, index=df.index)], axis=1)
+
+
+class _AdjustedEwm:
+    """Running ``Series.ewm(alpha=..., adjust=True).mean()`` for one series."""
+
+    __slots__ = ("alpha", "min_periods", "mean", "weight", "count")
+
+    def __init__(self, alpha: float, min_periods: int) -> None:
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self.mean = np.nan
+        self.weight = 0.0
+        self.count = 0
+
+    def seed(self, series: pd.Series) -> None:
+        """Initialise from the full history in one vectorized pass."""
+        values = series.dropna()
+        self.count = len(values)
+        if self.count == 0:
+            return
+        self.mean = float(values.ewm(alpha=self.alpha).mean().iloc[-1])
+        # Sum of the decayed unit weights pandas accumulates internally
+        self.weight = (1 - (1 - self.alpha) ** self.count) / self.alpha
+
+    def update(self, x: float) -> float:
+        decayed = (1 - self.alpha) * self.weight
+        self.weight = decayed + 1
+        self.mean = x if self.count == 0 else (decayed * self.mean + x) / self.weight
+        self.count += 1
+        return self.mean if self.count >= self.min_periods else np.nan
+
+
+class IndicatorState:
+    """Incremental form of add_all_indicators.
+
+    ``backfill(df)`` computes the indicator frame with the vectorized
+    functions above and keeps the running values (EMAs, RSI/ATR averages,
+    the Bollinger window, VWAP sums).  ``update(bar)`` then produces the
+    indicators for one new bar in O(1) instead of recomputing the history.
+    """
+
+    def __init__(
+        self,
+        rsi_period: int = 14,
+        macd_fast: int = 12,
+        macd_slow: int = 26,
+        macd_signal: int = 9,
+        bb_period: int = 20,
+        bb_std: float = 2.0,
+        ema_periods: list[int] | None = None,
+        atr_period: int = 14,
+    ) -> None:
+        self.rsi_period = rsi_period
+        self.macd_fast = macd_fast
+        self.macd_slow = macd_slow
+        self.macd_signal = macd_signal
+        self.bb_period = bb_period
+        self.bb_std = bb_std
+        self.ema_periods = [9, 21, 50, 200] if ema_periods is None else list(ema_periods)
+        self.atr_period = atr_period
+        self._reset()
+
+    def _reset(self) -> None:
+        self._prev_close = np.nan
+        self._emas: dict[int, float] = dict.fromkeys(self.ema_periods, np.nan)
+        self._macd_fast = np.nan
+        self._macd_slow = np.nan
+        self._macd_signal = np.nan
+        self._avg_gain = _AdjustedEwm(1 / self.rsi_period, self.rsi_period)
+        self._avg_loss = _AdjustedEwm(1 / self.rsi_period, self.rsi_period)
+        self._avg_tr = _AdjustedEwm(1 / self.atr_period, self.atr_period)
+        self._bb_window: deque[float] = deque(maxlen=self.bb_period)
+        self._has_volume = False
+        self._cum_tp_vol = 0.0
+        self._cum_vol = 0.0
+
+    def _params(self) -> dict:
+        return {
+            "rsi_period": self.rsi_period,
+            "macd_fast": self.macd_fast,
+            "macd_slow": self.macd_slow,
+            "macd_signal": self.macd_signal,
+            "bb_period": self.bb_period,
+            "bb_std": self.bb_std,
+            "ema_periods": self.ema_periods,
+            "atr_period": self.atr_period,
+        }
+
+    def backfill(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return ``add_all_indicators(df)`` and capture the state at its last row."""
+        self._reset()
+        result = add_all_indicators(df, **self._params())
+        if df.empty:
+            return result
+
+        close = df["close"]
+        self._prev_close = float(close.iloc[-1])
+        for p in self.ema_periods:
+            self._emas[p] = float(result[f"ema_{p}"].iloc[-1])
+        self._macd_fast = float(ema(close, self.macd_fast).iloc[-1])
+        self._macd_slow = float(ema(close, self.macd_slow).iloc[-1])
+        self._macd_signal = float(result["macd_signal"].iloc[-1])
+
+        delta = close.diff()
+        self._avg_gain.seed(delta.clip(lower=0))
+        self._avg_loss.seed(-delta.clip(upper=0))
+        self._avg_tr.seed(pd.Series(_true_range(df["high"], df["low"], close), index=close.index))
+
+        self._bb_window.extend(close.iloc[-self.bb_period:].tolist())
+
+        self._has_volume = "vwap" in result.columns
+        if self._has_volume:
+            typical_price = (df["high"] + df["low"] + close) / 3
+            self._cum_tp_vol = float((typical_price * df["volume"]).sum())
+            self._cum_vol = float(df["volume"].sum())
+        return result
+
+    def update(self, bar: dict) -> dict:
+        """Advance by one OHLCV bar and return its indicator values."""
+        high = float(bar["high"])
+        low = float(bar["low"])
+        close = float(bar["close"])
+        prev_close = self._prev_close
+        first = np.isnan(prev_close)
+        out: dict[str, float] = {}
+
+        if first:
+            avg_gain = avg_loss = np.nan
+        else:
+            delta = close - prev_close
+            avg_gain = self._avg_gain.update(max(delta, 0.0))
+            avg_loss = self._avg_loss.update(max(-delta, 0.0))
+        if avg_loss == 0:
+            out["rsi"] = np.nan if avg_gain == 0 else 100.0
+        else:
+            out["rsi"] = 100 - 100 / (1 + avg_gain / avg_loss)
+
+        self._macd_fast = _ema_step(self._macd_fast, close, self.macd_fast)
+        self._macd_slow = _ema_step(self._macd_slow, close, self.macd_slow)
+        macd_line = self._macd_fast - self._macd_slow
+        self._macd_signal = _ema_step(self._macd_signal, macd_line, self.macd_signal)
+        out["macd"] = macd_line
+        out["macd_signal"] = self._macd_signal
+        out["macd_hist"] = macd_line - self._macd_signal
+
+        window = self._bb_window
+        window.append(close)
+        if len(window) == self.bb_period and self.bb_period > 1:
+            middle = sum(window) / self.bb_period
+            std = (sum((x - middle) ** 2 for x in window) / (self.bb_period - 1)) ** 0.5
+            out["bb_upper"] = middle + self.bb_std * std
+            out["bb_middle"] = middle
+            out["bb_lower"] = middle - self.bb_std * std
+        else:
+            out["bb_upper"] = out["bb_middle"] = out["bb_lower"] = np.nan
+
+        for p in self.ema_periods:
+            self._emas[p] = _ema_step(self._emas[p], close, p)
+            out[f"ema_{p}"] = self._emas[p]
+
+        if first:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        out["atr"] = self._avg_tr.update(tr)
+
+        if self._has_volume:
+            volume = float(bar.get("volume", 0))
+            self._cum_tp_vol += (high + low + close) / 3 * volume
+            self._cum_vol += volume
+            out["vwap"] = self._cum_tp_vol / self._cum_vol if self._cum_vol else np.nan
+
+        self._prev_close = close
+        return out
+
 
-    return df
+def _ema_step(prev: float, x: float, period: int) -> float:
+    """One step of ``ewm(span=period, adjust=False)``; NaN ``prev`` seeds with ``x``."""
+    if np.isnan(prev):
+        return x
+    alpha = 2 / (period + 1)
+    return prev + alpha * (x - prev)
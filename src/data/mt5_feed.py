@@ -4,11 +4,13 @@ This is a skeleton that implements the DataFeed interface.
 On Linux, import will fail gracefully; use DemoFeed instead.
 """
 
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Callable
 
 import pandas as pd
 
-from src.data.feed import DataFeed
+from src.data.feed import DataFeed, to_utc
 from src.utils.logger import get_logger
 
 log = get_logger(__name__)
@@ -43,15 +45,15 @@ class MT5Feed(DataFeed):
         self,
         symbol: str,
         timeframe: str,
-        start: str,
-        end: str,
+        start: str | datetime,
+        end: str | datetime,
     ) -> pd.DataFrame:
         tf = getattr(mt5, TIMEFRAME_MAP[timeframe])
         rates = mt5.copy_rates_range(
             symbol,
             tf,
-            pd.Timestamp(start),
-            pd.Timestamp(end),
+            to_utc(start).to_pydatetime(),
+            to_utc(end).to_pydatetime(),
         )
         if rates is None or len(rates) == 0:
             log.warning("mt5_no_data", symbol=symbol, timeframe=timeframe)
@@ -68,5 +70,15 @@ class MT5Feed(DataFeed):
         })
         return df[["timestamp", "open", "high", "low", "close", "volume"]]
 
+    def get_historical_batch(
+        self,
+        symbols: Sequence[str],
+        timeframe: str,
+        start: str | datetime,
+        end: str | datetime,
+    ) -> dict[str, pd.DataFrame]:
+        # The MT5 terminal API is not thread-safe, so fetch one symbol at a time
+        return {symbol: self.get_historical(symbol, timeframe, start, end) for symbol in symbols}
+
     def stream_prices(self, symbol: str, callback: Callable[[dict], None]) -> None:
         raise NotImplementedError("MT5 live streaming not yet implemented")
@@ -1,10 +1,12 @@
 """OANDA v20 data feed — historical candles and streaming prices."""
 
-import json
 import threading
 import time
+from datetime import datetime
 from typing import Callable
 
+import numpy as np
+import orjson
 import pandas as pd
 import requests
 
@@ -14,13 +16,14 @@ from config.settings import (
     FEED_MAX_RECONNECT_ATTEMPTS,
     OANDA_ACCOUNT_ID,
     OANDA_API_TOKEN,
+    OANDA_BASE,
     OANDA_BASE_URL,
-    OANDA_ENVIRONMENT,
     OANDA_GRANULARITY_MAP,
+    OANDA_STREAM,
     OANDA_STREAM_URL,
     OANDA_SYMBOL_MAP,
 )
-from src.data.feed import DataFeed
+from src.data.feed import DataFeed, to_utc
 from src.utils.logger import get_logger
 
 log = get_logger(__name__)
@@ -33,12 +36,17 @@ class OandaFeed(DataFeed):
         self,
         account_id: str = OANDA_ACCOUNT_ID,
         api_token: str = OANDA_API_TOKEN,
-        environment: str = OANDA_ENVIRONMENT,
+        environment: str | None = None,
     ) -> None:
         self._account_id = account_id
         self._api_token = api_token
-        self._base_url = OANDA_BASE_URL[environment]
-        self._stream_url = OANDA_STREAM_URL[environment]
+        # None -> the configured OANDA_ENVIRONMENT, whose URLs are resolved once in settings
+        if environment is None:
+            self._base_url = OANDA_BASE
+            self._stream_url = OANDA_STREAM
+        else:
+            self._base_url = OANDA_BASE_URL[environment]
+            self._stream_url = OANDA_STREAM_URL[environment]
         self._headers = {
             "Authorization": f"Bearer {api_token}",
             "Content-Type": "application/json",
@@ -64,8 +72,8 @@ class OandaFeed(DataFeed):
         self,
         symbol: str,
         timeframe: str,
-        start: str,
-        end: str,
+        start: str | datetime,
+        end: str | datetime,
     ) -> pd.DataFrame:
         instrument = self._instrument(symbol)
         granularity = OANDA_GRANULARITY_MAP.get(timeframe, "H1")
@@ -78,9 +86,13 @@ class OandaFeed(DataFeed):
             end=end,
         )
 
-        all_candles = []
-        from_time = pd.Timestamp(start).isoformat() + "Z"
-        to_time = pd.Timestamp(end).isoformat() + "Z"
+        # One typed chunk per page, filled by index and concatenated at the end,
+        # instead of a dict per candle through the records constructor
+        time_chunks: list[list[str]] = []
+        price_chunks: list[np.ndarray] = []
+        volume_chunks: list[np.ndarray] = []
+        from_time = to_utc(start).isoformat().replace("+00:00", "Z")
+        to_time = to_utc(end).isoformat().replace("+00:00", "Z")
 
         while True:
             params = {
@@ -100,18 +112,19 @@ class OandaFeed(DataFeed):
             if not candles:
                 break
 
-            for c in candles:
-                if not c.get("complete", False):
-                    continue
+            complete = [c for c in candles if c.get("complete", False)]
+            prices = np.empty((len(complete), 4), dtype=np.float64)
+            volumes = np.empty(len(complete), dtype=np.int64)
+            for i, c in enumerate(complete):
                 mid = c["mid"]
-                all_candles.append({
-                    "timestamp": pd.Timestamp(c["time"]),
-                    "open": float(mid["o"]),
-                    "high": float(mid["h"]),
-                    "low": float(mid["l"]),
-                    "close": float(mid["c"]),
-                    "volume": int(c.get("volume", 0)),
-                })
+                prices[i, 0] = float(mid["o"])
+                prices[i, 1] = float(mid["h"])
+                prices[i, 2] = float(mid["l"])
+                prices[i, 3] = float(mid["c"])
+                volumes[i] = int(c.get("volume", 0))
+            time_chunks.append([c["time"] for c in complete])
+            price_chunks.append(prices)
+            volume_chunks.append(volumes)
 
             # Paginate: use the last candle's time as new 'from'
             last_time = candles[-1]["time"]
@@ -119,13 +132,27 @@ class OandaFeed(DataFeed):
                 break
             from_time = last_time
 
-        if not all_candles:
+        n_rows = sum(len(chunk) for chunk in volume_chunks)
+        if n_rows == 0:
             log.warning("oanda_no_historical_data")
             return pd.DataFrame()
 
-        df = pd.DataFrame(all_candles)
-        # Remove timezone info for consistency
-        df["timestamp"] = df["timestamp"].dt.tz_localize(None)
+        prices = np.concatenate(price_chunks)
+        # Parse every RFC 3339 timestamp in one vectorized call; naive UTC for consistency
+        timestamps = pd.to_datetime(
+            [t for chunk in time_chunks for t in chunk], utc=True, format="ISO8601"
+        ).tz_localize(None)
+        df = pd.DataFrame(
+            {
+                "timestamp": timestamps,
+                "open": prices[:, 0],
+                "high": prices[:, 1],
+                "low": prices[:, 2],
+                "close": prices[:, 3],
+                "volume": np.concatenate(volume_chunks),
+            },
+            copy=False,
+        )
         log.info("oanda_fetched_rows", count=len(df))
         return df
 
@@ -159,7 +186,7 @@ class OandaFeed(DataFeed):
                         return
                     if not line:
                         continue
-                    data = json.loads(line)
+                    data = orjson.loads(line)
                     if data.get("type") != "PRICE":
                         continue
 
@@ -0,0 +1,43 @@
+"""Process-wide SQLAlchemy engine with pool sizing from settings."""
+
+from functools import lru_cache
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from config.settings import (
+    DATABASE_URL_OBJ,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_STATEMENT_CACHE_SIZE,
+)
+
+
+def _connect_args(driver: str, statement_cache_size: int) -> dict:
+    """DBAPI connect kwargs for the prepared-statement cache.
+
+    psycopg (v3) prepares statements server-side after a few executions, which
+    collides across clients behind PgBouncer in transaction mode; a cache size
+    of 0 turns that off. psycopg2 never prepares server-side, so it needs nothing.
+    """
+    if driver != "psycopg":
+        return {}
+    if statement_cache_size <= 0:
+        return {"prepare_threshold": None}
+    return {"prepare_threshold": 5, "prepared_max": statement_cache_size}
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Return the shared pooled engine, creating it on first use."""
+    url = DATABASE_URL_OBJ
+    return create_engine(
+        url,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args=_connect_args(url.get_driver_name(), DB_STATEMENT_CACHE_SIZE),
+    )
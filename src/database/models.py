@@ -1,7 +1,7 @@
-from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text, create_engine
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-from config.settings import DATABASE_URL
+from src.database.engine import get_engine
 
 
 class Base(DeclarativeBase):
@@ -51,5 +51,5 @@ class Trade(Base):
     created_at = Column(DateTime(timezone=True), nullable=False)
 
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+engine = get_engine()
 SessionLocal = sessionmaker(bind=engine)
@@ -1,16 +1,39 @@
+import io
 from datetime import datetime, date
 
 import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
 
 from src.database.models import Candle, SessionLocal, Tick, Trade, engine
 from src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+_CANDLE_COLUMNS = "timestamp, symbol, timeframe, open, high, low, close, volume, spread"
+
+_CREATE_CANDLE_STAGING = (
+    "CREATE TEMP TABLE _staging_candles "
+    "(LIKE candles INCLUDING DEFAULTS) ON COMMIT DROP"
+)
+_COPY_CANDLE_STAGING = (
+    f"COPY _staging_candles ({_CANDLE_COLUMNS}) FROM STDIN WITH (FORMAT CSV)"
+)
+_MERGE_CANDLE_STAGING = (
+    f"INSERT INTO candles ({_CANDLE_COLUMNS}) "
+    f"SELECT {_CANDLE_COLUMNS} FROM _staging_candles "
+    "ON CONFLICT (timestamp, symbol, timeframe) DO NOTHING"
+)
+
 
 class CandleRepository:
+    def __init__(self, db_engine: Engine | None = None) -> None:
+        """Use the shared pooled engine unless a specific one is supplied."""
+        self._engine = db_engine if db_engine is not None else engine
+        self._session = sessionmaker(bind=db_engine) if db_engine is not None else SessionLocal
+
     def upsert_candles(self, df: pd.DataFrame, symbol: str, timeframe: str) -> int:
         """Insert candles from a DataFrame, skipping duplicates."""
         if df.empty:
@@ -35,13 +58,55 @@ class CandleRepository:
             index_elements=["timestamp", "symbol", "timeframe"],
         )
 
-        with SessionLocal() as session:
+        with self._session() as session:
             result = session.execute(stmt)
             session.commit()
             count = result.rowcount
             log.info("upserted_candles", symbol=symbol, timeframe=timeframe, rows=count)
             return count
 
+    def bulk_upsert_candles(self, df: pd.DataFrame, symbol: str, timeframe: str) -> int:
+        """Bulk-load candles with COPY into a staging table, then merge, skipping duplicates.
+
+        Intended for backfills, where a multi-row INSERT spends most of its time
+        binding parameters. Conflict handling matches ``upsert_candles``.
+        """
+        if df.empty:
+            return 0
+
+        n = len(df)
+        staging = pd.DataFrame({
+            "timestamp": df["timestamp"].to_numpy(),
+            "symbol": [symbol] * n,
+            "timeframe": [timeframe] * n,
+            "open": df["open"].to_numpy(),
+            "high": df["high"].to_numpy(),
+            "low": df["low"].to_numpy(),
+            "close": df["close"].to_numpy(),
+            "volume": df["volume"].to_numpy() if "volume" in df else 0.0,
+            "spread": df["spread"].to_numpy() if "spread" in df else None,
+        })
+        buf = io.StringIO()
+        staging.to_csv(buf, index=False, header=False)
+        buf.seek(0)
+
+        raw = self._engine.raw_connection()
+        try:
+            with raw.cursor() as cur:
+                cur.execute(_CREATE_CANDLE_STAGING)
+                cur.copy_expert(_COPY_CANDLE_STAGING, buf)
+                cur.execute(_MERGE_CANDLE_STAGING)
+                count = cur.rowcount
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
+
+        log.info("bulk_upserted_candles", symbol=symbol, timeframe=timeframe, rows=count)
+        return count
+
     def get_candles(
         self,
         symbol: str,
@@ -59,7 +124,7 @@ class CandleRepository:
             ORDER BY timestamp DESC
             LIMIT :limit
         """)
-        with engine.connect() as conn:
+        with self._engine.connect() as conn:
             df = pd.read_sql(
                 query,
                 conn,
@@ -75,8 +140,13 @@ class CandleRepository:
 
 
 class TickRepository:
+    def __init__(self, db_engine: Engine | None = None) -> None:
+        """Use the shared pooled engine unless a specific one is supplied."""
+        self._engine = db_engine if db_engine is not None else engine
+        self._session = sessionmaker(bind=db_engine) if db_engine is not None else SessionLocal
+
     def insert_tick(self, symbol: str, bid: float, ask: float, timestamp: datetime) -> None:
-        with SessionLocal() as session:
+        with self._session() as session:
             session.add(Tick(
                 timestamp=timestamp,
                 symbol=symbol,
@@ -87,14 +157,19 @@ class TickRepository:
 
 
 class TradeRepository:
+    def __init__(self, db_engine: Engine | None = None) -> None:
+        """Use the shared pooled engine unless a specific one is supplied."""
+        self._engine = db_engine if db_engine is not None else engine
+        self._session = sessionmaker(bind=db_engine) if db_engine is not None else SessionLocal
+
     def insert_trades(self, df: pd.DataFrame) -> int:
         """Insert trades from a DataFrame into the trades table."""
         if df.empty:
             return 0
 
-        records = []
-        for _, row in df.iterrows():
-            records.append({
+        created_at = datetime.utcnow()
+        records = [
+            {
                 "strategy_name": row["strategy_name"],
                 "symbol": row["symbol"],
                 "timeframe": row["timeframe"],
@@ -108,11 +183,16 @@ class TradeRepository:
                 "sl": row.get("sl"),
                 "tp": row.get("tp"),
                 "exit_reason": row.get("exit_reason"),
-                "created_at": datetime.utcnow(),
-            })
+                "created_at": created_at,
+            }
+            for row in df.to_dict("records")
+        ]
 
-        with SessionLocal() as session:
-            session.execute(insert(Trade).values(records))
+        with self._session() as session:
+            # executemany form: SQLAlchemy batches the rows into multi-row
+            # INSERTs of bounded size, instead of one statement whose bind
+            # parameters grow with the trade count
+            session.execute(insert(Trade), records)
             session.commit()
             count = len(records)
             log.info("inserted_trades", count=count)
@@ -120,7 +200,7 @@ class TradeRepository:
 
     def insert_trade(self, trade: dict, run_id: int | None = None) -> int:
         """Insert a single trade, optionally linked to a strategy run."""
-        with SessionLocal() as session:
+        with self._session() as session:
             stmt = text("""
                 INSERT INTO trades (strategy_name, symbol, timeframe, side,
                     entry_time, exit_time, entry_price, exit_price,
@@ -164,7 +244,7 @@ class TradeRepository:
             WHERE strategy_name = :strategy AND symbol = :symbol
             ORDER BY entry_time
         """)
-        with engine.connect() as conn:
+        with self._engine.connect() as conn:
             df = pd.read_sql(
                 query,
                 conn,
@@ -183,7 +263,7 @@ class TradeRepository:
     ) -> int:
         """Create a strategy run record. Returns run_id."""
         import json
-        with SessionLocal() as session:
+        with self._session() as session:
             stmt = text("""
                 INSERT INTO strategy_runs
                     (strategy_name, symbol, timeframe, broker_type, initial_capital, config)
@@ -204,7 +284,7 @@ class TradeRepository:
 
     def close_run(self, run_id: int, final_capital: float, total_trades: int) -> None:
         """Close a strategy run."""
-        with SessionLocal() as session:
+        with self._session() as session:
             session.execute(text("""
                 UPDATE strategy_runs
                 SET stopped_at = NOW(), final_capital = :final_capital, total_trades = :total_trades
@@ -214,7 +294,7 @@ class TradeRepository:
 
     def get_performance_summary(self, run_id: int) -> dict:
         """Get aggregated performance stats for a run."""
-        with engine.connect() as conn:
+        with self._engine.connect() as conn:
             result = conn.execute(text("""
                 SELECT
                     COUNT(*) as total_trades,
@@ -252,7 +332,7 @@ class TradeRepository:
 
     def get_daily_summaries(self, run_id: int) -> list[dict]:
         """Get daily P&L breakdown for a run."""
-        with engine.connect() as conn:
+        with self._engine.connect() as conn:
             result = conn.execute(text("""
                 SELECT date, realized_pnl, trade_count, win_count, max_drawdown
                 FROM daily_summary
@@ -275,7 +355,7 @@ class TradeRepository:
         self, run_id: int, trade_date: date, pnl: float, is_win: bool
     ) -> None:
         """Upsert daily summary for a run."""
-        with SessionLocal() as session:
+        with self._session() as session:
             session.execute(text("""
                 INSERT INTO daily_summary (run_id, date, realized_pnl, trade_count, win_count)
                 VALUES (:run_id, :date, :pnl, 1, :win)
@@ -288,7 +368,7 @@ class TradeRepository:
 
     def get_trade_history(self, run_id: int, limit: int = 50, offset: int = 0) -> list[dict]:
         """Get paginated trade history for a run."""
-        with engine.connect() as conn:
+        with self._engine.connect() as conn:
             result = conn.execute(text("""
                 SELECT id, strategy_name, symbol, timeframe, side,
                        entry_time, exit_time, entry_price, exit_price,
@@ -1,7 +1,9 @@
 """Tick-to-candle aggregation with time-aligned boundaries."""
 
+import threading
 from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 
 import pandas as pd
 
@@ -16,6 +18,8 @@ TIMEFRAME_SECONDS = {
     "1d": 86400,
 }
 
+CANDLE_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
 
 def _floor_timestamp(ts: pd.Timestamp, seconds: int) -> pd.Timestamp:
     """Floor a timestamp to the nearest candle boundary."""
@@ -64,7 +68,12 @@ class CandleAggregator:
             raise ValueError(f"Unsupported timeframe: {timeframe}")
         self.timeframe = timeframe
         self._period_seconds = TIMEFRAME_SECONDS[timeframe]
-        self._history: deque[dict] = deque(maxlen=CANDLE_HISTORY_SIZE)
+        # Completed candles stored column-wise; the lock keeps the columns the same
+        # length for readers on other threads (API requests) while a bar is appended
+        self._columns: dict[str, deque] = {
+            col: deque(maxlen=CANDLE_HISTORY_SIZE) for col in CANDLE_COLUMNS
+        }
+        self._lock = threading.Lock()
         self._current: CandleBuilder | None = None
 
     def on_tick(self, timestamp: pd.Timestamp, bid: float, ask: float) -> dict | None:
@@ -80,7 +89,9 @@ class CandleAggregator:
         if candle_ts > self._current.timestamp:
             # New period — close the current candle and start a new one
             completed = self._current.to_dict()
-            self._history.append(completed)
+            with self._lock:
+                for col in CANDLE_COLUMNS:
+                    self._columns[col].append(completed[col])
             self._current = CandleBuilder(timestamp=candle_ts)
             self._current.update(mid)
             return completed
@@ -91,19 +102,34 @@ class CandleAggregator:
 
     def seed_history(self, df: pd.DataFrame) -> None:
         """Pre-load historical candles from a DataFrame."""
-        for _, row in df.iterrows():
-            self._history.append({
-                "timestamp": row["timestamp"],
-                "open": row["open"],
-                "high": row["high"],
-                "low": row["low"],
-                "close": row["close"],
-                "volume": row.get("volume", 0),
-            })
+        if df.empty:
+            return
+        volume = df["volume"].tolist() if "volume" in df.columns else [0] * len(df)
+        with self._lock:
+            for col in CANDLE_COLUMNS[:-1]:
+                self._columns[col].extend(df[col].tolist())
+            self._columns["volume"].extend(volume)
+
+    def __len__(self) -> int:
+        return len(self._columns["timestamp"])
 
     @property
     def history_df(self) -> pd.DataFrame:
         """Return historical candles as a DataFrame."""
-        if not self._history:
-            return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
-        return pd.DataFrame(list(self._history))
+        return pd.DataFrame(self.tail(len(self)), columns=list(CANDLE_COLUMNS))
+
+    @property
+    def last_timestamp(self) -> pd.Timestamp | None:
+        """Open time of the most recent completed candle, or None if empty."""
+        try:
+            return self._columns["timestamp"][-1]
+        except IndexError:
+            return None
+
+    def tail(self, n: int) -> dict[str, list]:
+        """Return the last ``n`` completed candles as a dict of column lists."""
+        with self._lock:
+            size = len(self._columns["timestamp"])
+            if n >= size:
+                return {col: list(values) for col, values in self._columns.items()}
+            return {col: list(islice(values, size - n, None)) for col, values in self._columns.items()}
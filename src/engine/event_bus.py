@@ -2,7 +2,7 @@
 
 import threading
 from collections import defaultdict
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 from src.utils.logger import get_logger
 
@@ -26,6 +26,12 @@ class EventBus:
         with self._lock:
             self._handlers[event_type].append(handler)
 
+    def subscribe_many(self, event_types: Iterable[str], handler: EventHandler) -> None:
+        """Subscribe ``handler`` to several event types under one lock acquisition."""
+        with self._lock:
+            for event_type in event_types:
+                self._handlers[event_type].append(handler)
+
     def unsubscribe(self, event_type: str, handler: EventHandler) -> None:
         with self._lock:
             handlers = self._handlers.get(event_type, [])
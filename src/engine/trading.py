@@ -5,8 +5,9 @@ from __future__ import annotations
 import threading
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Iterator
 
+import orjson
 import pandas as pd
 
 from config.settings import (
@@ -16,7 +17,7 @@ from config.settings import (
 )
 from src.broker.base import Broker, OrderSide
 from src.data.feed import DataFeed
-from src.data.indicators import add_all_indicators
+from src.data.indicators import IndicatorState
 from src.database.repository import TradeRepository
 from src.engine.candle_aggregator import CandleAggregator, TIMEFRAME_SECONDS
 from src.engine.event_bus import EventBus
@@ -26,6 +27,18 @@ from src.utils.logger import get_logger
 log = get_logger(__name__)
 
 
+def _candle_records(columns: dict[str, list]) -> list[dict]:
+    """JSON-ready rows from aggregator columns, shaped like CandleResponse."""
+    return [
+        {"timestamp": str(ts), "open": float(o), "high": float(h),
+         "low": float(lo), "close": float(c), "volume": float(v)}
+        for ts, o, h, lo, c, v in zip(
+            columns["timestamp"], columns["open"], columns["high"],
+            columns["low"], columns["close"], columns["volume"],
+        )
+    ]
+
+
 class TradingEngine:
     """Orchestrates live/paper trading: feed -> aggregation -> strategy -> broker."""
 
@@ -63,6 +76,11 @@ class TradingEngine:
         self._last_tick_time: float = 0.0
         self._stream_alive = threading.Event()
         self._consecutive_tick_errors: int = 0
+        # (last bar timestamp, clamped limit, serialized JSON); see candles_json()
+        self._candles_cache: tuple[pd.Timestamp, int, bytes] | None = None
+        # Indicator frame for the candle history, extended per closed bar; see _indicator_frame()
+        self._indicators = IndicatorState()
+        self._indicator_df: pd.DataFrame | None = None
 
     @property
     def is_running(self) -> bool:
@@ -72,6 +90,34 @@ class TradingEngine:
     def candle_history(self) -> pd.DataFrame:
         return self._aggregator.history_df
 
+    def candles_json(self, limit: int) -> bytes:
+        """Return the trailing ``limit`` candles as a JSON array.
+
+        History only changes when a bar closes, so the most recent payload is
+        kept and reused until the last bar's timestamp moves. Only one entry
+        is held (clients poll with one limit), so arbitrary ``limit`` values
+        cannot grow the cache.
+        """
+        last_ts = self._aggregator.last_timestamp
+        if last_ts is None:
+            return b"[]"
+        # Every limit past the history size yields the same payload
+        limit = min(limit, len(self._aggregator))
+        cached = self._candles_cache
+        if cached is not None and cached[0] == last_ts and cached[1] == limit:
+            return cached[2]
+
+        payload = orjson.dumps(_candle_records(self._aggregator.tail(limit)))
+        self._candles_cache = (last_ts, limit, payload)
+        return payload
+
+    def iter_candles_ndjson(self, limit: int, batch_size: int = 512) -> Iterator[bytes]:
+        """Yield the trailing ``limit`` candles as NDJSON, ``batch_size`` lines per chunk."""
+        columns = self._aggregator.tail(limit)
+        for i in range(0, len(columns["timestamp"]), batch_size):
+            batch = {col: values[i:i + batch_size] for col, values in columns.items()}
+            yield b"".join(orjson.dumps(row) + b"\n" for row in _candle_records(batch))
+
     @property
     def health_status(self) -> dict:
         """Return health status of the engine."""
@@ -328,6 +374,32 @@ class TradingEngine:
 
         self._emit("position_closed", {"order_id": order_id})
 
+    def _indicator_frame(self, history: pd.DataFrame) -> pd.DataFrame:
+        """Indicator columns for ``history``, computed in full only once.
+
+        Later calls run just the candles newer than the cached frame through
+        IndicatorState.update(), so EMAs and Wilder averages carry on from
+        earlier bars as they do over a backtest's full series. Falls back to
+        a full backfill when ``history`` no longer overlaps the cached frame.
+        """
+        cached = self._indicator_df
+        if cached is not None and not cached.empty:
+            last_ts = cached["timestamp"].iloc[-1]
+            timestamps = history["timestamp"]
+            if (timestamps == last_ts).any():
+                new = history[timestamps > last_ts]
+                if new.empty:
+                    return cached
+                rows = [{**bar, **self._indicators.update(bar)} for bar in new.to_dict("records")]
+                frame = pd.concat([cached, pd.DataFrame(rows)], ignore_index=True)
+                frame = frame.iloc[-len(history):].reset_index(drop=True)
+                self._indicator_df = frame
+                return frame
+
+        frame = self._indicators.backfill(history)
+        self._indicator_df = frame
+        return frame
+
     def _on_candle_close(self, candle: dict) -> None:
         """Process a completed candle: compute indicators, generate signals, place orders."""
         log.info(
@@ -347,7 +419,7 @@ class TradingEngine:
             return
 
         # Add indicators
-        df = add_all_indicators(df)
+        df = self._indicator_frame(df)
         df = df.dropna().reset_index(drop=True)
 
         if df.empty:
@@ -1,6 +1,7 @@
 """NotificationService — dispatches EventBus events to notification backends."""
 
 import asyncio
+from collections.abc import Iterable
 from typing import Any
 
 from src.engine.event_bus import EventBus
@@ -16,13 +17,14 @@ class NotificationService:
     def __init__(
         self,
         backends: list[NotificationBackend],
-        event_types: list[str] | None = None,
+        event_types: Iterable[str] | None = None,
     ) -> None:
         self.backends = backends
-        self.event_types = event_types or [
+        # frozenset: _on_event checks membership on every emitted event
+        self.event_types = frozenset(event_types or (
             "order_filled", "position_closed", "circuit_breaker",
             "engine_started", "engine_stopped",
-        ]
+        ))
 
     def connect(self, event_bus: EventBus) -> None:
         """Subscribe to configured event types on the event bus."""
@@ -49,12 +51,23 @@ class NotificationService:
                 log.exception("notification_dispatch_failed")
 
     async def _dispatch(self, subject: str, body: str) -> None:
-        """Send to all backends, catching individual failures."""
-        for backend in self.backends:
+        """Send to all backends concurrently, catching individual failures."""
+        results = await asyncio.gather(
+            *(backend.send(subject, body) for backend in self.backends),
+            return_exceptions=True,
+        )
+        for backend, result in zip(self.backends, results):
+            if isinstance(result, Exception):
+                log.error("notification_backend_failed", backend=backend.name, exc_info=result)
+
+    async def drain(self, queue: asyncio.Queue) -> None:
+        """Dispatch queued (subject, body) messages until cancelled."""
+        while True:
+            subject, body = await queue.get()
             try:
-                await backend.send(subject, body)
-            except Exception:
-                log.exception("notification_backend_failed", backend=backend.name)
+                await self._dispatch(subject, body)
+            finally:
+                queue.task_done()
 
     @staticmethod
     def _format_message(event_type: str, data: Any) -> tuple[str, str]:
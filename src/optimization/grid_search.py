@@ -1,6 +1,7 @@
 """Grid search optimization over strategy parameters."""
 
 import itertools
+from collections.abc import Sequence
 from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Any
@@ -26,29 +27,26 @@ class GridResult:
     trade_count: int
 
 
-def _run_single_backtest(args: tuple) -> dict:
-    """Run a single backtest for one parameter combination (picklable for multiprocessing)."""
-    strategy_class_name, strategy_module, params, df_dict, backtest_config_dict, symbol, timeframe = args
+_EMPTY_RESULT = {"total_return": 0, "sharpe": 0, "max_drawdown": 0, "win_rate": 0, "trade_count": 0}
 
-    # Import strategy class dynamically
-    import importlib
-    module = importlib.import_module(strategy_module)
-    strategy_class = getattr(module, strategy_class_name)
+# Per-process evaluation context, installed once per pool worker by _init_worker
+_worker_ctx: dict[str, Any] = {}
 
-    config = StrategyConfig(name=strategy_class_name, params=params)
-    strategy = strategy_class(config)
-
-    df = pd.DataFrame(df_dict)
-    df = add_all_indicators(df)
-    df = df.dropna().reset_index(drop=True)
 
+def _evaluate(params: dict, ctx: dict[str, Any]) -> dict:
+    """Backtest one parameter combination on the shared, indicator-enriched frame."""
+    df = ctx["df"]
     if df.empty:
-        return {"params": params, "total_return": 0, "sharpe": 0, "max_drawdown": 0, "win_rate": 0, "trade_count": 0}
+        return {"params": params, **_EMPTY_RESULT}
 
+    strategy_class_name = ctx["strategy_class_name"]
+    strategy = ctx["strategy_class"](StrategyConfig(name=strategy_class_name, params=params))
     df = strategy.generate_signals(df)
 
-    bt_config = BacktestConfig(**backtest_config_dict)
-    engine = BacktestEngine(config=bt_config, symbol=symbol, timeframe=timeframe, strategy_name=strategy_class_name)
+    engine = BacktestEngine(
+        config=ctx["backtest_config"], symbol=ctx["symbol"],
+        timeframe=ctx["timeframe"], strategy_name=strategy_class_name,
+    )
     result = engine.run(df)
 
     metrics = calculate_metrics(result.trades, result.equity_curve, result.initial_capital)
@@ -63,6 +61,53 @@ def _run_single_backtest(args: tuple) -> dict:
     }
 
 
+def _init_worker(ctx: dict[str, Any]) -> None:
+    """Pool initializer: receive the frame and config once per worker, not once per task."""
+    _worker_ctx.update(ctx)
+
+
+def _evaluate_in_worker(params: dict) -> dict:
+    return _evaluate(params, _worker_ctx)
+
+
+def _indicator_ema_periods(param_grid: dict[str, list]) -> list[int]:
+    """Default EMA periods plus every period the grid may ask a strategy for."""
+    periods = {9, 21, 50, 200}
+    for key, values in param_grid.items():
+        if key.endswith("_period"):
+            periods.update(int(v) for v in values)
+    return sorted(periods)
+
+
+def _expand_grid(param_grid: dict[str, list]) -> list[dict]:
+    """Every parameter combination in the grid, as kwargs dicts."""
+    keys = list(param_grid.keys())
+    return [dict(zip(keys, v)) for v in itertools.product(*param_grid.values())]
+
+
+def _prepare_frame(df: pd.DataFrame, param_grid: dict[str, list]) -> pd.DataFrame:
+    """Indicator-enriched, NaN-free frame shared by every combination of the grid."""
+    df = add_all_indicators(df, ema_periods=_indicator_ema_periods(param_grid))
+    return df.dropna().reset_index(drop=True)
+
+
+def _to_grid_results(results: list[dict]) -> list[GridResult]:
+    """Convert raw evaluation dicts to GridResults, best Sharpe first."""
+    grid_results = [
+        GridResult(
+            params=r["params"],
+            total_return=r["total_return"],
+            sharpe=r["sharpe"],
+            max_drawdown=r["max_drawdown"],
+            win_rate=r["win_rate"],
+            trade_count=r["trade_count"],
+        )
+        for r in results
+    ]
+    grid_results.sort(key=lambda x: x.sharpe, reverse=True)
+    return grid_results
+
+
 class GridSearch:
     """Grid search over strategy parameter combinations."""
 
@@ -74,70 +119,48 @@ class GridSearch:
         symbol: str = "EURUSD=X",
         timeframe: str = "1h",
         max_workers: int = 4,
+        combos: Sequence[dict] | None = None,
     ) -> None:
+        """``combos`` may pass an already expanded ``param_grid`` to skip re-expanding it."""
         self.strategy_class = strategy_class
         self.param_grid = param_grid
+        self.combos = list(combos) if combos is not None else _expand_grid(param_grid)
         self.backtest_config = backtest_config or BacktestConfig()
         self.symbol = symbol
         self.timeframe = timeframe
         self.max_workers = max_workers
 
+    def context(self) -> dict[str, Any]:
+        """Everything _evaluate needs besides the frame; cheap to pickle."""
+        return {
+            "strategy_class": self.strategy_class,
+            "strategy_class_name": self.strategy_class.__name__,
+            "backtest_config": self.backtest_config,
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+        }
+
     def run(self, df: pd.DataFrame) -> list[GridResult]:
         """Run grid search over all parameter combinations."""
-        # Generate all parameter combinations
-        keys = list(self.param_grid.keys())
-        values = list(self.param_grid.values())
-        combos = [dict(zip(keys, v)) for v in itertools.product(*values)]
+        combos = self.combos
 
         log.info("grid_search_starting", combinations=len(combos))
 
-        # Get strategy class info for serialization
-        strategy_module = self.strategy_class.__module__
-        strategy_class_name = self.strategy_class.__name__
-
-        # Convert config to dict for pickling
-        bt_config_dict = {
-            "capital": self.backtest_config.capital,
-            "spread_pips": self.backtest_config.spread_pips,
-            "slippage_pips": self.backtest_config.slippage_pips,
-            "risk_per_trade": self.backtest_config.risk_per_trade,
-            "max_positions": self.backtest_config.max_positions,
-            "use_risk_sizing": self.backtest_config.use_risk_sizing,
-        }
-
-        # Convert df to dict for pickling
-        df_dict = df.to_dict(orient="list")
+        # Indicators don't depend on the strategy params, so compute them once for the
+        # whole grid rather than once per combination
+        ctx = {"df": _prepare_frame(df, self.param_grid), **self.context()}
 
-        results = []
         # Use sequential for small grids, parallel for large
         if len(combos) <= 4 or self.max_workers <= 1:
-            for combo in combos:
-                args = (strategy_class_name, strategy_module, combo,
-                        df_dict, bt_config_dict, self.symbol, self.timeframe)
-                r = _run_single_backtest(args)
-                results.append(r)
+            results = [_evaluate(combo, ctx) for combo in combos]
         else:
-            args_list = [
-                (strategy_class_name, strategy_module, combo,
-                 df_dict, bt_config_dict, self.symbol, self.timeframe)
-                for combo in combos
-            ]
-            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-                results = list(executor.map(_run_single_backtest, args_list))
-
-        # Convert to GridResult and sort by Sharpe
-        grid_results = [
-            GridResult(
-                params=r["params"],
-                total_return=r["total_return"],
-                sharpe=r["sharpe"],
-                max_drawdown=r["max_drawdown"],
-                win_rate=r["win_rate"],
-                trade_count=r["trade_count"],
-            )
-            for r in results
-        ]
-        grid_results.sort(key=lambda x: x.sharpe, reverse=True)
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_init_worker, initargs=(ctx,),
+            ) as executor:
+                chunksize = max(1, len(combos) // (self.max_workers * 4))
+                results = list(executor.map(_evaluate_in_worker, combos, chunksize=chunksize))
+
+        grid_results = _to_grid_results(results)
 
         log.info("grid_search_complete", best_sharpe=grid_results[0].sharpe if grid_results else 0)
         return grid_results
@@ -4,6 +4,11 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from src.optimization._mc_kernels import mc_stats
+
+# Cap on sampled values held at once (~32 MB of float64 per intermediate)
+_MAX_BATCH_ELEMENTS = 4_000_000
+
 
 @dataclass
 class MonteCarloResult:
@@ -21,12 +26,14 @@ class MonteCarlo:
 
     def __init__(
         self,
-        trade_pnls: list[float],
+        trade_pnls: list[float] | np.ndarray,
         n_simulations: int = 1000,
         initial_capital: float = 10000,
         ruin_threshold: float = 0.5,  # 50% drawdown = ruin
+        seed: int | None = None,
     ) -> None:
-        self.trade_pnls = np.array(trade_pnls)
+        self.trade_pnls = np.ascontiguousarray(trade_pnls, dtype=np.float64)
+        self._rng = np.random.default_rng(seed)
         self.n_simulations = n_simulations
         self.initial_capital = initial_capital
         self.ruin_threshold = ruin_threshold
@@ -45,43 +52,25 @@ class MonteCarlo:
                 probability_of_ruin=0.0,
             )
 
-        returns = []
-        max_drawdowns = []
-        sharpes = []
-        ruin_count = 0
+        n_sims = self.n_simulations
+        capital = self.initial_capital
+        returns = np.empty(n_sims)
+        max_drawdowns = np.empty(n_sims)
+        sharpes = np.empty(n_sims)
 
-        for _ in range(self.n_simulations):
+        # Simulations are drawn as (batch, n_trades) matrices; batching bounds peak memory
+        batch = max(1, _MAX_BATCH_ELEMENTS // n_trades)
+        for lo in range(0, n_sims, batch):
+            hi = min(lo + batch, n_sims)
             # Bootstrap: resample trades with replacement
-            indices = np.random.randint(0, n_trades, size=n_trades)
-            sampled = self.trade_pnls[indices]
-
-            # Build equity curve
-            equity = np.cumsum(sampled) + self.initial_capital
-
-            # Total return
-            total_return = (equity[-1] - self.initial_capital) / self.initial_capital * 100
-            returns.append(total_return)
-
-            # Max drawdown
-            running_max = np.maximum.accumulate(equity)
-            drawdown = (equity - running_max) / running_max
-            max_dd = abs(drawdown.min())
-            max_drawdowns.append(max_dd)
-
-            # Sharpe ratio
-            if sampled.std() > 0:
-                sharpe = (sampled.mean() / sampled.std()) * np.sqrt(252)
-            else:
-                sharpe = 0.0
-            sharpes.append(sharpe)
+            sampled = self._rng.choice(self.trade_pnls, size=(hi - lo, n_trades), replace=True)
 
-            # Ruin check
-            if max_dd >= self.ruin_threshold:
-                ruin_count += 1
+            ret, dd, sharpe = mc_stats(sampled, float(capital))
+            returns[lo:hi] = ret
+            max_drawdowns[lo:hi] = dd
+            sharpes[lo:hi] = sharpe * np.sqrt(252)
 
-        returns = np.array(returns)
-        max_drawdowns = np.array(max_drawdowns)
-        sharpes = np.array(sharpes)
+        ruin_count = int(np.count_nonzero(max_drawdowns >= self.ruin_threshold))
 
         percentiles = [5, 25, 50, 75, 95]
         pct_keys = ["p5", "p25", "p50", "p75", "p95"]
@@ -89,8 +78,8 @@ class MonteCarlo:
         return MonteCarloResult(
             n_simulations=self.n_simulations,
             n_trades=n_trades,
-            return_percentiles=dict(zip(pct_keys, [round(float(np.percentile(returns, p)), 2) for p in percentiles])),
-            max_drawdown_percentiles=dict(zip(pct_keys, [round(float(np.percentile(max_drawdowns, p)), 4) for p in percentiles])),
-            sharpe_percentiles=dict(zip(pct_keys, [round(float(np.percentile(sharpes, p)), 2) for p in percentiles])),
+            return_percentiles=dict(zip(pct_keys, [round(float(v), 2) for v in np.percentile(returns, percentiles)])),
+            max_drawdown_percentiles=dict(zip(pct_keys, [round(float(v), 4) for v in np.percentile(max_drawdowns, percentiles)])),
+            sharpe_percentiles=dict(zip(pct_keys, [round(float(v), 2) for v in np.percentile(sharpes, percentiles)])),
             probability_of_ruin=round(ruin_count / self.n_simulations, 4),
         )
@@ -0,0 +1,84 @@
+"""Hand a DataFrame to worker processes through shared memory instead of pickling it."""
+
+from dataclasses import dataclass
+from datetime import tzinfo
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class SharedColumn:
+    """Where one column lives: enough for a worker to map it without copying."""
+
+    column: str
+    shm_name: str
+    dtype: str
+    length: int
+    tz: tzinfo | None = None  # tz-aware columns are shared as naive UTC
+    values: object = None  # columns that cannot be mapped travel pickled here
+
+
+def share_frame(df: pd.DataFrame) -> tuple[list[SharedColumn], list[shared_memory.SharedMemory]]:
+    """Copy each column of ``df`` into its own shared memory block.
+
+    Returns the picklable column specs to pass to workers and the blocks,
+    which the caller must ``close()`` and ``unlink()`` once workers are done.
+    Numeric and datetime columns go into shared memory, tz-aware ones as
+    naive UTC; any other column (strings, categoricals) is pickled inside
+    its spec instead.
+    """
+    specs: list[SharedColumn] = []
+    blocks: list[shared_memory.SharedMemory] = []
+    try:
+        for col in df.columns:
+            series = df[col]
+            tz = getattr(series.dtype, "tz", None)
+            if tz is not None:
+                series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+            arr = np.ascontiguousarray(series.to_numpy())
+            if arr.dtype == object:
+                specs.append(SharedColumn(str(col), "", "", len(arr), values=df[col].array))
+                continue
+            shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            blocks.append(shm)
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[:] = arr
+            specs.append(SharedColumn(str(col), shm.name, arr.dtype.str, len(arr), tz=tz))
+    except Exception:
+        release(blocks)
+        raise
+    return specs, blocks
+
+
+def attach_frame(specs: list[SharedColumn]) -> tuple[pd.DataFrame, list[shared_memory.SharedMemory]]:
+    """Rebuild a read-only DataFrame view over blocks created by ``share_frame``.
+
+    Keep the returned blocks referenced for as long as the frame is in use.
+    Meant for child processes of the creator, which share its resource
+    tracker, so attaching does not take over ownership of the blocks.
+    """
+    columns: dict[str, np.ndarray] = {}
+    blocks: list[shared_memory.SharedMemory] = []
+    for spec in specs:
+        if spec.values is not None:
+            columns[spec.column] = spec.values
+            continue
+        shm = shared_memory.SharedMemory(name=spec.shm_name)
+        blocks.append(shm)
+        arr = np.ndarray((spec.length,), dtype=np.dtype(spec.dtype), buffer=shm.buf)
+        arr.flags.writeable = False
+        if spec.tz is not None:
+            # Localizing allocates a tz-aware copy; only this column leaves the block
+            utc = pd.Series(arr, copy=False).dt.tz_localize("UTC")
+            columns[spec.column] = utc.dt.tz_convert(spec.tz).array
+        else:
+            columns[spec.column] = arr
+    return pd.DataFrame(columns, copy=False), blocks
+
+
+def release(blocks: list[shared_memory.SharedMemory]) -> None:
+    """Close and unlink blocks created by ``share_frame``."""
+    for shm in blocks:
+        shm.close()
+        shm.unlink()
@@ -1,16 +1,51 @@
 """Walk-forward analysis with train/test splits."""
 
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from typing import Any
 
 import pandas as pd
 
 from src.backtest.engine import BacktestConfig
-from src.optimization.grid_search import GridSearch, GridResult
+from src.optimization.grid_search import (
+    GridResult,
+    GridSearch,
+    _evaluate,
+    _expand_grid,
+    _prepare_frame,
+    _to_grid_results,
+)
+from src.optimization.shared_frame import SharedColumn, attach_frame, release, share_frame
 from src.strategy.base import Strategy
 from src.utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# Per-process state for pooled workers, installed once per worker by _init_worker
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(specs: list[SharedColumn], ctx: dict[str, Any], param_grid: dict[str, list]) -> None:
+    """Pool initializer: map the full candle frame from shared memory once per worker."""
+    frame, blocks = attach_frame(specs)
+    _worker_state.update(
+        frame=frame, blocks=blocks, ctx=ctx, param_grid=param_grid,
+        window=None, window_ctx=None,
+    )
+
+
+def _evaluate_window(task: tuple[tuple[int, int], dict]) -> dict:
+    """Evaluate one parameter combination on rows [lo, hi) of the shared frame."""
+    (lo, hi), params = task
+    state = _worker_state
+    if state["window"] != (lo, hi):
+        # Tasks are submitted split by split, so only the current window is kept
+        train_df = state["frame"].iloc[lo:hi].reset_index(drop=True)
+        state["window_ctx"] = {"df": _prepare_frame(train_df, state["param_grid"]), **state["ctx"]}
+        state["window"] = (lo, hi)
+    return _evaluate(params, state["window_ctx"])
+
 
 @dataclass
 class SplitResult:
@@ -48,9 +83,12 @@ class WalkForward:
         symbol: str = "EURUSD=X",
         timeframe: str = "1h",
         max_workers: int = 1,
+        combos: Sequence[dict] | None = None,
     ) -> None:
         self.strategy_class = strategy_class
         self.param_grid = param_grid
+        # Expanded once here and reused for every split
+        self.combos = list(combos) if combos is not None else _expand_grid(param_grid)
         self.n_splits = n_splits
         self.train_pct = train_pct
         self.backtest_config = backtest_config or BacktestConfig()
@@ -58,6 +96,27 @@ class WalkForward:
         self.timeframe = timeframe
         self.max_workers = max_workers
 
+    def _grid_search(self, param_grid: dict[str, list], combos: list[dict] | None = None) -> GridSearch:
+        return GridSearch(
+            self.strategy_class, param_grid,
+            self.backtest_config, self.symbol, self.timeframe,
+            max_workers=1, combos=combos,
+        )
+
+    def _optimize(
+        self,
+        train_df: pd.DataFrame,
+        window: tuple[int, int],
+        executor: ProcessPoolExecutor | None,
+    ) -> list[GridResult]:
+        """Grid search one train window, on the shared pool when there is one."""
+        combos = self.combos
+        if executor is None or len(combos) <= 4:
+            return self._grid_search(self.param_grid, combos).run(train_df)
+        tasks = [(window, combo) for combo in combos]
+        chunksize = max(1, len(tasks) // (self.max_workers * 4))
+        return _to_grid_results(list(executor.map(_evaluate_window, tasks, chunksize=chunksize)))
+
     def run(self, df: pd.DataFrame) -> WalkForwardResult:
         """Run walk-forward analysis."""
         n = len(df)
@@ -67,59 +126,68 @@ class WalkForward:
 
         splits: list[SplitResult] = []
 
-        for i in range(self.n_splits):
-            start = i * window_size
-            train_end = start + train_size
-            test_end = min(start + window_size, n)
-
-            if train_end >= n or test_end > n:
-                break
-
-            train_df = df.iloc[start:train_end].reset_index(drop=True)
-            test_df = df.iloc[train_end:test_end].reset_index(drop=True)
-
-            if len(train_df) < 50 or len(test_df) < 10:
-                continue
-
-            log.info("walk_forward_split", split=i, train_rows=len(train_df), test_rows=len(test_df))
-
-            # Grid search on train set
-            gs = GridSearch(
-                self.strategy_class, self.param_grid,
-                self.backtest_config, self.symbol, self.timeframe,
+        # With several workers, one pool serves every split: the frame goes into shared
+        # memory once and workers slice train windows out of it, rather than each
+        # split's pool receiving a pickled copy of its train set
+        executor = None
+        blocks = []
+        if self.max_workers > 1 and n > 0:
+            specs, blocks = share_frame(df)
+            executor = ProcessPoolExecutor(
                 max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(specs, self._grid_search(self.param_grid, self.combos).context(), self.param_grid),
             )
-            train_results = gs.run(train_df)
-
-            if not train_results:
-                continue
 
-            best = train_results[0]
-
-            # Evaluate best params on test set
-            gs_test = GridSearch(
-                self.strategy_class, {k: [v] for k, v in best.params.items()},
-                self.backtest_config, self.symbol, self.timeframe,
-                max_workers=1,
-            )
-            test_results = gs_test.run(test_df)
-            oos = test_results[0] if test_results else GridResult({}, 0, 0, 0, 0, 0)
-
-            train_ts = train_df["timestamp"]
-            test_ts = test_df["timestamp"]
-
-            splits.append(SplitResult(
-                split_index=i,
-                train_start=str(train_ts.iloc[0]),
-                train_end=str(train_ts.iloc[-1]),
-                test_start=str(test_ts.iloc[0]),
-                test_end=str(test_ts.iloc[-1]),
-                best_params=best.params,
-                in_sample_sharpe=best.sharpe,
-                out_of_sample_sharpe=oos.sharpe,
-                out_of_sample_return=oos.total_return,
-                out_of_sample_trades=oos.trade_count,
-            ))
+        try:
+            for i in range(self.n_splits):
+                start = i * window_size
+                train_end = start + train_size
+                test_end = min(start + window_size, n)
+
+                if train_end >= n or test_end > n:
+                    break
+
+                train_df = df.iloc[start:train_end].reset_index(drop=True)
+                test_df = df.iloc[train_end:test_end].reset_index(drop=True)
+
+                if len(train_df) < 50 or len(test_df) < 10:
+                    continue
+
+                log.info("walk_forward_split", split=i, train_rows=len(train_df), test_rows=len(test_df))
+
+                # Grid search on train set
+                train_results = self._optimize(train_df, (start, train_end), executor)
+
+                if not train_results:
+                    continue
+
+                best = train_results[0]
+
+                # Evaluate best params on test set
+                gs_test = self._grid_search({k: [v] for k, v in best.params.items()})
+                test_results = gs_test.run(test_df)
+                oos = test_results[0] if test_results else GridResult({}, 0, 0, 0, 0, 0)
+
+                train_ts = train_df["timestamp"]
+                test_ts = test_df["timestamp"]
+
+                splits.append(SplitResult(
+                    split_index=i,
+                    train_start=str(train_ts.iloc[0]),
+                    train_end=str(train_ts.iloc[-1]),
+                    test_start=str(test_ts.iloc[0]),
+                    test_end=str(test_ts.iloc[-1]),
+                    best_params=best.params,
+                    in_sample_sharpe=best.sharpe,
+                    out_of_sample_sharpe=oos.sharpe,
+                    out_of_sample_return=oos.total_return,
+                    out_of_sample_trades=oos.trade_count,
+                ))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            release(blocks)
 
         # Aggregate
         avg_is = sum(s.in_sample_sharpe for s in splits) / len(splits) if splits else 0
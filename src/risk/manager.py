@@ -2,6 +2,7 @@
 
 import threading
 from datetime import date, datetime, timezone
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 from config.settings import (
@@ -14,6 +15,7 @@ from config.settings import (
     POSITION_SIZE_METHOD,
     RISK_PER_TRADE,
     PIP_VALUES,
+    SYMBOL_SIDE_TO_GROUP,
 )
 from src.broker.base import Broker
 from src.utils.logger import get_logger
@@ -34,7 +36,7 @@ class RiskManager:
         position_size_method: str = POSITION_SIZE_METHOD,
         kelly_fraction: float = KELLY_FRACTION,
         risk_per_trade: float = RISK_PER_TRADE,
-        correlation_groups: dict[str, list[str]] | None = None,
+        correlation_groups: Mapping[str, Iterable[str]] | None = None,
     ) -> None:
         self.broker = broker
         self.max_daily_loss_pct = max_daily_loss_pct
@@ -44,7 +46,14 @@ class RiskManager:
         self.position_size_method = position_size_method
         self.kelly_fraction = kelly_fraction
         self.risk_per_trade = risk_per_trade
-        self.correlation_groups = correlation_groups or CORRELATION_GROUPS
+        if correlation_groups:
+            self.correlation_groups = {k: frozenset(v) for k, v in correlation_groups.items()}
+            self._group_index = {
+                key: group for group, keys in self.correlation_groups.items() for key in keys
+            }
+        else:
+            self.correlation_groups = CORRELATION_GROUPS
+            self._group_index = SYMBOL_SIDE_TO_GROUP
 
         self._lock = threading.Lock()
         self._circuit_breaker_active = False
@@ -94,22 +103,21 @@ class RiskManager:
                 return False
 
             # Correlated exposure
-            new_key = f"{symbol}_{side}"
-            for group_name, group_keys in self.correlation_groups.items():
-                if new_key in group_keys:
-                    count = 0
-                    for pos in positions:
-                        pos_key = f"{pos['symbol']}_{pos['side']}"
-                        if pos_key in group_keys:
-                            count += 1
-                    if count >= self.max_correlated_exposure:
-                        log.warning(
-                            "correlated_exposure_limit",
-                            group=group_name,
-                            count=count,
-                            max=self.max_correlated_exposure,
-                        )
-                        return False
+            group_name = self._group_index.get(f"{symbol}_{side}")
+            if group_name is not None:
+                group_keys = self.correlation_groups[group_name]
+                count = 0
+                for pos in positions:
+                    if f"{pos['symbol']}_{pos['side']}" in group_keys:
+                        count += 1
+                if count >= self.max_correlated_exposure:
+                    log.warning(
+                        "correlated_exposure_limit",
+                        group=group_name,
+                        count=count,
+                        max=self.max_correlated_exposure,
+                    )
+                    return False
 
             return True
 
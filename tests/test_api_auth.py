@@ -26,14 +26,14 @@ def client(mgr):
 
 
 class TestAuthDisabled:
-    @patch("src.api.auth.API_KEY", "")
+    @patch("src.api.auth._API_KEY_BYTES", b"")
     def test_all_routes_accessible_without_key(self, client):
         """When API_KEY is empty, auth is disabled."""
         resp = client.get("/api/account")
         # Should get 400 (no broker), not 401
         assert resp.status_code != 401
 
-    @patch("src.api.auth.API_KEY", "")
+    @patch("src.api.auth._API_KEY_BYTES", b"")
     def test_health_always_accessible(self, client):
         resp = client.get("/health")
         assert resp.status_code == 200
@@ -41,24 +41,32 @@ class TestAuthDisabled:
 
 
 class TestAuthEnabled:
-    @patch("src.api.auth.API_KEY", "test-secret-key")
+    @patch("src.api.auth._API_KEY_BYTES", b"test-secret-key")
     def test_401_without_key(self, client):
         resp = client.get("/api/account")
         assert resp.status_code == 401
 
-    @patch("src.api.auth.API_KEY", "test-secret-key")
+    @patch("src.api.auth._API_KEY_BYTES", b"test-secret-key")
     def test_401_wrong_key(self, client):
         resp = client.get("/api/account", headers={"X-API-Key": "wrong-key"})
         assert resp.status_code == 401
 
-    @patch("src.api.auth.API_KEY", "test-secret-key")
+    @patch("src.api.auth._API_KEY_BYTES", b"test-secret-key")
     def test_200_with_header_key(self, client):
         resp = client.get("/api/account", headers={"X-API-Key": "test-secret-key"})
         # Should get 400 (no broker), not 401
         assert resp.status_code != 401
 
-    @patch("src.api.auth.API_KEY", "test-secret-key")
+    @patch("src.api.auth._API_KEY_BYTES", b"test-secret-key")
     def test_200_with_query_key(self, client):
         resp = client.get("/api/account?api_key=test-secret-key")
         # Should get 400 (no broker), not 401
         assert resp.status_code != 401
+
+    @patch("src.api.auth._API_KEY_BYTES", b"test-secret-key")
+    def test_header_takes_precedence_over_query(self, client):
+        resp = client.get(
+            "/api/account?api_key=wrong-key",
+            headers={"X-API-Key": "test-secret-key"},
+        )
+        assert resp.status_code != 401
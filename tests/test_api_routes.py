@@ -109,6 +109,80 @@ class TestCandlesRoute:
         resp = client.get("/api/candles")
         assert resp.status_code == 400
 
+    def test_returns_tail(self, client, mgr):
+        import pandas as pd
+        from src.engine.trading import TradingEngine
+
+        _inject_broker(mgr, PaperBroker())
+        engine = TradingEngine(
+            strategy=EMACrossoverStrategy(), feed=DemoFeed(), broker=PaperBroker(),
+        )
+        engine._aggregator.seed_history(pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=3, freq="h"),
+            "open": [1.0, 1.1, 1.2], "high": [1.05, 1.15, 1.25],
+            "low": [0.95, 1.05, 1.15], "close": [1.02, 1.12, 1.22],
+        }))
+        mgr._engines["test"].engine = engine
+        resp = client.get("/api/candles?limit=2&engine_id=test")
+        assert resp.status_code == 200
+        assert resp.json() == [
+            {"timestamp": "2024-01-01 01:00:00", "open": 1.1, "high": 1.15,
+             "low": 1.05, "close": 1.12, "volume": 0.0},
+            {"timestamp": "2024-01-01 02:00:00", "open": 1.2, "high": 1.25,
+             "low": 1.15, "close": 1.22, "volume": 0.0},
+        ]
+
+
+    def test_ndjson_stream(self, client, mgr):
+        import json
+        import pandas as pd
+        from src.engine.trading import TradingEngine
+
+        _inject_broker(mgr, PaperBroker())
+        engine = TradingEngine(
+            strategy=EMACrossoverStrategy(), feed=DemoFeed(), broker=PaperBroker(),
+        )
+        engine._aggregator.seed_history(pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=3, freq="h"),
+            "open": [1.0, 1.1, 1.2], "high": [1.05, 1.15, 1.25],
+            "low": [0.95, 1.05, 1.15], "close": [1.02, 1.12, 1.22],
+        }))
+        mgr._engines["test"].engine = engine
+        resp = client.get("/api/candles.ndjson?limit=2&engine_id=test")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in resp.text.splitlines()]
+        assert rows == client.get("/api/candles?limit=2&engine_id=test").json()
+
+
+class TestSnapshotRoute:
+    def test_no_engine(self, client):
+        assert client.get("/api/snapshot").status_code == 400
+        assert client.get("/api/snapshot?engine_id=missing").status_code == 404
+
+    def test_combines_endpoints(self, client, mgr):
+        import pandas as pd
+        from src.engine.trading import TradingEngine
+
+        broker = PaperBroker()
+        broker.update_price("EURUSD=X", 1.085, 1.0852)
+        broker.place_order("EURUSD=X", OrderSide.BUY, 0.001, sl=1.08, tp=1.09)
+        _inject_broker(mgr, broker)
+        engine = TradingEngine(strategy=EMACrossoverStrategy(), feed=DemoFeed(), broker=broker)
+        engine._aggregator.seed_history(pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=3, freq="h"),
+            "open": [1.0, 1.1, 1.2], "high": [1.05, 1.15, 1.25],
+            "low": [0.95, 1.05, 1.15], "close": [1.02, 1.12, 1.22],
+        }))
+        mgr._engines["test"].engine = engine
+
+        resp = client.get("/api/snapshot?candle_limit=2")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["account"] == client.get("/api/account").json()
+        assert data["positions"] == client.get("/api/positions").json()
+        assert data["candles"] == client.get("/api/candles?limit=2").json()
+
 
 class TestStrategyRoute:
     @patch("src.engine.trading.TradingEngine.start")
@@ -143,6 +217,18 @@ class TestStrategyRoute:
         assert resp.status_code == 200
         assert resp.json()["running"] is False
 
+    @patch("src.engine.trading.TradingEngine.start")
+    def test_status_etag(self, mock_start, client, mgr):
+        etag = client.get("/api/strategy/status").headers["etag"]
+        resp = client.get("/api/strategy/status", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+        client.post("/api/strategy/start", json={"strategy": "ema_crossover"})
+        resp = client.get("/api/strategy/status", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+        assert len(resp.json()["engines"]) == 1
+
     @patch("src.engine.trading.TradingEngine.start")
     def test_update_params(self, mock_start, client, mgr):
         # Start first
@@ -53,3 +53,105 @@ class TestWebSocket:
         with client.websocket_connect("/ws/stream") as ws:
             ws.send_text("ping")
             ws.receive_text()  # pong
+
+
+class TestEncodeMessage:
+    def test_numpy_and_timestamps(self):
+        import numpy as np
+        import pandas as pd
+
+        from src.api.ws import encode_message
+
+        data = encode_message({
+            "type": "tick",
+            "data": {
+                "bid": np.float64(1.085),
+                "count": np.int64(3),
+                "spread": float("nan"),
+                "timestamp": pd.Timestamp("2024-01-15 10:00"),
+            },
+        })
+        assert json.loads(data)["data"] == {
+            "bid": 1.085,
+            "count": 3,
+            "spread": None,
+            "timestamp": "2024-01-15 10:00:00",
+        }
+
+
+class TestConnectionManager:
+    def test_broadcast_sends_to_all_and_drops_dead(self):
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from src.api.ws import ConnectionManager
+
+        cm = ConnectionManager()
+        alive, dead = AsyncMock(), AsyncMock()
+        dead.send_text.side_effect = RuntimeError("closed")
+        asyncio.run(cm.connect(alive))
+        asyncio.run(cm.connect(dead))
+
+        asyncio.run(cm.broadcast({"type": "tick"}))
+
+        alive.send_text.assert_awaited_once_with('{"type":"tick"}')
+        assert cm.client_count == 1
+
+    def test_broadcast_without_clients_skips_encoding(self):
+        import asyncio
+        from unittest.mock import patch
+
+        from src.api.ws import ConnectionManager
+
+        with patch("src.api.ws.encode_message") as encode:
+            asyncio.run(ConnectionManager().broadcast({"type": "tick"}))
+        encode.assert_not_called()
+
+
+class TestEventHandler:
+    def test_engine_thread_event_reaches_loop(self):
+        import asyncio
+        import threading
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from src.api import ws as ws_mod
+
+        loop = asyncio.new_event_loop()
+        fake = MagicMock(client_count=1, broadcast=AsyncMock())
+        handler = ws_mod._make_event_handler("e1")
+        try:
+            with patch.object(ws_mod, "_loop", loop), patch.object(ws_mod, "ws_manager", fake):
+                # Engine events fire on a non-loop thread
+                t = threading.Thread(target=handler, args=("signal", {"side": "BUY"}))
+                t.start()
+                t.join()
+                loop.run_until_complete(asyncio.sleep(0.01))
+        finally:
+            loop.close()
+
+        fake.broadcast.assert_awaited_once_with(
+            {"type": "signal", "data": {"side": "BUY"}, "engine_id": "e1"}
+        )
+
+    def test_burst_is_coalesced_into_one_batch(self):
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from src.api import ws as ws_mod
+
+        loop = asyncio.new_event_loop()
+        fake = MagicMock(client_count=1, broadcast=AsyncMock())
+        handler = ws_mod._make_event_handler("e1")
+        try:
+            with patch.object(ws_mod, "_loop", loop), patch.object(ws_mod, "ws_manager", fake):
+                handler("signal", {"n": 1})
+                handler("order_filled", {"n": 2})
+                loop.run_until_complete(asyncio.sleep(0.01))
+        finally:
+            loop.close()
+
+        fake.broadcast.assert_awaited_once()
+        message = fake.broadcast.await_args.args[0]
+        assert message["type"] == "batch"
+        assert [e["type"] for e in message["events"]] == ["signal", "order_filled"]
+
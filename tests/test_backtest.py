@@ -2,7 +2,8 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.backtest.engine import BacktestConfig, BacktestEngine
+from src.backtest import _kernels
+from src.backtest.engine import BacktestConfig, BacktestEngine, run_grid
 from src.backtest.metrics import BacktestMetrics, calculate_metrics, format_metrics
 
 
@@ -247,6 +248,83 @@ class TestRiskSizing:
         assert vol != 1.0
 
 
+class TestRunGrid:
+    def test_pool_matches_direct_runs(self):
+        frames = {}
+        for i, symbol in enumerate(("EURUSD=X", "GBPUSD=X", "USDJPY=X")):
+            df = _make_df(n=300, seed=i)
+            df.loc[::20, "signal"] = 1
+            df.loc[::20, "sl"] = df["close"] - 0.0005
+            df.loc[::20, "tp"] = df["close"] + 0.0005
+            frames[symbol] = df
+        configs = [BacktestConfig(capital=10000, max_positions=m) for m in (1, 3)]
+
+        pooled = run_grid(frames, configs, strategy_name="test", max_workers=2)
+
+        assert set(pooled) == {(s, i) for s in frames for i in range(2)}
+        for (symbol, i), result in pooled.items():
+            direct = BacktestEngine(configs[i], symbol=symbol, strategy_name="test").run(frames[symbol])
+            pd.testing.assert_series_equal(result.equity_curve, direct.equity_curve)
+            pd.testing.assert_frame_equal(result.trades, direct.trades)
+
+
+class TestBarKernel:
+    @pytest.mark.parametrize("kernel", [
+        _kernels._run_bars,
+        pytest.param(
+            _kernels.run_bars,
+            marks=pytest.mark.skipif(not _kernels.NUMBA_AVAILABLE, reason="numba not installed"),
+        ),
+    ])
+    def test_sl_before_tp_and_end_close(self, kernel):
+        close = np.array([1.10, 1.10, 1.10, 1.10, 1.12])
+        high = np.array([1.10, 1.11, 1.10, 1.10, 1.12])
+        low = np.array([1.10, 1.09, 1.10, 1.10, 1.12])
+        signal = np.array([1, 0, -1, 0, 0])
+        sl = np.array([1.095, np.nan, 1.15, np.nan, np.nan])
+        tp = np.array([1.105, np.nan, 1.05, np.nan, np.nan])
+
+        equity, side, entry_bar, exit_bar, entry, exit_, volume, pnl, _, _, reason = kernel(
+            close, high, low, signal, sl, tp, 10000.0, 0.0, 0.0001, 0.02, 3, False,
+        )
+        # Bar 1 touches both SL and TP of the BUY: SL wins
+        assert list(side) == [1, -1]
+        assert list(reason) == [_kernels.EXIT_SL, _kernels.EXIT_END]
+        assert list(entry_bar) == [0, 2]
+        assert list(exit_bar) == [1, 4]
+        assert pnl == pytest.approx([-50.0, -200.0])
+        assert equity[-1] == pytest.approx(10000.0 - 250.0)
+
+    @pytest.mark.parametrize("use_risk_sizing", [True, False])
+    def test_vectorized_matches_bar_loop_for_one_position(self, use_risk_sizing):
+        rng = np.random.default_rng(7)
+        n = 2000
+        close = 1.1 + np.cumsum(rng.normal(0, 0.0005, n))
+        high = close + np.abs(rng.normal(0, 0.0004, n))
+        low = close - np.abs(rng.normal(0, 0.0004, n))
+        signal = np.where(rng.random(n) < 0.05, rng.choice([1, -1], n), 0)
+        sl = np.where(signal == 1, close - 0.002, close + 0.002)
+        tp = np.where(signal == 1, close + 0.003, close - 0.003)
+        sl[rng.random(n) < 0.05] = np.nan
+
+        expected = _kernels._run_bars(
+            close, high, low, signal, sl, tp, 10000.0, 0.00013, 0.0001, 0.02, 1, use_risk_sizing,
+        )
+        got = _kernels.run_vectorized(
+            close, high, low, signal, sl, tp, 10000.0, 0.00013, 0.0001, 0.02, use_risk_sizing,
+        )
+        assert len(expected[1]) > 10
+        for a, b in zip(expected, got):
+            np.testing.assert_array_equal(a, b)
+
+
+    def test_fused_drawdown_matches_numpy(self):
+        rng = np.random.default_rng(3)
+        equity = 10000 + np.cumsum(rng.normal(0, 50, 1000))
+        assert _kernels._max_drawdown_loop(equity) == _kernels._max_drawdown_numpy(equity)
+        flat_start = np.array([0.0, 0.0, 5.0, 3.0])
+        assert _kernels._max_drawdown_loop(flat_start) == pytest.approx(0.4)
+
 class TestMetrics:
     def test_empty_trades(self):
         trades_df = pd.DataFrame()
@@ -4,7 +4,9 @@ import pytest
 from datetime import date, datetime
 from unittest.mock import MagicMock, patch, call
 
-from src.database.repository import TradeRepository
+import pandas as pd
+
+from src.database.repository import CandleRepository, TradeRepository
 
 
 class MockSession:
@@ -90,6 +92,29 @@ class TestInsertTrade:
         assert params["run_id"] == 5
         assert params["strategy_name"] == "ema_crossover"
 
+    @patch("src.database.repository.SessionLocal")
+    def test_insert_trades_passes_rows_as_executemany(self, mock_session_cls):
+        session = MockSession()
+        mock_session_cls.return_value = session
+
+        df = pd.DataFrame({
+            "strategy_name": ["ema_crossover"] * 3,
+            "symbol": ["EURUSD=X"] * 3,
+            "timeframe": ["1h"] * 3,
+            "side": ["BUY", "SELL", "BUY"],
+            "entry_time": pd.date_range("2024-01-01", periods=3, freq="h"),
+            "entry_price": [1.10, 1.11, 1.12],
+            "volume": [0.1, 0.2, 0.3],
+            "pnl": [5.0, -2.0, 1.0],
+        })
+        assert TradeRepository().insert_trades(df) == 3
+        assert session.committed
+        assert len(session.executed) == 1
+        rows = session.executed[0][1]
+        assert [r["side"] for r in rows] == ["BUY", "SELL", "BUY"]
+        assert rows[1]["pnl"] == -2.0
+        assert rows[0]["exit_time"] is None
+
 
 class TestPerformanceSummary:
     @patch("src.database.repository.engine")
@@ -236,3 +261,66 @@ class TestAutoPersist:
             run_id=42, repository=MagicMock(),
         )
         assert engine.run_id == 42
+
+
+class TestBulkUpsertCandles:
+    def _repo(self, rowcount=2):
+        raw = MagicMock()
+        cur = raw.cursor.return_value.__enter__.return_value
+        cur.rowcount = rowcount
+        db_engine = MagicMock()
+        db_engine.raw_connection.return_value = raw
+        return CandleRepository(db_engine=db_engine), raw, cur
+
+    def test_copies_then_merges(self):
+        repo, raw, cur = self._repo()
+        df = pd.DataFrame({
+            "timestamp": pd.to_datetime(["2024-01-01 00:00", "2024-01-01 01:00"], utc=True),
+            "open": [1.1, 1.2], "high": [1.15, 1.25],
+            "low": [1.05, 1.15], "close": [1.12, 1.22],
+        })
+
+        count = repo.bulk_upsert_candles(df, "EURUSD=X", "1h")
+
+        assert count == 2
+        sql, buf = cur.copy_expert.call_args[0]
+        assert sql.startswith("COPY _staging_candles")
+        lines = buf.getvalue().splitlines()
+        assert len(lines) == 2
+        assert ",EURUSD=X,1h,1.1,1.15,1.05,1.12,0.0," in lines[0]
+        assert "ON CONFLICT" in cur.execute.call_args_list[-1][0][0]
+        raw.commit.assert_called_once()
+        raw.close.assert_called_once()
+
+    def test_rolls_back_on_error(self):
+        repo, raw, cur = self._repo()
+        cur.copy_expert.side_effect = RuntimeError("copy failed")
+        df = pd.DataFrame({
+            "timestamp": pd.to_datetime(["2024-01-01"], utc=True),
+            "open": [1.0], "high": [1.0], "low": [1.0], "close": [1.0],
+        })
+
+        with pytest.raises(RuntimeError):
+            repo.bulk_upsert_candles(df, "EURUSD=X", "1h")
+        raw.rollback.assert_called_once()
+        raw.close.assert_called_once()
+
+    def test_empty_frame_is_noop(self):
+        repo, raw, _ = self._repo()
+        assert repo.bulk_upsert_candles(pd.DataFrame(), "EURUSD=X", "1h") == 0
+        raw.cursor.assert_not_called()
+
+
+class TestStatementCacheArgs:
+    def test_psycopg2_needs_no_args(self):
+        from src.database.engine import _connect_args
+        assert _connect_args("psycopg2", 0) == {}
+        assert _connect_args("psycopg2", 100) == {}
+
+    def test_psycopg3_disabled_for_pgbouncer(self):
+        from src.database.engine import _connect_args
+        assert _connect_args("psycopg", 0) == {"prepare_threshold": None}
+
+    def test_psycopg3_cache_size(self):
+        from src.database.engine import _connect_args
+        assert _connect_args("psycopg", 64) == {"prepare_threshold": 5, "prepared_max": 64}
@@ -0,0 +1,44 @@
+"""Tests for DemoFeed — yfinance download with synthetic fallback."""
+
+import sys
+import time
+import types
+
+sys.path.insert(0, ".")
+
+import pandas as pd
+
+from src.data.demo_feed import DemoFeed
+
+SYMBOLS = ["EURUSD=X", "GBPUSD=X", "USDJPY=X"]
+
+
+def _fake_yfinance():
+    """yfinance stand-in that shares one result slot across calls, like yf.download."""
+    shared = {}
+
+    def download(symbol, start, end, interval, **kwargs):
+        shared.clear()
+        time.sleep(0.005)
+        shared[symbol] = pd.DataFrame(
+            {"Open": 1.0, "High": 1.0, "Low": 1.0,
+             "Close": float(SYMBOLS.index(symbol) + 1), "Volume": 100},
+            index=pd.date_range("2024-01-01", periods=5, freq="h"),
+        )
+        time.sleep(0.005)
+        # Reads back whatever the most recent call left behind
+        return next(iter(shared.values()), pd.DataFrame())
+
+    return types.SimpleNamespace(download=download)
+
+
+class TestGetHistoricalBatch:
+    def test_concurrent_fetches_keep_their_own_symbol(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "yfinance", _fake_yfinance())
+        feed = DemoFeed()
+        for _ in range(5):
+            frames = feed.get_historical_batch(SYMBOLS, "1h", "2024-01-01", "2024-01-02")
+            for i, symbol in enumerate(SYMBOLS):
+                df = frames[symbol]
+                assert len(df) == 5  # from yfinance, not the synthetic fallback
+                assert (df["close"] == i + 1).all()
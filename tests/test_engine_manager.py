@@ -1,6 +1,7 @@
 """Tests for EngineManager."""
 
 import sys
+import threading
 from unittest.mock import MagicMock, PropertyMock, patch
 
 sys.path.insert(0, ".")
@@ -51,6 +52,54 @@ class TestEngineManager:
         with pytest.raises(RuntimeError, match="already running"):
             mgr.start_engine(strategy, feed, broker, "EURUSD=X", "1h", engine_id=eid)
 
+    @patch("src.engine.trading.TradingEngine.start")
+    def test_reads_do_not_wait_for_writer(self, mock_start):
+        mgr = EngineManager()
+        broker = PaperBroker()
+        mgr.start_engine(EMACrossoverStrategy(), DemoFeed(), broker, "EURUSD=X", "1h")
+
+        # Simulate a start/stop in progress on another thread
+        with mgr._lock:
+            assert mgr.broker is broker
+            assert len(mgr.list_engines()) == 1
+
+    def test_slow_warmup_does_not_block_other_starts(self):
+        release = threading.Event()
+        entered = threading.Event()
+
+        def slow_start(self):
+            if self.symbol == "EURUSD=X":
+                entered.set()
+                release.wait(5)
+
+        mgr = EngineManager()
+        with patch("src.engine.trading.TradingEngine.start", slow_start):
+            t = threading.Thread(
+                target=mgr.start_engine,
+                args=(EMACrossoverStrategy(), DemoFeed(), PaperBroker(), "EURUSD=X", "1h"),
+            )
+            t.start()
+            assert entered.wait(5)
+            # Same id is reserved while the first start is warming up
+            with pytest.raises(RuntimeError, match="already starting"):
+                mgr.start_engine(
+                    EMACrossoverStrategy(), DemoFeed(), PaperBroker(), "EURUSD=X", "1h",
+                    engine_id="ema_crossover_EURUSD=X_1h",
+                )
+            mgr.start_engine(EMACrossoverStrategy(), DemoFeed(), PaperBroker(), "GBPUSD=X", "1h")
+            release.set()
+            t.join(5)
+        assert len(mgr.list_engines()) == 2
+
+    @patch("src.engine.trading.TradingEngine.start")
+    def test_status_etag_differs_across_managers(self, mock_start):
+        # Same start sequence in a fresh process must not reuse the old tag
+        first, second = EngineManager(), EngineManager()
+        for mgr in (first, second):
+            mgr.start_engine(EMACrossoverStrategy(), DemoFeed(), PaperBroker(), "EURUSD=X", "1h")
+        assert first.state_version == second.state_version
+        assert first.status_etag() != second.status_etag()
+
     @patch("src.engine.trading.TradingEngine.start")
     @patch("src.engine.trading.TradingEngine.stop")
     def test_stop_engine(self, mock_stop, mock_start):
@@ -27,6 +27,15 @@ class TestEventBus:
         assert len(results_a) == 1
         assert len(results_b) == 1
 
+    def test_subscribe_many(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe_many(("tick", "signal"), lambda t, d: received.append(t))
+        bus.publish("tick")
+        bus.publish("signal")
+        bus.publish("order_filled")
+        assert received == ["tick", "signal"]
+
     def test_unsubscribe(self):
         bus = EventBus()
         received = []
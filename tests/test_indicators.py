@@ -3,6 +3,7 @@ import pandas as pd
 import pytest
 
 from src.data.indicators import (
+    IndicatorState,
     add_all_indicators,
     atr,
     bollinger_bands,
@@ -134,3 +135,86 @@ class TestAddAllIndicators:
         original_cols = list(sample_df.columns)
         add_all_indicators(sample_df)
         assert list(sample_df.columns) == original_cols
+
+
+class TestNumexprPath:
+    def test_matches_numpy_path(self, sample_df, monkeypatch):
+        pytest.importorskip("numexpr")
+        from src.data import indicators
+
+        monkeypatch.setattr(indicators, "NUMEXPR_AVAILABLE", False)
+        expected = add_all_indicators(sample_df)
+        monkeypatch.setattr(indicators, "NUMEXPR_AVAILABLE", True)
+        monkeypatch.setattr(indicators, "_NUMEXPR_MIN_ROWS", 0)
+        pd.testing.assert_frame_equal(add_all_indicators(sample_df), expected)
+
+
+class TestKernelPath:
+    def test_interpreted_kernels_match_pandas(self, sample_df, monkeypatch):
+        """The numba kernels, run uncompiled, reproduce the pandas indicators exactly."""
+        from src.data import _indicator_kernels as kernels
+        from src.data import indicators
+
+        df = sample_df.copy()
+        df.loc[50, "close"] = np.nan
+        monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", False)
+        expected = add_all_indicators(df)
+        monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", True)
+        monkeypatch.setattr(kernels, "ewm_mean", kernels._ewm, raising=False)
+        monkeypatch.setattr(kernels, "rsi_kernel", kernels._rsi, raising=False)
+        monkeypatch.setattr(kernels, "atr_kernel", kernels._atr, raising=False)
+        pd.testing.assert_frame_equal(indicators.add_all_indicators(df), expected, check_exact=True)
+
+
+class TestIndicatorState:
+    @pytest.mark.parametrize("split", [0, 1, 150])
+    def test_updates_match_full_recompute(self, sample_df, split):
+        state = IndicatorState()
+        state.backfill(sample_df.iloc[:split])
+        rows = [state.update(bar) for bar in sample_df.iloc[split:].to_dict("records")]
+
+        expected = add_all_indicators(sample_df).iloc[split:]
+        result = pd.DataFrame(rows, index=expected.index)
+        pd.testing.assert_frame_equal(result, expected[result.columns], rtol=1e-9)
+
+    def test_backfill_returns_indicator_frame(self, sample_df):
+        result = IndicatorState(ema_periods=[5]).backfill(sample_df)
+        pd.testing.assert_frame_equal(result, add_all_indicators(sample_df, ema_periods=[5]))
+
+
+class TestIndicatorCache:
+    def test_second_call_hits_disk(self, sample_df, tmp_path, monkeypatch):
+        from src.data import indicator_cache
+
+        calls = []
+        real = indicator_cache.add_all_indicators
+
+        def counting(df, **kwargs):
+            calls.append(1)
+            return real(df, **kwargs)
+
+        monkeypatch.setattr(indicator_cache, "add_all_indicators", counting)
+
+        first = indicator_cache.cached_add_all_indicators(sample_df, cache_dir=tmp_path)
+        second = indicator_cache.cached_add_all_indicators(sample_df, cache_dir=tmp_path)
+
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(first, second)
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+    def test_params_and_data_change_key(self, sample_df, tmp_path):
+        from src.data.indicator_cache import cached_add_all_indicators
+
+        cached_add_all_indicators(sample_df, cache_dir=tmp_path)
+        cached_add_all_indicators(sample_df, cache_dir=tmp_path, rsi_period=7)
+        changed = sample_df.copy()
+        changed.loc[0, "close"] += 0.01
+        cached_add_all_indicators(changed, cache_dir=tmp_path)
+
+        assert len(list(tmp_path.glob("*.pkl"))) == 3
+
+    def test_empty_cache_dir_disables(self, sample_df):
+        from src.data.indicator_cache import cached_add_all_indicators
+
+        result = cached_add_all_indicators(sample_df, cache_dir="")
+        assert "rsi" in result.columns
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
+from src.api.schemas import AccountResponse
 from src.api.state import EngineManager, EngineInstance
 from src.engine.event_bus import EventBus
 
@@ -144,6 +145,12 @@ class TestMultiEngine:
         eid2 = mgr._generate_engine_id("ema_crossover", "EURUSD=X", "1h")
         assert eid2 == "ema_crossover_EURUSD=X_1h_2"
 
+    def test_engine_id_generation_skips_explicit_ids(self):
+        mgr = EngineManager()
+        mgr._engines["ema_crossover_EURUSD=X_1h"] = MagicMock()
+        eid = mgr._generate_engine_id("ema_crossover", "EURUSD=X", "1h")
+        assert eid == "ema_crossover_EURUSD=X_1h_2"
+
     def test_duplicate_engine_id_rejected(self):
         mgr = EngineManager()
         engine = _mock_engine(running=True)
@@ -226,3 +233,28 @@ class TestMultiEngine:
         assert account["equity"] == 15300
         assert account["open_positions"] == 3
         assert account["total_pnl"] == 300
+        assert set(account) == set(AccountResponse.model_fields)
+
+    @patch("src.engine.trading.TradingEngine.start")
+    def test_snapshot_rebuilt_only_on_start(self, mock_start):
+        mgr = EngineManager()
+        mgr.start_engine(_mock_strategy(), _mock_feed(), _mock_broker(), "EURUSD=X", "1h")
+        buses = mgr.engine_event_buses()
+        assert mgr.engine_event_buses() is buses
+
+        mgr.start_engine(_mock_strategy(), _mock_feed(), _mock_broker(), "GBPUSD=X", "1h")
+        assert len(mgr.engine_event_buses()) == 2
+
+    def test_all_trades_do_not_mutate_broker_records(self):
+        mgr = EngineManager()
+        stored = {"symbol": "EURUSD=X", "pnl": 5.0}
+        broker = _mock_broker()
+        broker.get_closed_trades.return_value = [stored]
+        mgr._engines["e1"] = EngineInstance(
+            engine_id="e1", engine=_mock_engine(), broker=broker,
+            feed=_mock_feed(), strategy=_mock_strategy(), event_bus=EventBus(),
+        )
+
+        trades = mgr.get_all_trades()
+        assert trades == [{"symbol": "EURUSD=X", "pnl": 5.0, "engine_id": "e1"}]
+        assert "engine_id" not in stored
@@ -115,6 +115,17 @@ class TestNotificationService:
         assert len(b1.sent) == 0
         assert len(b2.sent) == 1
 
+    @pytest.mark.asyncio
+    async def test_drain_sends_queued_messages(self):
+        b = MockBackend()
+        svc = NotificationService([b])
+        queue = asyncio.Queue()
+        task = asyncio.create_task(svc.drain(queue))
+        queue.put_nowait(("Subject", "Body"))
+        await queue.join()
+        task.cancel()
+        assert b.sent == [("Subject", "Body")]
+
     def test_format_order_filled(self):
         subject, body = NotificationService._format_message(
             "order_filled", {"side": "BUY", "price": 1.1234, "volume": 0.5, "order_id": "P-001"}
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, ".")
 
+import orjson
 import pytest
 import requests as req_lib
 
@@ -25,17 +26,22 @@ class TestOandaBrokerProperties:
         broker = _make_broker()
         assert broker.server_managed_sl_tp is True
 
+    def test_session_carries_auth_header(self):
+        broker = _make_broker()
+        assert broker._session.headers["Authorization"] == "Bearer test-token"
+        assert broker._session.get_adapter("https://api-fxpractice.oanda.com")._pool_maxsize == 8
+
 
 class TestPlaceOrder:
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_market_order_buy(self, mock_req):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = orjson.dumps({
             "orderFillTransaction": {
                 "price": "1.08500",
                 "tradeOpened": {"tradeID": "12345", "units": "10000"},
             }
-        }
+        })
         mock_resp.raise_for_status = MagicMock()
         mock_req.return_value = mock_resp
 
@@ -45,15 +51,15 @@ class TestPlaceOrder:
         assert result.order_id == "12345"
         assert result.price == 1.085
 
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_market_order_sell_units_negative(self, mock_req):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = orjson.dumps({
             "orderFillTransaction": {
                 "price": "1.08500",
                 "tradeOpened": {"tradeID": "12346", "units": "-10000"},
             }
-        }
+        })
         mock_resp.raise_for_status = MagicMock()
         mock_req.return_value = mock_resp
 
@@ -62,11 +68,11 @@ class TestPlaceOrder:
         assert result.success
         # Check that the POST sent negative units
         call_args = mock_req.call_args
-        body = call_args.kwargs.get("json") or call_args[1].get("json")
+        body = orjson.loads(call_args.kwargs["data"])
         units_sent = int(body["order"]["units"])
         assert units_sent < 0
 
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_order_rejection(self, mock_req):
         mock_resp = MagicMock()
         mock_error_resp = MagicMock()
@@ -84,15 +90,15 @@ class TestPlaceOrder:
 
 
 class TestClosePosition:
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_close_success(self, mock_req):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = orjson.dumps({
             "orderFillTransaction": {
                 "price": "1.08600",
                 "units": "-10000",
             }
-        }
+        })
         mock_resp.raise_for_status = MagicMock()
         mock_req.return_value = mock_resp
 
@@ -103,10 +109,10 @@ class TestClosePosition:
 
 
 class TestGetPositions:
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_returns_positions(self, mock_req):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = orjson.dumps({
             "trades": [
                 {
                     "id": "100",
@@ -119,7 +125,7 @@ class TestGetPositions:
                     "openTime": "2024-01-15T10:00:00Z",
                 }
             ]
-        }
+        })
         mock_resp.raise_for_status = MagicMock()
         mock_req.return_value = mock_resp
 
@@ -131,10 +137,10 @@ class TestGetPositions:
 
 
 class TestGetAccountInfo:
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_returns_account(self, mock_req):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = orjson.dumps({
             "account": {
                 "balance": "10000.00",
                 "NAV": "10050.00",
@@ -143,7 +149,7 @@ class TestGetAccountInfo:
                 "marginUsed": "100.00",
                 "marginAvailable": "9900.00",
             }
-        }
+        })
         mock_resp.raise_for_status = MagicMock()
         mock_req.return_value = mock_resp
 
@@ -154,10 +160,10 @@ class TestGetAccountInfo:
 
 
 class TestGetClosedTrades:
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_returns_closed(self, mock_req):
         mock_resp = MagicMock()
-        mock_resp.json.return_value = {
+        mock_resp.content = orjson.dumps({
             "trades": [
                 {
                     "id": "200",
@@ -170,7 +176,7 @@ class TestGetClosedTrades:
                     "closeTime": "2024-01-15T11:00:00Z",
                 }
             ]
-        }
+        })
         mock_resp.raise_for_status = MagicMock()
         mock_req.return_value = mock_resp
 
@@ -183,11 +189,11 @@ class TestGetClosedTrades:
 
 class TestRetryLogic:
     @patch("src.broker.oanda.time.sleep")
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_retry_on_connection_error(self, mock_req, mock_sleep):
         """Should retry on ConnectionError and succeed on second attempt."""
         mock_resp_ok = MagicMock()
-        mock_resp_ok.json.return_value = {"account": {"balance": "10000", "NAV": "10000"}}
+        mock_resp_ok.content = orjson.dumps({"account": {"balance": "10000", "NAV": "10000"}})
         mock_resp_ok.raise_for_status = MagicMock()
 
         mock_req.side_effect = [
@@ -202,7 +208,7 @@ class TestRetryLogic:
         mock_sleep.assert_called_once_with(1)  # 2^0 = 1
 
     @patch("src.broker.oanda.time.sleep")
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_retry_on_5xx(self, mock_req, mock_sleep):
         """Should retry on 5xx server errors."""
         mock_resp_500 = MagicMock()
@@ -211,7 +217,7 @@ class TestRetryLogic:
         mock_resp_500.raise_for_status.side_effect = http_err
 
         mock_resp_ok = MagicMock()
-        mock_resp_ok.json.return_value = {"account": {"balance": "10000", "NAV": "10000"}}
+        mock_resp_ok.content = orjson.dumps({"account": {"balance": "10000", "NAV": "10000"}})
         mock_resp_ok.raise_for_status = MagicMock()
 
         mock_req.side_effect = [mock_resp_500, mock_resp_ok]
@@ -222,7 +228,7 @@ class TestRetryLogic:
         assert mock_req.call_count == 2
 
     @patch("src.broker.oanda.time.sleep")
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_no_retry_on_4xx(self, mock_req, mock_sleep):
         """Should NOT retry on 4xx client errors."""
         mock_resp_401 = MagicMock()
@@ -239,7 +245,7 @@ class TestRetryLogic:
         mock_sleep.assert_not_called()
 
     @patch("src.broker.oanda.time.sleep")
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_max_retries_exhausted(self, mock_req, mock_sleep):
         """Should raise after exhausting max retries."""
         mock_req.side_effect = req_lib.exceptions.ConnectionError("Connection refused")
@@ -250,7 +256,7 @@ class TestRetryLogic:
         assert mock_req.call_count == 3  # default max_retries=3
 
     @patch("src.broker.oanda.time.sleep")
-    @patch("src.broker.oanda.requests.request")
+    @patch("src.broker.oanda.requests.Session.request")
     def test_place_order_catches_request_exception(self, mock_req, mock_sleep):
         """place_order should catch RequestException (not just HTTPError)."""
         mock_req.side_effect = req_lib.exceptions.ConnectionError("Connection refused")
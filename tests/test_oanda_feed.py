@@ -99,6 +99,42 @@ class TestGetHistorical:
         url_called = mock_get.call_args[0][0]
         assert "EUR_USD" in url_called
 
+    @patch("src.data.oanda_feed.requests.get")
+    def test_accepts_aware_datetimes(self, mock_get):
+        from datetime import datetime, timezone
+
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"candles": []}
+        mock_resp.raise_for_status = MagicMock()
+        mock_get.return_value = mock_resp
+
+        feed = _make_feed()
+        feed.get_historical(
+            "EURUSD=X", "1h",
+            datetime(2024, 1, 15, tzinfo=timezone.utc),
+            datetime(2024, 1, 16, 12, 30, tzinfo=timezone.utc),
+        )
+        params = mock_get.call_args[1]["params"]
+        assert params["from"] == "2024-01-15T00:00:00Z"
+        assert params["to"] == "2024-01-16T12:30:00Z"
+
+    @patch("src.data.oanda_feed.requests.get")
+    def test_batch_fetches_every_symbol(self, mock_get):
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"candles": []}
+        mock_resp.raise_for_status = MagicMock()
+        mock_get.return_value = mock_resp
+
+        feed = _make_feed()
+        frames = feed.get_historical_batch(
+            ["EURUSD=X", "GBPUSD=X", "USDJPY=X"], "1h", "2024-01-15", "2024-01-16",
+        )
+        assert list(frames) == ["EURUSD=X", "GBPUSD=X", "USDJPY=X"]
+        assert all(df.empty for df in frames.values())
+        urls = sorted(c[0][0] for c in mock_get.call_args_list)
+        assert len(urls) == 3
+        assert any("GBP_USD" in u for u in urls)
+
 
 class TestStreamPrices:
     @patch("src.data.oanda_feed.requests.get")
@@ -0,0 +1,163 @@
+"""Tests for the optimization toolkit."""
+
+import numpy as np
+import pytest
+
+from src.optimization import _mc_kernels, monte_carlo
+from src.optimization.monte_carlo import MonteCarlo
+
+
+class TestMonteCarlo:
+    def test_seeded_runs_are_reproducible(self):
+        pnls = np.array([120.0, -80.0, 45.0, -30.0, 200.0, -150.0])
+        a = MonteCarlo(pnls, n_simulations=500, seed=7).run()
+        b = MonteCarlo(pnls, n_simulations=500, seed=7).run()
+        assert a == b
+        assert a.n_simulations == 500
+        assert a.n_trades == 6
+
+    def test_batching_matches_single_draw(self, monkeypatch):
+        pnls = np.random.default_rng(1).normal(10, 100, 50)
+        whole = MonteCarlo(pnls, n_simulations=300, seed=3).run()
+        monkeypatch.setattr(monte_carlo, "_MAX_BATCH_ELEMENTS", 50 * 7)
+        batched = MonteCarlo(pnls, n_simulations=300, seed=3).run()
+        assert whole == batched
+
+    def test_winning_trades_have_no_drawdown(self):
+        result = MonteCarlo([10.0, 20.0, 30.0], n_simulations=200, seed=0).run()
+        assert result.max_drawdown_percentiles["p95"] == 0
+        assert result.probability_of_ruin == 0.0
+        assert result.return_percentiles["p5"] > 0
+
+    def test_ruin_probability(self):
+        result = MonteCarlo([-6000.0, -6000.0], n_simulations=100, seed=0).run()
+        assert result.probability_of_ruin == pytest.approx(1.0)
+
+    def test_too_few_trades(self):
+        result = MonteCarlo([5.0], n_simulations=10).run()
+        assert result.n_trades == 1
+        assert result.probability_of_ruin == 0.0
+
+
+class TestMcKernels:
+    @staticmethod
+    def _reference(row, capital):
+        equity = capital + np.cumsum(row)
+        peak = np.maximum.accumulate(equity)
+        std = row.std()
+        return (
+            (equity[-1] - capital) / capital * 100,
+            abs(((equity - peak) / peak).min()),
+            row.mean() / std if std > 0 else 0.0,
+        )
+
+    @pytest.mark.parametrize("kernel", [
+        _mc_kernels._mc_stats_numpy,
+        pytest.param(
+            getattr(_mc_kernels, "_mc_stats_jit", None),
+            marks=pytest.mark.skipif(not _mc_kernels.NUMBA_AVAILABLE, reason="numba not installed"),
+        ),
+    ])
+    def test_matches_per_row_reference(self, kernel):
+        sampled = np.random.default_rng(0).normal(5, 150, (40, 25))
+        sampled[0] = 10.0  # zero-variance row
+        returns, max_dd, sharpe = kernel(sampled, 10000.0)
+        for i, row in enumerate(sampled):
+            assert (returns[i], max_dd[i], sharpe[i]) == pytest.approx(self._reference(row, 10000.0))
+
+
+class TestGridSearch:
+    @pytest.fixture
+    def candles(self):
+        from src.data.demo_feed import _generate_synthetic
+        return _generate_synthetic("EURUSD=X", "2024-01-01", "2024-02-15", "h").reset_index()
+
+    def test_grid_periods_outside_defaults(self, candles):
+        from src.optimization.grid_search import GridSearch
+        from src.strategy.ema_crossover import EMACrossoverStrategy
+
+        grid = {
+            "fast_period": [5, 9], "slow_period": [15, 21],
+            "rsi_overbought": [70], "rsi_oversold": [30],
+            "atr_sl_mult": [1.5], "atr_tp_mult": [2.0],
+        }
+        results = GridSearch(EMACrossoverStrategy, grid, max_workers=1).run(candles)
+
+        assert len(results) == 4
+        assert [r.sharpe for r in results] == sorted((r.sharpe for r in results), reverse=True)
+        assert {r.params["fast_period"] for r in results} == {5, 9}
+
+
+class TestWalkForward:
+    @pytest.fixture
+    def candles(self):
+        from src.data.demo_feed import _generate_synthetic
+        return _generate_synthetic("EURUSD=X", "2024-01-01", "2024-04-01", "h").reset_index()
+
+    def test_shared_pool_matches_serial(self, candles):
+        from src.optimization.walk_forward import WalkForward
+        from src.strategy.ema_crossover import EMACrossoverStrategy
+
+        grid = {
+            "fast_period": [5, 9, 12], "slow_period": [15, 21],
+            "rsi_overbought": [70], "rsi_oversold": [30],
+            "atr_sl_mult": [1.5], "atr_tp_mult": [2.0],
+        }
+        serial = WalkForward(EMACrossoverStrategy, grid, n_splits=2, max_workers=1).run(candles)
+        pooled = WalkForward(EMACrossoverStrategy, grid, n_splits=2, max_workers=2).run(candles)
+
+        assert serial.splits
+        assert pooled == serial
+
+    def test_shared_pool_accepts_tz_aware_timestamps(self, candles):
+        from src.optimization.walk_forward import WalkForward
+        from src.strategy.ema_crossover import EMACrossoverStrategy
+
+        # Frames read back from the candles table carry UTC timestamps
+        candles["timestamp"] = candles["timestamp"].dt.tz_localize("UTC")
+        grid = {
+            "fast_period": [5, 9, 12], "slow_period": [15, 21],
+            "rsi_overbought": [70], "rsi_oversold": [30],
+            "atr_sl_mult": [1.5], "atr_tp_mult": [2.0],
+        }
+        serial = WalkForward(EMACrossoverStrategy, grid, n_splits=2, max_workers=1).run(candles)
+        pooled = WalkForward(EMACrossoverStrategy, grid, n_splits=2, max_workers=2).run(candles)
+
+        assert len(serial.splits) == 2
+        assert pooled == serial
+
+
+class TestSharedFrame:
+    def test_round_trip(self):
+        import pandas as pd
+        from src.optimization.shared_frame import attach_frame, release, share_frame
+
+        df = pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=4, freq="h"),
+            "close": [1.1, 1.2, 1.3, 1.4],
+            "volume": [1, 2, 3, 4],
+        })
+        specs, blocks = share_frame(df)
+        try:
+            view, _ = attach_frame(specs)
+            pd.testing.assert_frame_equal(view, df)
+            assert not view["close"].to_numpy().flags.writeable
+        finally:
+            release(blocks)
+
+    def test_round_trips_tz_aware_and_object_columns(self):
+        import pandas as pd
+        from src.optimization.shared_frame import attach_frame, release, share_frame
+
+        df = pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-01", periods=3, freq="h", tz="America/New_York"),
+            "symbol": ["EURUSD=X", "GBPUSD=X", "USDJPY=X"],
+            "close": [1.1, 1.2, 1.3],
+        })
+        specs, blocks = share_frame(df)
+        try:
+            assert [spec.shm_name == "" for spec in specs] == [False, True, False]
+            view, _ = attach_frame(specs)
+            pd.testing.assert_frame_equal(view, df)
+        finally:
+            release(blocks)
@@ -83,6 +83,14 @@ class TestClosePosition:
         assert not r.success
         assert "not found" in r.message
 
+    def test_closed_trades_limit_returns_most_recent(self, broker):
+        for price in (1.0860, 1.0870, 1.0880):
+            r = broker.place_order("EURUSD=X", OrderSide.BUY, 1.0, sl=1.0800, tp=1.0900)
+            broker.close_position(r.order_id, exit_price=price)
+        assert len(broker.get_closed_trades()) == 3
+        recent = broker.get_closed_trades(limit=2)
+        assert [t["exit_price"] for t in recent] == [1.0870, 1.0880]
+
 
 class TestGetPositions:
     def test_returns_dicts_with_required_keys(self, broker):
@@ -111,6 +119,12 @@ class TestAccountInfo:
         info = broker.get_account_info()
         assert info["total_pnl"] > 0
 
+    def test_short_pnl_matches_backtest_formula(self, broker):
+        r = broker.place_order("EURUSD=X", OrderSide.SELL, 0.5, sl=1.0900, tp=1.0800)
+        broker.close_position(r.order_id, exit_price=1.0811)
+        pnl = broker.get_closed_trades()[-1]["pnl"]
+        assert pnl == (1.0811 - r.price) * -1 * 0.5 / 0.0001
+
     def test_after_loss(self, broker):
         r = broker.place_order("EURUSD=X", OrderSide.BUY, 0.0001, sl=1.0800, tp=1.0900)
         entry = r.price
@@ -127,3 +141,12 @@ class TestRiskSizing:
         assert result.success
         assert result.volume > 0
         assert result.volume != 1.0  # not a fixed default
+
+
+class TestPriceUpdates:
+    def test_update_price_does_not_wait_for_lock(self, broker):
+        # Simulate an order or account call holding the lock on another thread
+        with broker._lock:
+            broker.update_price("EURUSD=X", bid=1.0860, ask=1.0862)
+        r = broker.place_order("EURUSD=X", OrderSide.BUY, 1.0, sl=1.0800, tp=1.0900)
+        assert r.price == pytest.approx(1.0862 + 0.5 * 0.0001, abs=1e-6)
@@ -0,0 +1,112 @@
+"""Tests for the cached settings snapshot."""
+
+import dataclasses
+import sys
+
+sys.path.insert(0, ".")
+
+import pytest
+
+from config import settings
+from config.settings import Settings, get_settings
+
+
+class TestSettings:
+    def test_get_settings_is_cached(self):
+        assert get_settings() is get_settings()
+
+    def test_settings_is_frozen(self):
+        s = get_settings()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            s.API_PORT = 1234
+
+    def test_module_attribute_proxies_snapshot(self):
+        assert settings.API_PORT == get_settings().API_PORT
+        assert settings.SYMBOLS is get_settings().SYMBOLS
+
+    def test_from_import_works(self):
+        from config.settings import DEFAULT_HISTORY_DAYS
+        assert DEFAULT_HISTORY_DAYS == get_settings().DEFAULT_HISTORY_DAYS
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            settings.DOES_NOT_EXIST
+
+    def test_env_read_once(self, monkeypatch):
+        get_settings.cache_clear()
+        try:
+            monkeypatch.setenv("API_PORT", "9001")
+            assert get_settings().API_PORT == 9001
+            monkeypatch.setenv("API_PORT", "9002")
+            assert get_settings().API_PORT == 9001
+        finally:
+            get_settings.cache_clear()
+
+    def test_dir_lists_fields(self):
+        names = dir(settings)
+        for f in dataclasses.fields(Settings):
+            assert f.name in names
+
+    def test_database_url_escapes_credentials(self, monkeypatch):
+        get_settings.cache_clear()
+        try:
+            monkeypatch.setenv("DB_PASSWORD", "p@ss:w/rd")
+            s = get_settings()
+            assert "p%40ss%3Aw%2Frd@" in s.DATABASE_URL
+            url = s.DATABASE_URL_OBJ
+            assert url.password == "p@ss:w/rd"
+            assert url.host == s.DB_HOST
+            assert url.port == int(s.DB_PORT)
+        finally:
+            get_settings.cache_clear()
+
+    def test_env_parsers(self, monkeypatch):
+        get_settings.cache_clear()
+        try:
+            monkeypatch.setenv("CORS_ORIGINS", "http://a,,http://b,")
+            monkeypatch.setenv("LLM_ENABLED", "YES")
+            monkeypatch.setenv("KELLY_FRACTION", "0.25")
+            s = get_settings()
+            assert s.CORS_ORIGINS == ("http://a", "http://b")
+            assert s.LLM_ENABLED is True
+            assert s.KELLY_FRACTION == 0.25
+        finally:
+            get_settings.cache_clear()
+
+
+class TestLookupStructures:
+    def test_pip_values_is_read_only(self):
+        with pytest.raises(TypeError):
+            settings.PIP_VALUES["EURUSD=X"] = 1.0
+
+    def test_correlation_groups_are_frozensets(self):
+        for keys in settings.CORRELATION_GROUPS.values():
+            assert isinstance(keys, frozenset)
+
+    def test_symbol_side_index_matches_groups(self):
+        for group, keys in settings.CORRELATION_GROUPS.items():
+            for key in keys:
+                assert settings.SYMBOL_SIDE_TO_GROUP[key] == group
+
+    def test_oanda_urls_resolved_for_environment(self):
+        assert settings.OANDA_BASE == settings.OANDA_BASE_URL[settings.OANDA_ENVIRONMENT]
+        assert settings.OANDA_STREAM == settings.OANDA_STREAM_URL[settings.OANDA_ENVIRONMENT]
+        with pytest.raises(TypeError):
+            settings.OANDA_SYMBOL_MAP["EURUSD=X"] = "X"
+
+    def test_symbols_are_interned_tuples(self):
+        assert isinstance(settings.SYMBOLS, tuple)
+        assert isinstance(settings.TIMEFRAMES, tuple)
+        for sym in settings.SYMBOLS:
+            assert sym is sys.intern("".join(sym))
+            assert any(k is sym for k in settings.PIP_VALUES)
+
+    def test_notify_settings_are_frozensets(self):
+        assert isinstance(settings.NOTIFY_EVENTS, frozenset)
+        assert isinstance(settings.NOTIFY_BACKENDS, frozenset)
+        assert "order_filled" in settings.NOTIFY_EVENTS
+
+    def test_costs_prescaled_by_pip_value(self):
+        for sym, pv in settings.PIP_VALUES.items():
+            assert settings.SPREAD_BY_SYMBOL[sym] == pytest.approx(settings.SPREAD_PIPS * pv)
+            assert settings.SLIPPAGE_BY_SYMBOL[sym] == pytest.approx(settings.SLIPPAGE_PIPS * pv)
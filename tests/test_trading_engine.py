@@ -267,3 +267,81 @@ class TestEngineLifecycle:
         engine._running.clear()
         result = engine.wait(timeout=0.1)
         assert result is True
+
+
+class TestCandlesJson:
+    def _make_engine(self):
+        from src.data.demo_feed import DemoFeed
+        from src.engine.trading import TradingEngine
+        from src.strategy.ema_crossover import EMACrossoverStrategy
+
+        return TradingEngine(
+            strategy=EMACrossoverStrategy(), feed=DemoFeed(), broker=PaperBroker(),
+            symbol="EURUSD=X", timeframe="1h",
+        )
+
+    def test_empty_history(self):
+        assert self._make_engine().candles_json(10) == b"[]"
+
+    def test_cached_until_next_bar(self):
+        import json
+
+        engine = self._make_engine()
+        engine._aggregator.seed_history(pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-15", periods=3, freq="h"),
+            "open": [1.0, 1.1, 1.2], "high": [1.1, 1.2, 1.3],
+            "low": [0.9, 1.0, 1.1], "close": [1.05, 1.15, 1.25],
+            "volume": [100, 200, 300],
+        }))
+        first = engine.candles_json(2)
+        assert engine.candles_json(2) is first
+        assert json.loads(first)[-1] == {
+            "timestamp": "2024-01-15 02:00:00", "open": 1.2, "high": 1.3,
+            "low": 1.1, "close": 1.25, "volume": 300.0,
+        }
+
+        engine._aggregator.on_tick(pd.Timestamp("2024-01-15 03:00:05"), 1.3, 1.3)
+        engine._aggregator.on_tick(pd.Timestamp("2024-01-15 04:00:05"), 1.4, 1.4)
+        refreshed = json.loads(engine.candles_json(2))
+        assert refreshed[-1]["timestamp"] == "2024-01-15 03:00:00"
+
+    def test_limits_past_history_share_one_entry(self):
+        engine = self._make_engine()
+        engine._aggregator.seed_history(pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-15", periods=3, freq="h"),
+            "open": [1.0, 1.1, 1.2], "high": [1.1, 1.2, 1.3],
+            "low": [0.9, 1.0, 1.1], "close": [1.05, 1.15, 1.25],
+            "volume": [100, 200, 300],
+        }))
+        for limit in range(1, 50):
+            engine.candles_json(limit)
+        assert engine._candles_cache[1] == 3
+        full = engine.candles_json(3)
+        assert engine.candles_json(5000) is full
+
+
+class TestIndicatorFrame:
+    def test_extends_incrementally_after_backfill(self, monkeypatch):
+        from src.data.demo_feed import DemoFeed, _generate_synthetic
+        from src.data.indicators import IndicatorState, add_all_indicators
+        from src.engine.trading import TradingEngine
+        from src.strategy.ema_crossover import EMACrossoverStrategy
+
+        candles = _generate_synthetic("EURUSD=X", "2024-01-01", "2024-02-15", "h").reset_index()
+        engine = TradingEngine(
+            strategy=EMACrossoverStrategy(), feed=DemoFeed(), broker=PaperBroker(),
+            symbol="EURUSD=X", timeframe="1h",
+        )
+        engine._indicator_frame(candles.iloc[:300])
+
+        backfills = []
+        original = IndicatorState.backfill
+        monkeypatch.setattr(IndicatorState, "backfill", lambda s, df: backfills.append(1) or original(s, df))
+        # Window slides by two bars, as the capped history does
+        frame = engine._indicator_frame(candles.iloc[2:302].reset_index(drop=True))
+
+        assert not backfills
+        assert len(frame) == 300
+        assert frame["timestamp"].iloc[-1] == candles["timestamp"].iloc[301]
+        expected = add_all_indicators(candles.iloc[:302]).iloc[2:].reset_index(drop=True)
+        pd.testing.assert_frame_equal(frame, expected[frame.columns], check_dtype=False, rtol=1e-9)
@@ -20,7 +20,12 @@ export function useWebSocket(onMessage: (msg: WsMessage) => void) {
     ws.onmessage = (e) => {
       try {
         const msg = JSON.parse(e.data) as WsMessage;
-        onMessage(msg);
+        // Bursts of engine events arrive coalesced into one frame
+        if (msg.type === 'batch') {
+          for (const event of msg.events ?? []) onMessage(event);
+        } else {
+          onMessage(msg);
+        }
       } catch (_err) {
         // ignore malformed messages
       }
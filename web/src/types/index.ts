@@ -55,4 +55,5 @@ export interface StrategyStatus {
 export interface WsMessage {
   type: string;
   data: any;
+  events?: WsMessage[];
 }